@@ -0,0 +1,69 @@
+"""Process-wide HTTP session shared by the PBOC, CFETS and SAFE providers."""
+
+from __future__ import annotations
+
+import socket
+from typing import Mapping
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+try:  # urllib3 only decodes brotli bodies when one of these is installed.
+    import brotli  # type: ignore  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependency
+    try:
+        import brotlicffi as brotli  # type: ignore  # noqa: F401
+    except ImportError:
+        brotli = None
+
+USER_AGENT = "AutoflowBot/1.0"
+ACCEPT_ENCODING = "gzip, deflate, br" if brotli is not None else "gzip, deflate"
+
+DEFAULT_HEADERS: Mapping[str, str] = {
+    "User-Agent": USER_AGENT,
+    "Accept": "text/html, */*",
+    "Accept-Encoding": ACCEPT_ENCODING,
+}
+
+NO_PROXIES: Mapping[str, None] = {"http": None, "https": None}
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTP adapter enabling TCP keep-alive on pooled sockets.
+
+    urllib3's defaults already disable Nagle (``TCP_NODELAY``).
+    """
+
+    SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):  # noqa: ANN002, ANN003 - requests signature
+        kwargs.setdefault("socket_options", self.SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
+
+def build_session() -> requests.Session:
+    """Create a session with the shared headers and keep-alive adapter mounted."""
+
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    session.trust_env = False
+    # Retries are handled by pbc_client._request; urllib3 must not add its own.
+    # read=False re-raises read timeouts as-is so requests reports ReadTimeout
+    # (which _request retries) rather than wrapping them in ConnectionError.
+    # The pool is sized for the PBOC -> CFETS -> SAFE cascade plus the key
+    # chart probe.
+    adapter = KeepAliveAdapter(
+        max_retries=Retry(total=0, read=False, redirect=None, backoff_factor=0),
+        pool_connections=16,
+        pool_maxsize=16,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+SESSION = build_session()
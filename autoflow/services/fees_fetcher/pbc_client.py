@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import hashlib
 import json
 import logging
@@ -10,7 +12,9 @@ import random
 import re
 import socket
 import ssl
+import threading
 import time
+from collections import OrderedDict
 from collections.abc import Iterator
 from dataclasses import dataclass, replace
 from decimal import Decimal
@@ -19,27 +23,49 @@ from urllib.parse import urljoin, urlparse, urlunparse
 
 import requests
 from bs4 import BeautifulSoup
-from requests.adapters import HTTPAdapter
 from requests.exceptions import SSLError, Timeout
 
-from . import tls_diag
+from . import _http, tls_diag
+
+try:  # httpx is optional; HTTP/2 directory prefetch is disabled when absent.
+    import httpx  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
 
 LOGGER = logging.getLogger(__name__)
 
-USER_AGENT = "AutoflowBot/1.0"
+USER_AGENT = _http.USER_AGENT
 PAGE_DELAY_SECONDS = 0.5
 FAILURE_STOP_THRESHOLD = 2
+HTTP2_PREFETCH_ENV_VAR = "PBC_HTTP2_PREFETCH"
+HTTP2_MAX_CONNECTIONS = 4
+# Directory pages fetched alongside the current one; the date-bounded walk
+# usually stops within a page or two, so a longer window is wasted requests.
+HTTP2_PREFETCH_AHEAD = 2
+FINGERPRINT_WAIT_SECONDS = 1.5
+ARTICLE_CACHE_SIZE = 256
+DIRECTORY_CACHE_SIZE = 64
+# Listing pages gain an entry each business day; articles never change.
+DIRECTORY_CACHE_TTL_SECONDS = 10 * 60
 
 INDEX_ROOT = "https://www.pbc.gov.cn/zhengcehuobisi/125207/125213/125440/17105/"
 KEYCHART_URL = "https://www.pbc.gov.cn/zhengcehuobisi/125207/125213/125440/4385116/index.html"
 
 DATE_PATTERN = re.compile(r"(\d{4})年(\d{1,2})月(\d{1,2})日")
 RATE_PATTERN = re.compile(r"1美元对人民币(?P<val>\d+(?:\.\d+)?)元")
+LISTING_DATE_PATTERN = re.compile(r"(?<!\d)(\d{4})-(\d{1,2})-(\d{1,2})(?!\d)")
+
+# RATE_PATTERN guarantees a plain decimal literal and quotes repeat across
+# articles, so constructed values are memoised.
+_to_decimal = functools.lru_cache(maxsize=512)(Decimal)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RequestConfig:
-    """Runtime configuration for outbound HTTP requests."""
+    """Runtime configuration for outbound HTTP requests.
+
+    Instances are immutable; :func:`configure_requests` swaps in a new one.
+    """
 
     connect_timeout: float = 5.0
     read_timeout: float = 8.0
@@ -50,9 +76,12 @@ class RequestConfig:
     ip_family: str = "auto"
 
 
-@dataclass
+@dataclass(slots=True)
 class FetchMetrics:
-    """Telemetry captured during scraping."""
+    """Telemetry captured during scraping.
+
+    Counters are mutated in place, so :func:`get_metrics` still snapshots.
+    """
 
     request_attempts: int = 0
     request_successes: int = 0
@@ -70,25 +99,19 @@ class FetchMetrics:
 
 
 DEFAULT_CONFIG = RequestConfig()
-REQUEST_CONFIG = replace(DEFAULT_CONFIG)
-
-_SESSION = requests.Session()
-_SESSION.headers.update(
-    {
-        "User-Agent": USER_AGENT,
-        "Accept": "text/html, */*",
-        "Accept-Encoding": "gzip, deflate, br",
-        "Connection": "close",
-    }
-)
-_SESSION.trust_env = False
-_ADAPTER = HTTPAdapter(max_retries=0, pool_connections=4, pool_maxsize=4)
-_SESSION.mount("http://", _ADAPTER)
-_SESSION.mount("https://", _ADAPTER)
+REQUEST_CONFIG = DEFAULT_CONFIG
+
+# Providers share one pooled session; CFETS and SAFE reach it via _request.
+_SESSION = _http.SESSION
+_NO_PROXIES = _http.NO_PROXIES
 
 _METRICS = FetchMetrics()
 _CURRENT_DEADLINE_END: float | None = None
 _DIAG_EMITTED = False
+# Bounded LRUs shared across request cycles, so consecutive dates reuse the
+# listing pages and articles they have in common.
+_ARTICLE_CACHE: OrderedDict[str, tuple[str, Optional[Decimal]]] = OrderedDict()
+_DIRECTORY_CACHE: OrderedDict[str, tuple[float, str]] = OrderedDict()
 
 
 class PBOCClientError(RuntimeError):
@@ -113,6 +136,14 @@ def reset_metrics() -> None:
 
     global _METRICS
     _METRICS = FetchMetrics()
+    clear_page_caches()
+
+
+def clear_page_caches() -> None:
+    """Drop cached directory listings and parsed articles."""
+
+    _ARTICLE_CACHE.clear()
+    _DIRECTORY_CACHE.clear()
 
 
 def get_metrics() -> FetchMetrics:
@@ -131,29 +162,30 @@ def configure_requests(
     """Update runtime request configuration."""
 
     global REQUEST_CONFIG
-    cfg = REQUEST_CONFIG
+    changes: dict[str, object] = {}
     if connect_timeout is not None:
-        cfg = replace(cfg, connect_timeout=connect_timeout)
+        changes["connect_timeout"] = connect_timeout
     if read_timeout is not None:
-        cfg = replace(cfg, read_timeout=read_timeout)
+        changes["read_timeout"] = read_timeout
     if total_deadline is not None:
-        cfg = replace(cfg, total_deadline=total_deadline)
+        changes["total_deadline"] = total_deadline
     if ip_family is not None:
-        cfg = replace(cfg, ip_family=ip_family)
-    REQUEST_CONFIG = cfg
+        changes["ip_family"] = ip_family
+    if changes:
+        REQUEST_CONFIG = replace(REQUEST_CONFIG, **changes)
 
 
 def reset_request_config() -> None:
     """Restore the default request configuration."""
 
     global REQUEST_CONFIG
-    REQUEST_CONFIG = replace(DEFAULT_CONFIG)
+    REQUEST_CONFIG = DEFAULT_CONFIG
 
 
 def get_request_config() -> RequestConfig:
-    """Return the current request configuration."""
+    """Return the current (immutable) request configuration."""
 
-    return replace(REQUEST_CONFIG)
+    return REQUEST_CONFIG
 
 
 def begin_request_cycle(total_deadline: float | None) -> None:
@@ -186,6 +218,27 @@ def _list_page_candidates(page: int) -> list[str]:
     return [f"index{number}.html", f"index_{number}.html"]
 
 
+_PAGE_URL_TABLE_SIZE = 64
+_PAGE_URL_TABLE: tuple[tuple[str, ...], ...] = tuple(
+    tuple(urljoin(INDEX_ROOT, suffix) for suffix in _list_page_candidates(page))
+    for page in range(_PAGE_URL_TABLE_SIZE)
+)
+
+
+def _page_urls(page: int) -> tuple[str, ...]:
+    if page < _PAGE_URL_TABLE_SIZE:
+        return _PAGE_URL_TABLE[page]
+    return tuple(urljoin(INDEX_ROOT, suffix) for suffix in _list_page_candidates(page))
+
+
+def _record_dns(host: str) -> None:
+    cfg = REQUEST_CONFIG
+    _, _, count_v4, count_v6 = tls_diag.resolve_ips_count_first(host, cfg.ip_family)
+    _METRICS.dns_a_count = count_v4
+    _METRICS.dns_aaaa_count = count_v6
+    _METRICS.ip_family_used = cfg.ip_family
+
+
 def _resolve_for_host(host: str) -> tuple[list[str], list[str]]:
     cfg = REQUEST_CONFIG
     ipv4, ipv6 = tls_diag.resolve_ips(host, cfg.ip_family)
@@ -226,65 +279,80 @@ def _request(
     last_exc: Exception | None = None
     parsed = urlparse(url)
     host = parsed.hostname or ""
-    ipv4, ipv6 = _resolve_for_host(host) if host else ([], [])
-
+    if host:
+        _record_dns(host)
+
+    debug_enabled = LOGGER.isEnabledFor(logging.DEBUG)
+    monotonic = time.monotonic
+    # Resolve the dispatcher once per call; tests may swap ``_SESSION`` for a
+    # stub that only provides ``get``.
+    session = _SESSION
+    session_request = getattr(session, "request", None)
+    if not callable(session_request):
+        session_request = None
     with tls_diag.ip_family_guard(cfg.ip_family):
         for attempt in range(1, attempts + 1):
-            remaining = _remaining_deadline(deadline_end)
-            if remaining is not None and remaining <= 0:
-                _METRICS.deadline_exceeded += 1
-                raise FetchTimeout(f"deadline exceeded before requesting {url}")
-
-            timeout_connect = connect_timeout if remaining is None else min(connect_timeout, remaining)
-            timeout_read = read_timeout if remaining is None else min(read_timeout, remaining)
-            if remaining is not None and (timeout_connect <= 0 or timeout_read <= 0):
-                _METRICS.deadline_exceeded += 1
-                raise FetchTimeout(f"deadline exceeded before requesting {url}")
-
-            timeout = (timeout_connect, timeout_read)
-            attempt_start = time.monotonic()
+            attempt_start = monotonic()
+            if deadline_end is None:
+                remaining = None
+                timeout = (connect_timeout, read_timeout)
+            else:
+                # Both timeouts are clamped to the remaining budget, so a
+                # single check covers the connect and read guards.
+                remaining = deadline_end - attempt_start
+                if remaining <= 0:
+                    _METRICS.deadline_exceeded += 1
+                    raise FetchTimeout(f"deadline exceeded before requesting {url}")
+                timeout = (
+                    connect_timeout if connect_timeout < remaining else remaining,
+                    read_timeout if read_timeout < remaining else remaining,
+                )
+
             _METRICS.request_attempts += 1
-            LOGGER.debug(
-                "Attempt %s -> %s %s (connect=%.2fs read=%.2fs remaining=%s)",
-                attempt,
-                url,
-                method,
-                timeout_connect,
-                timeout_read,
-                f"{remaining:.2f}" if remaining is not None else "None",
-            )
+            if debug_enabled:
+                LOGGER.debug(
+                    "Attempt %s -> %s %s (connect=%.2fs read=%.2fs remaining=%s)",
+                    attempt,
+                    url,
+                    method,
+                    timeout[0],
+                    timeout[1],
+                    f"{remaining:.2f}" if remaining is not None else "None",
+                )
             try:
-                session_request = getattr(_SESSION, "request", None)
-                if callable(session_request):
+                if session_request is not None:
                     response = session_request(
                         method,
                         url,
                         timeout=timeout,
-                        proxies={"http": None, "https": None},
+                        proxies=_NO_PROXIES,
                         params=params,
                         data=data,
                     )
                 else:
-                    response = _SESSION.get(  # type: ignore[attr-defined]
+                    response = session.get(  # type: ignore[attr-defined]
                         url,
                         timeout=timeout,
-                        proxies={"http": None, "https": None},
+                        proxies=_NO_PROXIES,
                     )
                 response.raise_for_status()
                 response.encoding = response.apparent_encoding or "utf-8"
                 _METRICS.request_successes += 1
-                LOGGER.debug(
-                    "Attempt %s succeeded in %.2fs for %s",
-                    attempt,
-                    time.monotonic() - attempt_start,
-                    url,
-                )
+                if debug_enabled:
+                    LOGGER.debug(
+                        "Attempt %s succeeded in %.2fs for %s",
+                        attempt,
+                        monotonic() - attempt_start,
+                        url,
+                    )
                 return response
             except SSLError as exc:
                 last_exc = exc
                 _METRICS.request_failures += 1
                 LOGGER.warning("TLS error on %s: %s", url, exc)
                 if _is_hostname_mismatch(exc):
+                    # Full address lists are only needed for diagnostics.
+                    ipv4, ipv6 = _resolve_for_host(host) if host else ([], [])
                     diag_info: dict[str, object] | None = None
                     if not _DIAG_EMITTED:
                         try:
@@ -297,19 +365,21 @@ def _request(
                             url = alt
                             parsed = urlparse(url)
                             host = parsed.hostname or host
-                            ipv4, ipv6 = _resolve_for_host(host) if host else ([], [])
+                            if host:
+                                _record_dns(host)
                             continue
                     raise CertHostnameMismatch(host, diag_info or _build_basic_diag(host, ipv4, ipv6)) from exc
                 raise
             except Timeout as exc:
                 last_exc = exc
                 _METRICS.request_failures += 1
-                LOGGER.debug(
-                    "Attempt %s timeout after %.2fs for %s",
-                    attempt,
-                    time.monotonic() - attempt_start,
-                    url,
-                )
+                if debug_enabled:
+                    LOGGER.debug(
+                        "Attempt %s timeout after %.2fs for %s",
+                        attempt,
+                        monotonic() - attempt_start,
+                        url,
+                    )
             except requests.RequestException as exc:
                 last_exc = exc
                 _METRICS.request_failures += 1
@@ -318,9 +388,10 @@ def _request(
 
             if attempt < attempts:
                 sleep_time = backoff_base * (2 ** (attempt - 1)) + random.uniform(0, jitter)
-                remaining = _remaining_deadline(deadline_end)
-                if remaining is not None:
-                    sleep_time = min(sleep_time, remaining)
+                if deadline_end is not None:
+                    remaining = deadline_end - monotonic()
+                    if remaining < sleep_time:
+                        sleep_time = remaining
                 if sleep_time > 0:
                     time.sleep(sleep_time)
 
@@ -364,7 +435,7 @@ def _handle_hostname_mismatch(
     fingerprint = _extract_fingerprint(diag_info)
     strict_mode = os.getenv("PBC_STRICT_TLS", "1") != "0"
     if not strict_mode and not fingerprint and candidate_ip:
-        fingerprint = _compute_cert_sha256(host, candidate_ip)
+        fingerprint = _compute_cert_sha256_bounded(host, candidate_ip)
         if fingerprint:
             diag_info["cert_sha256"] = fingerprint
     if "cert_sha256" not in diag_info:
@@ -418,6 +489,29 @@ def _compute_cert_sha256(host: str, ip: str, timeout: float = 3.0) -> str | None
     return hashlib.sha256(cert_bytes).hexdigest().upper()
 
 
+def _compute_cert_sha256_bounded(
+    host: str, ip: str, wait: float = FINGERPRINT_WAIT_SECONDS
+) -> str | None:
+    """Run the fingerprint handshake on a daemon thread, giving up after *wait*.
+
+    The request is already failing at this point, so a slow second handshake
+    must not hold the caller for the full socket timeout.
+    """
+
+    result: list[str | None] = []
+    worker = threading.Thread(
+        target=lambda: result.append(_compute_cert_sha256(host, ip)),
+        name="pbc-cert-fingerprint",
+        daemon=True,
+    )
+    worker.start()
+    worker.join(wait)
+    if not result:
+        LOGGER.debug("Certificate fingerprint for %s (%s) not ready after %.1fs", host, ip, wait)
+        return None
+    return result[0]
+
+
 def _parse_allowed_fingerprints() -> set[str]:
     raw = os.getenv("PBC_ALLOWED_CERT_FINGERPRINTS", "")
     tokens = [token.strip() for token in raw.split(",") if token.strip()]
@@ -462,19 +556,130 @@ def _build_basic_diag(host: str, ipv4: list[str], ipv6: list[str]) -> dict[str,
     }
 
 
-def iter_article_urls(max_pages: int = 15) -> Iterator[str]:
-    """Yield candidate article URLs that mention the central parity announcement."""
+def iter_article_urls(max_pages: int = 15, target_date: str | None = None) -> Iterator[str]:
+    """Yield candidate article URLs that mention the central parity announcement.
+
+    When ``target_date`` (ISO format) is given, the listing dates rendered on
+    each directory page bound the scan: pages entirely newer than the target
+    are skipped without parsing, and the scan stops once a page is entirely
+    older than the target, since PBOC lists announcements newest first.
+
+    Directory pages are cached by URL for ``DIRECTORY_CACHE_TTL_SECONDS``, so
+    lookups for neighbouring dates rescan the shared pages without re-fetching.
+    """
+
+    yield from _scan_article_urls(max_pages, target_date)
+
+
+def _cached_directory_page(url: str) -> str | None:
+    cached = _DIRECTORY_CACHE.get(url)
+    if cached is None:
+        return None
+    if time.monotonic() - cached[0] >= DIRECTORY_CACHE_TTL_SECONDS:
+        del _DIRECTORY_CACHE[url]
+        return None
+    _DIRECTORY_CACHE.move_to_end(url)
+    return cached[1]
+
+
+def _store_directory_page(url: str, html: str) -> None:
+    _DIRECTORY_CACHE[url] = (time.monotonic(), html)
+    _DIRECTORY_CACHE.move_to_end(url)
+    if len(_DIRECTORY_CACHE) > DIRECTORY_CACHE_SIZE:
+        _DIRECTORY_CACHE.popitem(last=False)
+
+
+def _listing_date_bounds(html: str) -> tuple[str, str] | None:
+    dates = [
+        f"{int(year):04d}-{int(month):02d}-{int(day):02d}"
+        for year, month, day in LISTING_DATE_PATTERN.findall(html)
+    ]
+    if not dates:
+        return None
+    return min(dates), max(dates)
+
+
+def _prefetch_directory_pages(pages: range, underscored: bool) -> dict[str, str]:
+    """Fetch the given directory pages concurrently over HTTP/2 when enabled.
+
+    Only one URL per page is requested, in the ``index_N`` or ``indexN`` style
+    that served the previous page. Opt-in via ``PBC_HTTP2_PREFETCH=1`` and
+    requires ``httpx`` with HTTP/2 support. Any failure returns an empty
+    mapping so the sequential scan (with its TLS diagnostics) takes over.
+    """
+
+    if httpx is None or os.getenv(HTTP2_PREFETCH_ENV_VAR, "0") != "1":
+        return {}
+    urls = [_likely_page_url(page, underscored) for page in pages]
+    urls = [url for url in urls if _cached_directory_page(url) is None]
+    if not urls:
+        return {}
+    try:
+        return asyncio.run(_fetch_pages_http2(urls))
+    except Exception as exc:  # pragma: no cover - best effort prefetch
+        LOGGER.debug("HTTP/2 directory prefetch failed: %s", exc)
+        return {}
+
+
+def _is_underscored(url: str) -> bool:
+    return url.rsplit("/", 1)[-1].startswith("index_")
 
+
+def _likely_page_url(page: int, underscored: bool) -> str:
+    candidates = _page_urls(page)
+    for url in candidates:
+        if _is_underscored(url) == underscored:
+            return url
+    return candidates[0]
+
+
+async def _fetch_pages_http2(urls: list[str]) -> dict[str, str]:
+    cfg = REQUEST_CONFIG
+    remaining = _remaining_deadline(_CURRENT_DEADLINE_END)
+    timeout = httpx.Timeout(cfg.read_timeout, connect=cfg.connect_timeout)
+    limits = httpx.Limits(max_connections=HTTP2_MAX_CONNECTIONS)
+    headers = {"User-Agent": USER_AGENT, "Accept": "text/html, */*"}
+    async with httpx.AsyncClient(
+        http2=True, headers=headers, timeout=timeout, limits=limits, trust_env=False
+    ) as client:
+        responses = await asyncio.wait_for(
+            asyncio.gather(*(client.get(url) for url in urls), return_exceptions=True),
+            timeout=remaining,
+        )
+    pages: dict[str, str] = {}
+    for url, response in zip(urls, responses):
+        if isinstance(response, httpx.Response) and response.status_code == 200 and response.text:
+            pages[url] = response.text
+    LOGGER.debug("HTTP/2 prefetched %s/%s directory pages", len(pages), len(urls))
+    return pages
+
+
+def _scan_article_urls(max_pages: int, target_date: str | None) -> Iterator[str]:
     seen: set[str] = set()
     consecutive_failures = 0
     deadline_end = _CURRENT_DEADLINE_END
+    prefetched: dict[str, str] = {}
+    underscored = False
 
     for page in range(max_pages):
         html: str | None = None
         source_url: str | None = None
-        candidates = [urljoin(INDEX_ROOT, suffix) for suffix in _list_page_candidates(page)]
+        fetched = False
+        candidates = _page_urls(page)
+        if not any(url in prefetched or url in _DIRECTORY_CACHE for url in candidates):
+            # Fetch this page and the next few together; the walk below still decides
+            # when to stop, so at most HTTP2_PREFETCH_AHEAD pages go unused.
+            window = range(page, min(page + 1 + HTTP2_PREFETCH_AHEAD, max_pages))
+            prefetched.update(_prefetch_directory_pages(window, underscored))
 
         for candidate in candidates:
+            html = _cached_directory_page(candidate)
+            if html is None and candidate in prefetched:
+                html = prefetched.pop(candidate)
+                _store_directory_page(candidate, html)
+            if html is not None:
+                source_url = candidate
+                break
             try:
                 response = _request(candidate)
             except CertHostnameMismatch:
@@ -486,6 +691,9 @@ def iter_article_urls(max_pages: int = 15) -> Iterator[str]:
                 continue
             html = response.text
             source_url = candidate
+            fetched = True
+            if html:
+                _store_directory_page(candidate, html)
             break
 
         if not html or not source_url:
@@ -500,6 +708,29 @@ def iter_article_urls(max_pages: int = 15) -> Iterator[str]:
             continue
 
         consecutive_failures = 0
+        underscored = _is_underscored(source_url)
+        bounds = _listing_date_bounds(html) if target_date else None
+        if bounds is not None:
+            earliest, latest = bounds
+            if target_date > latest:
+                LOGGER.debug(
+                    "Directory page %s newest entry %s predates %s; stopping scan",
+                    page,
+                    latest,
+                    target_date,
+                )
+                break
+            if target_date < earliest:
+                LOGGER.debug(
+                    "Directory page %s oldest entry %s postdates %s; skipping",
+                    page,
+                    earliest,
+                    target_date,
+                )
+                if fetched:
+                    _sleep_between_pages(deadline_end)
+                continue
+
         soup = BeautifulSoup(html, "html.parser")
         for anchor in soup.select("a"):
             text = anchor.get_text(strip=True)
@@ -514,15 +745,35 @@ def iter_article_urls(max_pages: int = 15) -> Iterator[str]:
             seen.add(article_url)
             yield article_url
 
-        remaining = _remaining_deadline(deadline_end)
-        delay = PAGE_DELAY_SECONDS if remaining is None else min(PAGE_DELAY_SECONDS, remaining)
-        if delay > 0:
-            time.sleep(delay)
+        if fetched:
+            _sleep_between_pages(deadline_end)
+
+
+def _sleep_between_pages(deadline_end: float | None) -> None:
+    remaining = _remaining_deadline(deadline_end)
+    delay = PAGE_DELAY_SECONDS if remaining is None else min(PAGE_DELAY_SECONDS, remaining)
+    if delay > 0:
+        time.sleep(delay)
 
 
 def parse_article(url: str) -> tuple[str, Optional[Decimal]]:
-    """Return the ISO date and USD/CNY midpoint parsed from an announcement article."""
+    """Return the ISO date and USD/CNY midpoint parsed from an announcement article.
+
+    Results are memoised by URL in a bounded LRU shared across request cycles.
+    """
+
+    cached = _ARTICLE_CACHE.get(url)
+    if cached is not None:
+        _ARTICLE_CACHE.move_to_end(url)
+        return cached
+    result = _parse_article_uncached(url)
+    _ARTICLE_CACHE[url] = result
+    if len(_ARTICLE_CACHE) > ARTICLE_CACHE_SIZE:
+        _ARTICLE_CACHE.popitem(last=False)
+    return result
+
 
+def _parse_article_uncached(url: str) -> tuple[str, Optional[Decimal]]:
     response = _request(url)
     soup = BeautifulSoup(response.text, "html.parser")
     body_text = soup.get_text("，", strip=True)
@@ -537,7 +788,7 @@ def parse_article(url: str) -> tuple[str, Optional[Decimal]]:
     if not rate_match:
         return date_iso, None
 
-    rate_val = Decimal(rate_match.group("val"))
+    rate_val = _to_decimal(rate_match.group("val"))
     return date_iso, rate_val
 
 
@@ -567,5 +818,5 @@ def probe_keychart(date: str) -> Optional[Decimal]:
             for cell in cells[1:]:
                 match = RATE_PATTERN.search(cell)
                 if match:
-                    return Decimal(match.group("val"))
+                    return _to_decimal(match.group("val"))
     return None
@@ -46,7 +46,7 @@ def fetch_pbc_midpoint(
         pbc_client.begin_request_cycle(config.total_deadline)
     try:
         try:
-            for article_url in pbc_client.iter_article_urls(max_pages):
+            for article_url in pbc_client.iter_article_urls(max_pages, target_date=target_date):
                 try:
                     article_date, maybe_rate = pbc_client.parse_article(article_url)
                 except pbc_client.CertHostnameMismatch as exc:
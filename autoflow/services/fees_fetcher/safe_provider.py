@@ -2,18 +2,33 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
 import re
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date as date_cls, timedelta
 from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from itertools import islice
 from pathlib import Path
-from typing import Iterable
+from typing import Callable, Iterable
 
 from bs4 import BeautifulSoup
 
 from . import pbc_client
 
+try:  # lxml is optional; fall back to BeautifulSoup's stdlib parser when absent.
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:  # pragma: no cover - optional dependency
+    etree = None
+    lxml_html = None
+    HTML_PARSER = "html.parser"
+else:
+    HTML_PARSER = "lxml"
+
 LOGGER = logging.getLogger(__name__)
 
 PORTAL_URL = "https://www.safe.gov.cn/AppStructured/hlw/RMBQuery.do"
@@ -22,32 +37,124 @@ DATE_HEADER_KEYWORDS = ("日期",)
 USD_HEADER_KEYWORDS = ("美元", "usd")
 SNAPSHOT_SIZE_LIMIT = 200_000
 SNAPSHOT_ENV_VAR = "SAFE_SNAPSHOT_DIR"
+PORTAL_CACHE_TTL_SECONDS = 15 * 60
+PARSED_TABLE_CACHE_SIZE = 32
+PER_100_TEXT_MARKERS = ("每100", "100美元")
 DEFAULT_SNAPSHOT_DIR = Path(__file__).resolve().parents[3] / "snap"
 
+_ROW_DATE_FALLBACK_RE = re.compile(r"(\d{4})\D+(\d{1,2})\D+(\d{1,2})")
+_ISO_TRANSLATE = str.maketrans({"/": "-"})
+_PER_100_RATE_FLOOR = Decimal("50")
+_HUNDRED = Decimal(100)
+_QUANT_4 = Decimal("0.0001")
+
+# (window_start, window_end) -> (fetched_at monotonic, adjusted rates by date)
+_PORTAL_CACHE: dict[tuple[date_cls, date_cls], tuple[float, dict[date_cls, Decimal]]] = {}
+_PARSED_TABLE_CACHE: OrderedDict[bytes, dict[date_cls, Decimal]] = OrderedDict()
+_SNAPSHOT_EXECUTOR: ThreadPoolExecutor | None = None
+
+if lxml_html is not None:
+    _LXML_PARSER = lxml_html.HTMLParser(encoding="utf-8")
+    _INFO_TABLE_XPATH = etree.XPath("//table[@id='InfoTable']")
+    _ROW_XPATH = etree.XPath(".//tr")
+    _CELL_XPATH = etree.XPath("./td|./th")
+
 
 def get_usd_cny_midpoint_from_portal(
     sess, target_date: str
 ) -> tuple[Decimal, str, str]:  # noqa: D401 - signature defined by specification
     """Return USD/CNY midpoint published on SAFE portal."""
 
+    # Requests go through pbc_client._request, which owns the pooled session
+    # and applies the IP family guard, so the POST-then-GET fallback and
+    # successive windows reuse one TLS connection.
     del sess
     target_iso = _parse_iso_date(target_date)
     window_start, window_end = _build_query_window(target_iso)
 
+    adjusted_rows = _load_window_rates(window_start, window_end, target_date)
+
+    chosen_date = _select_forward_date(adjusted_rows.keys(), window_start, window_end)
+    if chosen_date is None:
+        LOGGER.info(
+            "SAFE forward probing: %s..%s -> miss",
+            window_start.isoformat(),
+            window_end.isoformat(),
+        )
+        raise LookupError(f"SAFE portal missing rate for {target_date}")
+
+    rate = adjusted_rows[chosen_date]
+    LOGGER.info(
+        "SAFE forward probing: %s..%s -> hit %s rate=%s",
+        window_start.isoformat(),
+        window_end.isoformat(),
+        chosen_date.isoformat(),
+        rate,
+    )
+
+    return rate, chosen_date.isoformat(), "safe_portal"
+
+
+def clear_portal_cache() -> None:
+    """Drop cached SAFE portal rates."""
+
+    _PORTAL_CACHE.clear()
+    _PARSED_TABLE_CACHE.clear()
+
+
+def _load_window_rates(
+    window_start: date_cls, window_end: date_cls, target_date: str
+) -> dict[date_cls, Decimal]:
+    """Fetch and parse the portal rates for a query window, reusing recent results.
+
+    Every target date in a month maps to the same window, so a batch of
+    lookups shares one request and one parse while the entry is fresh.
+    """
+
+    key = (window_start, window_end)
+    cached = _PORTAL_CACHE.get(key)
+    if cached is not None and time.monotonic() - cached[0] < PORTAL_CACHE_TTL_SECONDS:
+        LOGGER.debug("SAFE portal cache hit for %s..%s", window_start, window_end)
+        return cached[1]
+
     form_payload = {
         "startDate": window_start.isoformat(),
         "endDate": window_end.isoformat(),
     }
 
     html = _fetch_portal_html(form_payload, target_date)
-    _persist_snapshot(html, window_start)
+    _persist_snapshot(html, window_start, window_end)
 
-    soup = BeautifulSoup(html, "html.parser")
-    table = soup.find("table", {"id": "InfoTable"})
-    if not table:
+    adjusted_rows = _parse_rates_cached(html)
+    _PORTAL_CACHE[key] = (time.monotonic(), adjusted_rows)
+    return adjusted_rows
+
+
+def _parse_rates_cached(html: str) -> dict[date_cls, Decimal]:
+    """Parse *html* into adjusted rates, reusing the result for an identical body.
+
+    Windows refetched after the portal cache expires usually return the
+    same page, so keying on the body digest skips the HTML parse.
+    """
+
+    digest = hashlib.blake2b(html.encode("utf-8"), digest_size=16).digest()
+    cached = _PARSED_TABLE_CACHE.get(digest)
+    if cached is not None:
+        _PARSED_TABLE_CACHE.move_to_end(digest)
+        return cached
+    rates = _parse_window_rates(html)
+    _PARSED_TABLE_CACHE[digest] = rates
+    if len(_PARSED_TABLE_CACHE) > PARSED_TABLE_CACHE_SIZE:
+        _PARSED_TABLE_CACHE.popitem(last=False)
+    return rates
+
+
+def _parse_window_rates(html: str) -> dict[date_cls, Decimal]:
+    table_rows, document_text = _read_info_table(html)
+    if table_rows is None:
         raise LookupError("SAFE portal missing InfoTable")
 
-    header_cells = _extract_header_cells(table)
+    header_cells = _extract_header_cells(table_rows)
     if not header_cells:
         raise LookupError("SAFE portal table missing header")
 
@@ -58,7 +165,7 @@ def get_usd_cny_midpoint_from_portal(
     if usd_idx is None:
         raise LookupError("SAFE portal header lacks USD column")
 
-    raw_rows = _collect_rows(table)
+    raw_rows = _collect_rows(table_rows)
     if not raw_rows:
         raise LookupError("SAFE portal contained no data rows")
 
@@ -84,32 +191,21 @@ def get_usd_cny_midpoint_from_portal(
     if not parsed_rows:
         raise LookupError("SAFE portal contained no USD rows")
 
-    per_100 = _detect_per_100(header_cells[usd_idx], (row[1] for row in parsed_rows), soup)
-
-    adjusted_rows: dict[date_cls, Decimal] = {}
-    for row_date, raw_rate, _ in parsed_rows:
-        adjusted = raw_rate / Decimal("100") if per_100 else raw_rate
-        adjusted_rows[row_date] = adjusted.quantize(Decimal("0.0001"), ROUND_HALF_UP)
-
-    chosen_date = _select_forward_date(adjusted_rows.keys(), window_start, window_end)
-    if chosen_date is None:
-        LOGGER.info(
-            "SAFE forward probing: %s..%s -> miss",
-            window_start.isoformat(),
-            window_end.isoformat(),
-        )
-        raise LookupError(f"SAFE portal missing rate for {target_date}")
-
-    rate = adjusted_rows[chosen_date]
-    LOGGER.info(
-        "SAFE forward probing: %s..%s -> hit %s rate=%s",
-        window_start.isoformat(),
-        window_end.isoformat(),
-        chosen_date.isoformat(),
-        rate,
+    per_100 = _detect_per_100(
+        header_cells[usd_idx], (row[1] for row in parsed_rows), document_text
     )
 
-    return rate, chosen_date.isoformat(), "safe_portal"
+    if per_100:
+        adjusted_rows = {
+            row_date: (raw_rate / _HUNDRED).quantize(_QUANT_4, ROUND_HALF_UP)
+            for row_date, raw_rate, _ in parsed_rows
+        }
+    else:
+        adjusted_rows = {
+            row_date: raw_rate.quantize(_QUANT_4, ROUND_HALF_UP)
+            for row_date, raw_rate, _ in parsed_rows
+        }
+    return adjusted_rows
 
 
 def _fetch_portal_html(payload: dict[str, str], target_date: str) -> str:
@@ -136,12 +232,36 @@ def _fetch_portal_html(payload: dict[str, str], target_date: str) -> str:
     return html
 
 
-def _persist_snapshot(html: str, window_start: date_cls) -> None:
+def flush_snapshots() -> None:
+    """Wait for pending SAFE snapshot writes and stop the writer thread."""
+
+    global _SNAPSHOT_EXECUTOR
+    executor, _SNAPSHOT_EXECUTOR = _SNAPSHOT_EXECUTOR, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+def _persist_snapshot(html: str, window_start: date_cls, window_end: date_cls) -> None:
+    """Queue a diagnostic snapshot write so the lookup never waits on disk."""
+
+    global _SNAPSHOT_EXECUTOR
+    snapshot_dir = Path(os.getenv(SNAPSHOT_ENV_VAR, DEFAULT_SNAPSHOT_DIR))
+    snapshot_path = snapshot_dir / f"safe_{window_start.strftime('%Y-%m')}.html"
+    try:
+        written = date_cls.fromtimestamp(snapshot_path.stat().st_mtime)
+    except OSError:
+        written = None
+    if written is not None and written > window_end:
+        # Captured after the window closed, so the existing snapshot is final.
+        return
+    if _SNAPSHOT_EXECUTOR is None:
+        _SNAPSHOT_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="safe-snap")
+    _SNAPSHOT_EXECUTOR.submit(_write_snapshot, html, snapshot_path)
+
+
+def _write_snapshot(html: str, snapshot_path: Path) -> None:
     try:
-        snapshot_dir = Path(os.getenv(SNAPSHOT_ENV_VAR, DEFAULT_SNAPSHOT_DIR))
-        snapshot_dir.mkdir(parents=True, exist_ok=True)
-        month_tag = window_start.strftime("%Y-%m")
-        snapshot_path = snapshot_dir / f"safe_{month_tag}.html"
+        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
         encoded = html.encode("utf-8")
         payload = encoded[:SNAPSHOT_SIZE_LIMIT]
         with open(snapshot_path, "wb") as handle:
@@ -151,21 +271,50 @@ def _persist_snapshot(html: str, window_start: date_cls) -> None:
         LOGGER.debug("Failed to persist SAFE snapshot: %s", exc)
 
 
-def _extract_header_cells(table) -> list[str]:
-    header = table.find("tr")
-    if not header:
-        return []
-    return [cell.get_text(strip=True) for cell in header.find_all(["th", "td"])]
+def _read_info_table(html: str) -> tuple[list[list[str]] | None, Callable[[], str]]:
+    """Return the InfoTable cell texts per ``<tr>`` and a lazy document-text getter.
 
+    Uses lxml XPath directly when available, otherwise BeautifulSoup. Rows are
+    ``None`` when the page has no InfoTable.
+    """
 
-def _collect_rows(table) -> list[list[str]]:
-    rows: list[list[str]] = []
-    for row in table.find_all("tr"):
-        cells = [cell.get_text(strip=True) for cell in row.find_all(["td", "th"])]
-        if cells:
-            rows.append(cells)
-    # Drop header row if present
-    return rows[1:] if len(rows) > 1 else []
+    if lxml_html is not None:
+        root = lxml_html.fromstring(html.encode("utf-8"), parser=_LXML_PARSER)
+        document_text = lambda: _join_text(root.itertext())  # noqa: E731
+        tables = _INFO_TABLE_XPATH(root)
+        if not tables:
+            return None, document_text
+        rows = [
+            ["".join(text.strip() for text in cell.itertext()) for cell in _CELL_XPATH(row)]
+            for row in _ROW_XPATH(tables[0])
+        ]
+        return rows, document_text
+
+    soup = BeautifulSoup(html, HTML_PARSER)
+    document_text = lambda: soup.get_text(" ", strip=True)  # noqa: E731
+    table = soup.find("table", {"id": "InfoTable"})
+    if not table:
+        return None, document_text
+    rows = [
+        [cell.get_text(strip=True) for cell in row.find_all(["td", "th"])]
+        for row in table.find_all("tr")
+    ]
+    return rows, document_text
+
+
+def _join_text(fragments: Iterable[str]) -> str:
+    # Mirrors BeautifulSoup's get_text(" ", strip=True).
+    return " ".join(stripped for stripped in (text.strip() for text in fragments) if stripped)
+
+
+def _extract_header_cells(table_rows: list[list[str]]) -> list[str]:
+    return table_rows[0] if table_rows else []
+
+
+def _collect_rows(table_rows: list[list[str]]) -> list[list[str]]:
+    # The header is table_rows[0] (callers reject an empty one), so the body
+    # is every later non-empty row; no second pass or intermediate copy.
+    return [cells for cells in islice(table_rows, 1, None) if cells]
 
 
 def _locate_column(header: Iterable[str], keywords: Iterable[str]) -> int | None:
@@ -180,16 +329,16 @@ def _locate_column(header: Iterable[str], keywords: Iterable[str]) -> int | None
 def _detect_per_100(
     header_text: str,
     candidate_rates: Iterable[Decimal],
-    soup: BeautifulSoup,
+    document_text: Callable[[], str],
 ) -> bool:
-    header_lower = header_text.lower()
-    if "100" in header_lower or "每100" in header_text:
+    # Cheapest evidence first; the full document text is only built when the
+    # header and the rates themselves are inconclusive.
+    if "100" in header_text:
         return True
-    for rate in candidate_rates:
-        if rate >= Decimal("50"):
-            return True
-    doc_text = soup.get_text(" ", strip=True)
-    return "每100" in doc_text or "100美元" in doc_text
+    if any(rate >= _PER_100_RATE_FLOOR for rate in candidate_rates):
+        return True
+    doc_text = document_text()
+    return any(marker in doc_text for marker in PER_100_TEXT_MARKERS)
 
 
 def _select_forward_date(
@@ -197,12 +346,10 @@ def _select_forward_date(
     window_start: date_cls,
     window_end: date_cls,
 ) -> date_cls | None:
-    candidates = sorted(
-        date for date in set(available_dates) if window_start <= date <= window_end
+    return min(
+        (date for date in available_dates if window_start <= date <= window_end),
+        default=None,
     )
-    if not candidates:
-        return None
-    return candidates[0]
 
 
 def _parse_decimal(raw: str) -> Decimal:
@@ -223,11 +370,11 @@ def _parse_row_date(raw: str) -> date_cls | None:
     text = raw.strip()
     if not text:
         return None
-    normalized = text.replace("/", "-")
+    normalized = text.translate(_ISO_TRANSLATE)
     try:
         return date_cls.fromisoformat(normalized)
     except ValueError:
-        match = re.search(r"(\d{4})\D+(\d{1,2})\D+(\d{1,2})", text)
+        match = _ROW_DATE_FALLBACK_RE.search(text)
         if not match:
             return None
         year, month, day = (int(part) for part in match.groups())
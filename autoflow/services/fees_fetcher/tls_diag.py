@@ -6,6 +6,8 @@ import json
 import os
 import socket
 import ssl
+import threading
+import time
 from contextlib import contextmanager
 from typing import Any, Iterator, Tuple
 
@@ -23,6 +25,40 @@ _IP_FAMILY_MAP = {
     "6": socket.AF_INET6,
 }
 
+# Loading the CA bundle is costly; probe_cert only wraps sockets with it.
+_SSL_CTX = ssl.create_default_context()
+
+DNS_CACHE_TTL_SECONDS = 60.0
+
+# host -> (resolved_at, ((family, address), ...)) in getaddrinfo order.
+_DNS_CACHE: dict[str, tuple[float, tuple[tuple[int, str], ...]]] = {}
+_DNS_CACHE_LOCK = threading.Lock()
+
+
+def clear_dns_cache() -> None:
+    """Drop cached ``getaddrinfo`` results."""
+
+    with _DNS_CACHE_LOCK:
+        _DNS_CACHE.clear()
+
+
+def _cached_getaddrinfo(host: str) -> tuple[tuple[int, str], ...]:
+    """Return ``(family, address)`` pairs for *host*, reusing results for a short TTL."""
+
+    now = time.monotonic()
+    with _DNS_CACHE_LOCK:
+        cached = _DNS_CACHE.get(host)
+    if cached is not None and now - cached[0] < DNS_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    entries = tuple(
+        (af, sockaddr[0])
+        for af, _, _, _, sockaddr in socket.getaddrinfo(host, None, proto=socket.IPPROTO_TCP)
+    )
+    with _DNS_CACHE_LOCK:
+        _DNS_CACHE[host] = (now, entries)
+    return entries
+
 
 def resolve_ips(host: str, family: str = "auto") -> tuple[list[str], list[str]]:
     """Resolve IPv4/IPv6 addresses for *host* per *family* preference."""
@@ -35,10 +71,7 @@ def resolve_ips(host: str, family: str = "auto") -> tuple[list[str], list[str]]:
     ipv4: list[str] = []
     ipv6: list[str] = []
 
-    infos = socket.getaddrinfo(host, None, proto=socket.IPPROTO_TCP)
-    for info in infos:
-        af, _, _, _, sockaddr = info
-        addr = sockaddr[0]
+    for af, addr in _cached_getaddrinfo(host):
         if af == socket.AF_INET:
             if addr not in ipv4:
                 ipv4.append(addr)
@@ -54,11 +87,47 @@ def resolve_ips(host: str, family: str = "auto") -> tuple[list[str], list[str]]:
     return ipv4, ipv6
 
 
+def resolve_ips_count_first(
+    host: str, family: str = "auto"
+) -> tuple[str | None, str | None, int, int]:
+    """Return the first IPv4/IPv6 address and per-family counts for *host*.
+
+    Lightweight variant of :func:`resolve_ips` for hot paths that only need
+    telemetry; the full address lists are not materialised.
+    """
+
+    family = family.lower()
+    if family not in _IP_FAMILY_MAP:
+        raise ValueError(f"invalid ip-family: {family}")
+
+    first_v4: str | None = None
+    first_v6: str | None = None
+    seen_v4: set[str] = set()
+    seen_v6: set[str] = set()
+
+    for af, addr in _cached_getaddrinfo(host):
+        if af == socket.AF_INET:
+            if first_v4 is None:
+                first_v4 = addr
+            seen_v4.add(addr)
+        elif af == socket.AF_INET6:
+            if first_v6 is None:
+                first_v6 = addr
+            seen_v6.add(addr)
+
+    if family == "4" and first_v4 is None:
+        raise ValueError(f"no IPv4 address resolved for {host}")
+    if family == "6" and first_v6 is None:
+        raise ValueError(f"no IPv6 address resolved for {host}")
+
+    return first_v4, first_v6, len(seen_v4), len(seen_v6)
+
+
 def probe_cert(host: str, ip: str, timeout: float = 3.0) -> dict[str, Any]:
     """Open a TLS connection to *ip* (for *host*) and return certificate summary."""
 
     family = socket.AF_INET6 if ":" in ip else socket.AF_INET
-    context = ssl.create_default_context()
+    context = _SSL_CTX
     sock = socket.socket(family, socket.SOCK_STREAM)
     sock.settimeout(timeout)
     san_contains_host = False
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from decimal import Decimal
 from pathlib import Path
 from typing import Callable, Iterable, Protocol
 import logging
 
+import numpy as np
 import pandas as pd
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -19,8 +21,17 @@ from .models import ProcessedFrame
 from .report import generate_report
 from .validate import ValidationOutcome, apply_validations
 
+try:  # Rust-backed Excel reader; pandas falls back to openpyxl without it.
+    import python_calamine  # type: ignore  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependency
+    EXCEL_ENGINE: str | None = None
+else:
+    EXCEL_ENGINE = "calamine"
+
 LOGGER = logging.getLogger(__name__)
 
+MAX_READ_WORKERS = 8
+
 
 class RateProvider(Protocol):
     """Protocol for currency rate providers."""
@@ -64,12 +75,24 @@ class _MappingDiagnostics:
 
 def _read_input_file(path: Path) -> pd.DataFrame:
     if path.suffix.lower() in {".xlsx", ".xls"}:
-        return pd.read_excel(path)
+        return pd.read_excel(path, engine=EXCEL_ENGINE)
     if path.suffix.lower() in {".csv"}:
-        return pd.read_csv(path)
+        # Infer each column's dtype from the whole file instead of per chunk.
+        return pd.read_csv(path, low_memory=False)
     raise ValueError(f"unsupported input file: {path}")
 
 
+def _read_input_files(paths: list[Path]) -> list[pd.DataFrame]:
+    """Read *paths* concurrently; results keep the input order."""
+
+    for path in paths:
+        LOGGER.info("Reading input file: %s", path)
+    if len(paths) == 1:
+        return [_read_input_file(paths[0])]
+    with ThreadPoolExecutor(max_workers=min(MAX_READ_WORKERS, len(paths))) as executor:
+        return list(executor.map(_read_input_file, paths))
+
+
 def _build_confirmation_callback(non_interactive: bool) -> Callable[[pd.Series], bool] | None:
     if non_interactive:
         return None
@@ -93,10 +116,10 @@ def _build_confirmation_callback(non_interactive: bool) -> Callable[[pd.Series],
 
 
 def _apply_computed_columns(frame: pd.DataFrame, mapping_conf: MappingConfig) -> pd.DataFrame:
-    df = frame.copy()
+    # Scalar column assignment only; mutates the caller's per-file frame.
     for key, value in mapping_conf.computed.items():
-        df[key] = value
-    return df
+        frame[key] = value
+    return frame
 
 
 def process_forms(
@@ -120,13 +143,11 @@ def process_forms(
     mapping_meta: list[_MappingDiagnostics] = []
     mapped_frames: list[pd.DataFrame] = []
 
-    for path in paths:
-        LOGGER.info("Reading input file: %s", path)
-        raw_df = _read_input_file(path)
+    for path, raw_df in zip(paths, _read_input_files(paths)):
         mapping_result = apply_column_mapping(raw_df, mapping_conf)
-        df = mapping_result.dataframe.copy()
+        df = mapping_result.dataframe
         df["source_file"] = path.name
-        df["source_row"] = list(range(2, len(df) + 2))
+        df["source_row"] = np.arange(2, len(df) + 2, dtype=np.int64)
         df = _apply_computed_columns(df, mapping_conf)
         mapped_frames.append(df)
         mapping_meta.append(
@@ -139,16 +160,18 @@ def process_forms(
         if mapping_result.missing_columns:
             LOGGER.warning("Missing columns for %s: %s", path.name, mapping_result.missing_columns)
 
+    # concat yields a frame owned by this pipeline; later stages mutate it in place.
     combined = pd.concat(mapped_frames, ignore_index=True) if mapped_frames else pd.DataFrame()
     if combined.empty:
         raise ValueError("no data rows found in inputs")
 
-    cleaned = clean_dataframe(combined)
+    cleaned = clean_dataframe(combined, inplace=True)
     computed = compute_base_amounts(
         cleaned,
         base_currency=config.base_currency,
         round_digits=config.round_digits,
         rate_provider=rate_provider,
+        inplace=True,
     )
 
     confirm_callback = _build_confirmation_callback(non_interactive)
@@ -2,89 +2,139 @@
 
 from __future__ import annotations
 
+import warnings
 from decimal import Decimal, InvalidOperation
-from typing import List
+from typing import Iterable, List
 
+import numpy as np
 import pandas as pd
 
 
-def _empty_issue_list(size: int) -> List[List[str]]:
-    return [[] for _ in range(size)]
+def _empty_issue_list(size: int) -> np.ndarray:
+    # One list per row, matching IssueRecord.issues; an object array keeps
+    # numpy from reading the empty lists as a second dimension.
+    issues = np.empty(size, dtype=object)
+    for pos in range(size):
+        issues[pos] = []
+    return issues
 
 
-def _is_missing(value: object) -> bool:
-    if value is None:
-        return True
-    if isinstance(value, str) and value.strip() == "":
-        return True
-    try:
-        return bool(pd.isna(value))
-    except TypeError:
-        return False
+def _add_issues(issues: np.ndarray, pos: int, codes: Iterable[str]) -> None:
+    # Always store a new list: the old one may still be referenced by the
+    # caller's frame.
+    issues[pos] = [*issues[pos], *codes]
+
 
+def normalize_whitespace(frame: pd.DataFrame, *, inplace: bool = False) -> pd.DataFrame:
+    """Trim surrounding whitespace for string columns.
 
-def normalize_whitespace(frame: pd.DataFrame) -> pd.DataFrame:
-    """Trim surrounding whitespace for string columns."""
+    With ``inplace=True`` the given frame is modified and returned instead of a copy.
+    """
 
-    df = frame.copy()
+    df = frame if inplace else frame.copy()
     for col in df.select_dtypes(include=["object"]).columns:
         if col == "issues":
             continue
-        df[col] = df[col].map(lambda x: x.strip() if isinstance(x, str) else x)
+        column = df[col]
+        try:
+            stripped = column.str.strip()
+        except AttributeError:  # no string cells at all
+            continue
+        # ``str.strip`` turns non-string cells into NaN; those keep their value.
+        is_text = stripped.notna()
+        if not column[is_text].ne(stripped[is_text]).any():
+            continue
+        df[col] = column.where(~is_text, stripped)
     return df
 
 
-def clean_dataframe(frame: pd.DataFrame) -> pd.DataFrame:
-    """Clean raw dataframe into normalized types."""
+def _missing_mask(series: pd.Series) -> pd.Series:
+    """Flag cells that are NA or hold only whitespace.
+
+    Only object and string columns can hold blank text; every other dtype
+    reduces to ``isna``.
+    """
+
+    missing = series.isna()
+    if not (series.dtype == object or isinstance(series.dtype, pd.StringDtype)):
+        return missing
+    try:
+        # Non-string cells strip to NA, which never equals "".
+        blank = series.str.strip().eq("")
+    except AttributeError:  # object column without any strings
+        return missing
+    return (missing | blank).fillna(True).astype(bool)
+
 
-    df = normalize_whitespace(frame)
+def _flag_issue(issues: np.ndarray, mask: pd.Series | np.ndarray, code: str) -> None:
+    """Add *code* to every row selected by *mask*; callers write *issues* back."""
+
+    for pos in np.flatnonzero(np.asarray(mask)):
+        _add_issues(issues, pos, (code,))
+
+
+def _parse_amount(text: str) -> Decimal | None:
+    try:
+        return Decimal(text)
+    except (InvalidOperation, ValueError):
+        return None
+
+
+def _normalize_dates(values: pd.Series) -> pd.Series:
+    try:
+        with warnings.catch_warnings():
+            # Mixed offsets are handled below; pandas only warns that it will raise later.
+            warnings.simplefilter("ignore", FutureWarning)
+            parsed = pd.to_datetime(values, errors="coerce", format="mixed")
+    except (TypeError, ValueError):
+        parsed = None
+    if parsed is None or not pd.api.types.is_datetime64_any_dtype(parsed):
+        # Mixed timezone offsets (or aware and naive values) cannot share one dtype, so
+        # pandas hands back an object column; parse those per value.
+        parsed = values.map(lambda value: pd.to_datetime(value, errors="coerce"))
+        return parsed.map(lambda ts: None if pd.isna(ts) else ts.date().isoformat())
+    return parsed.dt.strftime("%Y-%m-%d").astype(object).where(parsed.notna(), None)
+
+
+def clean_dataframe(frame: pd.DataFrame, *, inplace: bool = False) -> pd.DataFrame:
+    """Clean raw dataframe into normalized types.
+
+    With ``inplace=True`` the given frame is modified and returned instead of a copy.
+    """
+
+    df = normalize_whitespace(frame, inplace=inplace)
     if "issues" not in df.columns:
         df["issues"] = _empty_issue_list(len(df))
+    issues = df["issues"].to_numpy()
 
     if "amount" in df.columns:
-        clean_amounts: List[Decimal | None] = []
-        for idx, value in df["amount"].items():
-            if _is_missing(value):
-                clean_amounts.append(None)
-                continue
-            if isinstance(value, Decimal):
-                clean_amounts.append(value)
-                continue
-            text = str(value).strip().replace(",", "")
-            try:
-                clean_amounts.append(Decimal(text))
-            except (InvalidOperation, ValueError):
-                issues = df.at[idx, "issues"]
-                issues.append("invalid_amount")
-                clean_amounts.append(None)
+        column = df["amount"]
+        missing = _missing_mask(column)
+        text = column.astype("string").str.strip().str.replace(",", "", regex=False)
+        clean_amounts: List[Decimal | None] = [
+            None if is_missing else value if isinstance(value, Decimal) else _parse_amount(raw)
+            for value, raw, is_missing in zip(column.tolist(), text.tolist(), missing.tolist())
+        ]
+        invalid = pd.Series([amount is None for amount in clean_amounts], index=df.index) & ~missing
+        _flag_issue(issues, invalid, "invalid_amount")
         df["amount"] = clean_amounts
 
     if "currency" in df.columns:
-        normalized_currency: List[str | None] = []
-        for idx, value in df["currency"].items():
-            if _is_missing(value):
-                normalized_currency.append(None)
-                continue
-            normalized = str(value).strip().upper()
-            if len(normalized) not in (2, 3):
-                df.at[idx, "issues"].append("invalid_currency")
-                normalized_currency.append(normalized)
-            else:
-                normalized_currency.append(normalized)
-        df["currency"] = normalized_currency
+        missing = _missing_mask(df["currency"])
+        normalized = df["currency"].astype("string").str.strip().str.upper()
+        invalid = ~missing & ~normalized.str.len().isin((2, 3))
+        _flag_issue(issues, invalid, "invalid_currency")
+        df["currency"] = normalized.astype(object).where(~missing, None)
 
     if "date" in df.columns:
-        normalized_dates: List[str | None] = []
-        for idx, value in df["date"].items():
-            if _is_missing(value):
-                normalized_dates.append(None)
-                continue
-            parsed = pd.to_datetime(value, errors="coerce")
-            if pd.isna(parsed):
-                df.at[idx, "issues"].append("invalid_date")
-                normalized_dates.append(None)
-            else:
-                normalized_dates.append(parsed.date().isoformat())
+        missing = _missing_mask(df["date"])
+        present = ~missing
+        normalized_dates = pd.Series([None] * len(df), index=df.index, dtype=object)
+        if present.any():
+            normalized_dates[present] = _normalize_dates(df["date"][present])
+        invalid = present & normalized_dates.isna()
+        _flag_issue(issues, invalid, "invalid_date")
         df["date"] = normalized_dates
 
+    df["issues"] = issues
     return df
@@ -4,8 +4,10 @@ from __future__ import annotations
 
 from decimal import Decimal, ROUND_HALF_UP
 
+import numpy as np
 import pandas as pd
 
+from .cleaning import _add_issues, _empty_issue_list
 from .providers import RateFallbackUsed, RateLookupError
 
 
@@ -14,44 +16,88 @@ def compute_base_amounts(
     base_currency: str,
     round_digits: int,
     rate_provider,
+    *,
+    inplace: bool = False,
 ) -> pd.DataFrame:
-    """Append base currency amounts using the provided rate provider."""
+    """Append base currency amounts using the provided rate provider.
 
-    df = frame.copy()
-    df["base_currency"] = base_currency
+    With ``inplace=True`` the given frame is modified and returned instead of a copy.
+    """
+
+    df = frame if inplace else frame.copy()
+    # One value for every row; a categorical stores it once instead of per cell.
+    df["base_currency"] = pd.Categorical.from_codes(
+        np.zeros(len(df), dtype=np.int8), categories=[base_currency]
+    )
     if "exchange_rate" not in df:
         df["exchange_rate"] = None
     if "base_amount" not in df:
         df["base_amount"] = None
     if "rate_date_used" not in df:
         df["rate_date_used"] = None
+    if "issues" not in df:
+        df["issues"] = _empty_issue_list(len(df))
 
     quant = Decimal("1").scaleb(-round_digits)
 
-    for idx, row in df.iterrows():
-        amount = row.get("amount")
-        currency = row.get("currency")
-        date = row.get("date")
-        if amount is None or currency is None or date is None:
+    amounts = df["amount"].tolist() if "amount" in df else [None] * len(df)
+    currencies = df["currency"].tolist() if "currency" in df else [None] * len(df)
+    dates = df["date"].tolist() if "date" in df else [None] * len(df)
+    issues = df["issues"].to_numpy(dtype=object, copy=True)
+    exchange_rates = df["exchange_rate"].tolist()
+    base_amounts = df["base_amount"].tolist()
+    rate_dates = df["rate_date_used"].tolist()
+
+    # One provider call per distinct (date, currency); rows share the result.
+    lookups: dict[tuple[object, object], tuple[Decimal | None, object, tuple[str, ...]]] = {}
+    for pos, (amount, currency, date) in enumerate(zip(amounts, currencies, dates)):
+        if _is_absent(amount) or _is_absent(currency) or _is_absent(date):
             continue
         if not isinstance(amount, Decimal):
             continue
-        try:
-            rate = rate_provider.get_rate(date, currency, base_currency)
-            rate_date = date
-        except RateFallbackUsed as exc:
-            rate = exc.rate
-            rate_date = exc.used_date
-            df.at[idx, "issues"].append("rate_fallback")
-        except RateLookupError:
-            df.at[idx, "issues"].append("rate_unavailable")
-            continue
+        key = (date, currency)
+        lookup = lookups.get(key)
+        if lookup is None:
+            lookup = _lookup_rate(rate_provider, date, currency, base_currency)
+            lookups[key] = lookup
+        rate, rate_date, codes = lookup
+        if codes:
+            _add_issues(issues, pos, codes)
         if rate is None:
-            df.at[idx, "issues"].append("rate_unavailable")
             continue
-        base_amount = (amount * rate).quantize(quant, rounding=ROUND_HALF_UP)
-        df.at[idx, "exchange_rate"] = rate
-        df.at[idx, "base_amount"] = base_amount
-        df.at[idx, "rate_date_used"] = rate_date
+        exchange_rates[pos] = rate
+        base_amounts[pos] = (amount * rate).quantize(quant, rounding=ROUND_HALF_UP)
+        rate_dates[pos] = rate_date
 
+    df["exchange_rate"] = exchange_rates
+    df["base_amount"] = base_amounts
+    df["rate_date_used"] = rate_dates
+    df["issues"] = issues
     return df
+
+
+def _is_absent(value: object) -> bool:
+    return value is None or (not isinstance(value, (str, Decimal)) and bool(pd.isna(value)))
+
+
+def _lookup_rate(
+    rate_provider,
+    date: object,
+    currency: object,
+    base_currency: str,
+) -> tuple[Decimal | None, object, tuple[str, ...]]:
+    """Return ``(rate, rate_date, issue_codes)`` for one date/currency pair."""
+
+    try:
+        rate = rate_provider.get_rate(date, currency, base_currency)
+        rate_date = date
+        codes: tuple[str, ...] = ()
+    except RateFallbackUsed as exc:
+        rate = exc.rate
+        rate_date = exc.used_date
+        codes = ("rate_fallback",)
+    except RateLookupError:
+        return None, None, ("rate_unavailable",)
+    if rate is None:
+        return None, None, codes + ("rate_unavailable",)
+    return rate, rate_date, codes
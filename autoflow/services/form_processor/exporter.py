@@ -9,6 +9,11 @@ from typing import Iterable
 import pandas as pd
 from openpyxl import Workbook
 
+try:  # xlsxwriter streams rows faster; openpyxl write-only mode is the fallback.
+    import xlsxwriter
+except ImportError:  # pragma: no cover - optional dependency
+    xlsxwriter = None
+
 _EXPORT_COLUMNS: Iterable[str] = (
     "project",
     "date",
@@ -24,28 +29,61 @@ _EXPORT_COLUMNS: Iterable[str] = (
 )
 
 
+def _join_list(value: object) -> object:
+    if isinstance(value, list):
+        return "; ".join(str(v) for v in value)
+    return value
+
+
 def export_template(frame: pd.DataFrame, output_dir: Path) -> Path:
     """Write accepted rows into a simple Excel template."""
 
     output_dir.mkdir(parents=True, exist_ok=True)
     path = output_dir / f"processed_forms_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
 
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Invoice"
-    ws["A1"] = "Processed Items"  # TODO: replace with real template glue during integration
-
     headers = list(_EXPORT_COLUMNS)
-    ws.append(headers)
+    export = frame.reindex(columns=headers)
+    for col in headers:
+        if col not in frame.columns:
+            export[col] = None  # reindex fills NaN; the sheet expects blank cells
+            continue
+        column = export[col]
+        if column.dtype == object:
+            column = column.map(_join_list)
+        present = column.notna()
+        if not present.all():
+            column = column.astype(object).where(present, None)
+        export[col] = column
 
-    for _, row in frame.iterrows():
-        values = []
-        for col in headers:
-            value = row.get(col)
-            if isinstance(value, list):
-                value = "; ".join(str(v) for v in value)
-            values.append(value)
-        ws.append(values)
+    title = ["Processed Items"]  # TODO: replace with real template glue during integration
+    rows = export.itertuples(index=False, name=None)
+    if xlsxwriter is not None:
+        _write_xlsxwriter(path, title, headers, rows)
+    else:
+        _write_openpyxl(path, title, headers, rows)
+    return path
 
+
+def _write_xlsxwriter(path: Path, title: list[str], headers: list[str], rows: Iterable[tuple]) -> None:
+    options = {
+        "constant_memory": True,
+        # Keep URL-looking text as plain strings, as openpyxl stores it.
+        "strings_to_urls": False,
+    }
+    with xlsxwriter.Workbook(str(path), options) as wb:
+        ws = wb.add_worksheet("Invoice")
+        ws.write_row(0, 0, title)
+        ws.write_row(1, 0, headers)
+        for row_idx, row in enumerate(rows, start=2):
+            ws.write_row(row_idx, 0, row)
+
+
+def _write_openpyxl(path: Path, title: list[str], headers: list[str], rows: Iterable[tuple]) -> None:
+    # Write-only mode streams rows to the archive instead of building a cell tree.
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Invoice")
+    ws.append(title)
+    ws.append(headers)
+    for row in rows:
+        ws.append(row)
     wb.save(path)
-    return path
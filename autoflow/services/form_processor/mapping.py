@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Iterable, List
@@ -14,7 +15,7 @@ from ruamel.yaml import YAML
 class ValidationRules(BaseModel):
     """Validation directives parsed from the mapping file."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", frozen=True)
 
     required: List[str] = Field(default_factory=list)
     non_negative: List[str] = Field(default_factory=list)
@@ -24,7 +25,7 @@ class ValidationRules(BaseModel):
 class ThresholdRules(BaseModel):
     """Threshold directives parsed from mapping.yaml."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", frozen=True)
 
     confirm_over_amount_cny: float | None = None
 
@@ -32,7 +33,7 @@ class ThresholdRules(BaseModel):
 class MappingConfig(BaseModel):
     """Complete mapping file model."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", frozen=True)
 
     input_columns: Dict[str, List[str]] = Field(default_factory=dict)
     computed: Dict[str, str] = Field(default_factory=dict)
@@ -51,16 +52,31 @@ class ColumnMappingResult:
 
 
 def load_mapping_config(mapping_path: str | Path) -> MappingConfig:
-    """Load mapping configuration from YAML."""
+    """Load mapping configuration from YAML.
 
+    Parsed configs are cached per resolved path and modification time; the
+    returned model is frozen because it is shared between callers.
+    """
+
+    path = Path(mapping_path).resolve()
+    return _load_mapping_config_cached(str(path), path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_mapping_config_cached(mapping_path: str, mtime_ns: int) -> MappingConfig:
     yaml = YAML(typ="safe")
     with Path(mapping_path).open("r", encoding="utf-8") as fh:
         data = yaml.load(fh) or {}
     return MappingConfig.model_validate(data)
 
 
+# Removes inner blanks; ``strip`` still handles Unicode padding such as U+3000.
+_NORMALIZE_TABLE = str.maketrans("", "", " \t\n\r")
+
+
+@functools.lru_cache(maxsize=4096)
 def _normalize(label: str) -> str:
-    return label.strip().lower().replace(" ", "")
+    return label.strip().translate(_NORMALIZE_TABLE).lower()
 
 
 def apply_column_mapping(frame: pd.DataFrame, config: MappingConfig) -> ColumnMappingResult:
@@ -72,10 +88,13 @@ def apply_column_mapping(frame: pd.DataFrame, config: MappingConfig) -> ColumnMa
     matched: Dict[str, str] = {}
     missing: List[str] = []
 
-    for canonical, candidates in config.input_columns.items():
+    candidate_normals = {
+        canonical: [_normalize(candidate) for candidate in candidates]
+        for canonical, candidates in config.input_columns.items()
+    }
+    for canonical, normals in candidate_normals.items():
         found = None
-        for candidate in candidates:
-            normalized = _normalize(candidate)
+        for normalized in normals:
             if normalized in normalized_map:
                 found = normalized_map[normalized]
                 break
@@ -86,14 +105,18 @@ def apply_column_mapping(frame: pd.DataFrame, config: MappingConfig) -> ColumnMa
 
     rename_map = {original: canonical for canonical, original in matched.items()}
     renamed = frame.rename(columns=rename_map)
-    # Ensure canonical names exist even when missing by adding NA columns.
-    for canonical in config.input_columns.keys():
-        if canonical not in renamed.columns:
-            renamed[canonical] = pd.NA
-    # Keep canonical columns first for readability.
+    # Keep canonical columns first for readability; missing ones become NA columns.
     canonical_order = list(config.input_columns.keys())
-    ordered_columns = canonical_order + [c for c in renamed.columns if c not in canonical_order]
-    ordered = renamed[ordered_columns]
+    canonical_set = set(canonical_order)
+    ordered_columns = canonical_order + [c for c in renamed.columns if c not in canonical_set]
+    if renamed.columns.is_unique:
+        ordered = renamed.reindex(columns=ordered_columns, fill_value=pd.NA)
+    else:
+        # reindex rejects duplicate labels; add the NA columns one by one instead.
+        for canonical in canonical_order:
+            if canonical not in renamed.columns:
+                renamed[canonical] = pd.NA
+        ordered = renamed[ordered_columns]
 
     used_originals = set(matched.values())
     unmatched = [col for col in original_columns if col not in used_originals]
@@ -32,10 +32,15 @@ class ProcessedFrame:
 
     dataframe: pd.DataFrame
 
-    def copy(self) -> "ProcessedFrame":
-        """Return a deep copy of the underlying frame."""
+    def copy(self, shallow: bool = False) -> "ProcessedFrame":
+        """Return a copy of the underlying frame.
 
-        return ProcessedFrame(dataframe=self.dataframe.copy(deep=True))
+        Args:
+            shallow: Share column data with this frame instead of copying it;
+                suitable for read-only consumers.
+        """
+
+        return ProcessedFrame(dataframe=self.dataframe.copy(deep=not shallow))
 
     def to_dataframe(self) -> pd.DataFrame:
         """Expose the underlying DataFrame."""
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import date as date_cls, datetime
 from decimal import Decimal
+from types import MappingProxyType
 from typing import Dict, Mapping, Tuple
 
 
@@ -28,12 +30,34 @@ class RateFallbackUsed(RateLookupError):
         self.used_date = used_date
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class MockRateProvider:
     """In-memory provider used in tests and CLI demos."""
 
     rates: Mapping[Tuple[str, str], Mapping[str, Decimal]]
     fallback_window_days: int = 7
+    # pair -> sorted ISO date keys, built once from the snapshot taken in __post_init__.
+    _sorted_dates: Mapping[Tuple[str, str], Tuple[str, ...]] = field(
+        init=False, repr=False, compare=False, hash=False
+    )
+
+    def __post_init__(self) -> None:
+        # Later edits to the caller's dicts must not leave the sorted dates stale.
+        snapshot = MappingProxyType(
+            {pair: MappingProxyType(dict(pair_rates)) for pair, pair_rates in self.rates.items()}
+        )
+        object.__setattr__(self, "rates", snapshot)
+        object.__setattr__(
+            self,
+            "_sorted_dates",
+            MappingProxyType(
+                {
+                    # Only canonical YYYY-MM-DD keys can be fallback targets; they sort as dates.
+                    pair: tuple(sorted(value for value in pair_rates if _is_iso_date(value)))
+                    for pair, pair_rates in snapshot.items()
+                }
+            ),
+        )
 
     def get_rate(self, date: str, from_ccy: str, to_ccy: str) -> Decimal:
         from_ccy = from_ccy.upper()
@@ -54,20 +78,31 @@ class MockRateProvider:
         except ValueError as exc:  # noqa: BLE001
             raise RateLookupError(f"invalid rate lookup date: {date}") from exc
 
-        for _ in range(self.fallback_window_days):
-            cur -= timedelta(days=1)
-            lookup = cur.isoformat()
-            if lookup in pair_rates:
-                raise RateFallbackUsed(
-                    rate=Decimal(pair_rates[lookup]),
-                    used_date=lookup,
-                    original_date=date,
-                )
+        if self.fallback_window_days > 0:
+            # Latest configured date strictly before the target, within the window.
+            dates = self._sorted_dates[key]
+            pos = bisect_left(dates, cur.isoformat())
+            if pos:
+                lookup = dates[pos - 1]
+                if (cur - datetime.strptime(lookup, "%Y-%m-%d").date()).days <= self.fallback_window_days:
+                    raise RateFallbackUsed(
+                        rate=Decimal(pair_rates[lookup]),
+                        used_date=lookup,
+                        original_date=date,
+                    )
 
         raise RateLookupError(f"rate unavailable for {from_ccy}->{to_ccy} on {date}", original_date=date)
 
+def _is_iso_date(value: object) -> bool:
+    if not isinstance(value, str):
+        return False
+    try:
+        return date_cls.fromisoformat(value).isoformat() == value
+    except ValueError:
+        return False
+
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class StaticRateProvider:
     """Return constant rates for testing without external dependencies."""
 
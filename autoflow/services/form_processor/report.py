@@ -7,16 +7,36 @@ from typing import Iterable
 
 import pandas as pd
 
+CSV_CHUNK_ROWS = 10_000
+
+
+def _join_issues(value: object) -> object:
+    if type(value) in (list, tuple):
+        # Issue codes are strings by construction; str.join skips a generator.
+        try:
+            return "; ".join(value)
+        except TypeError:
+            return "; ".join(map(str, value))
+    if isinstance(value, Iterable) and not isinstance(value, str):
+        return "; ".join(map(str, value))
+    return value
+
 
 def _serialize_issues(frame: pd.DataFrame) -> pd.DataFrame:
-    df = frame.copy()
-    if "issues" in df.columns:
-        df["issues"] = df["issues"].map(
-            lambda x: "; ".join(str(item) for item in x) if isinstance(x, Iterable) and not isinstance(x, str) else x
-        )
+    if "issues" not in frame.columns:
+        return frame
+    # Only the issues column is replaced, so the other columns can be shared.
+    df = frame.copy(deep=False)
+    df["issues"] = df["issues"].map(_join_issues)
     return df
 
 
+def _write_csv(frame: pd.DataFrame, path: Path) -> None:
+    # Binary handle + explicit "\n": no newline translation, same bytes on every OS.
+    with path.open("wb") as fh:
+        frame.to_csv(fh, index=False, encoding="utf-8", lineterminator="\n", chunksize=CSV_CHUNK_ROWS)
+
+
 def generate_report(
     output_dir: Path,
     processed: pd.DataFrame,
@@ -33,11 +53,11 @@ def generate_report(
 
     if not rejected.empty:
         reject_path = output_dir / "processed_forms_rejects.csv"
-        _serialize_issues(rejected).to_csv(reject_path, index=False)
+        _write_csv(_serialize_issues(rejected), reject_path)
 
     if not need_confirm.empty:
         confirm_path = output_dir / "processed_forms_need_confirm.csv"
-        _serialize_issues(need_confirm).to_csv(confirm_path, index=False)
+        _write_csv(_serialize_issues(need_confirm), confirm_path)
 
     report_path = output_dir / "processed_forms_report.md"
 
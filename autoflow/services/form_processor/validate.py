@@ -4,10 +4,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Callable, List
+from typing import Callable
 
+import numpy as np
 import pandas as pd
 
+from .cleaning import _add_issues, _empty_issue_list, _flag_issue, _missing_mask
 from .mapping import ValidationRules
 
 
@@ -22,16 +24,16 @@ class ValidationOutcome:
 
 ConfirmCallback = Callable[[pd.Series], bool]
 
+# Category order doubles as the code mapping: 0 -> ok, 1 -> reject.
+STATUS_CATEGORIES = ("ok", "reject")
 
-def _is_missing(value: object) -> bool:
-    if value is None:
-        return True
-    if isinstance(value, str) and value.strip() == "":
-        return True
-    try:
-        return bool(pd.isna(value))
-    except TypeError:
-        return False
+
+def _decimal_mask(values: list[object], predicate: Callable[[Decimal], bool]) -> np.ndarray:
+    return np.fromiter(
+        (isinstance(value, Decimal) and predicate(value) for value in values),
+        dtype=bool,
+        count=len(values),
+    )
 
 
 def apply_validations(
@@ -41,71 +43,108 @@ def apply_validations(
     confirm_threshold: Decimal,
     confirm_callback: ConfirmCallback | None,
 ) -> ValidationOutcome:
-    """Validate rows and split accepted / rejected sets."""
+    """Validate rows and split accepted / rejected sets.
+
+    Each rule runs once per column; issue codes are appended per row in rule
+    order, and the confirmation callback only sees rows over the threshold.
+    """
 
-    df = frame.copy()
-    statuses: List[str] = []
-    confirm_flags: List[bool] = []
+    # Every write below replaces a whole column, so the caller's blocks can be shared.
+    df = frame.copy(deep=False)
+    size = len(df)
 
     # Ensure issues column exists for appending messages.
     if "issues" not in df.columns:
-        df["issues"] = [[] for _ in range(len(df))]
-
-    for idx, row in df.iterrows():
-        row_issues = row.get("issues", [])
-        status = "ok"
-
-        # Required fields validation.
-        for col in rules.required:
-            if _is_missing(row.get(col)):
-                row_issues.append(f"missing_{col}")
-                status = "reject"
-
-        # Non-negative validation for Decimal columns.
-        for col in rules.non_negative:
-            value = row.get(col)
-            if isinstance(value, Decimal) and value < 0:
-                row_issues.append(f"negative_{col}")
-                status = "reject"
-
-        # Rounding enforcement.
-        for col, digits in rules.round.items():
-            value = row.get(col)
-            if isinstance(value, Decimal):
-                quant_local = Decimal("1").scaleb(-digits)
-                df.at[idx, col] = value.quantize(quant_local, rounding=ROUND_HALF_UP)
-
-        df.at[idx, "issues"] = row_issues
-
-        base_amount = row.get("base_amount")
-        if "rate_unavailable" in row_issues or (
-            isinstance(row.get("amount"), Decimal) and base_amount is None
-        ):
-            if "rate_unavailable" not in row_issues:
-                row_issues.append("missing_base_amount")
-            status = "reject"
-        need_confirm = False
-        if isinstance(base_amount, Decimal) and base_amount >= confirm_threshold:
-            if confirm_callback is None:
-                need_confirm = True
-                row_issues.append("requires_confirmation")
+        df["issues"] = _empty_issue_list(size)
+    issues = df["issues"].to_numpy(dtype=object, copy=True)
+    rejected_mask = np.zeros(size, dtype=bool)
+
+    # Required fields validation; each column's mask is built once.
+    missing_masks: dict[str, np.ndarray] = {}
+    for col in rules.required:
+        missing = missing_masks.get(col)
+        if missing is None:
+            if col in df.columns:
+                missing = _missing_mask(df[col]).to_numpy()
             else:
-                confirmed = confirm_callback(row)
-                if not confirmed:
-                    need_confirm = True
-                    row_issues.append("confirmation_declined")
-            df.at[idx, "base_amount"] = Decimal(base_amount).quantize(
-                Decimal("1").scaleb(-round_digits),
-                rounding=ROUND_HALF_UP,
-            )
-        confirm_flags.append(need_confirm)
-        statuses.append(status)
-
-    df["status"] = statuses
+                missing = np.ones(size, dtype=bool)
+            missing_masks[col] = missing
+        _flag_issue(issues, missing, f"missing_{col}")
+        rejected_mask |= missing
+
+    # Non-negative validation for Decimal columns.
+    for col in rules.non_negative:
+        if col not in df.columns:
+            continue
+        negative = _decimal_mask(df[col].tolist(), lambda value: value < 0)
+        _flag_issue(issues, negative, f"negative_{col}")
+        rejected_mask |= negative
+
+    amounts = df["amount"].tolist() if "amount" in df.columns else [None] * size
+    base_amounts = df["base_amount"].tolist() if "base_amount" in df.columns else [None] * size
+
+    rate_unavailable = np.fromiter(
+        ("rate_unavailable" in row_issues for row_issues in issues), dtype=bool, count=size
+    )
+    missing_base = np.fromiter(
+        (
+            isinstance(amount, Decimal) and base_amount is None
+            for amount, base_amount in zip(amounts, base_amounts)
+        ),
+        dtype=bool,
+        count=size,
+    )
+    _flag_issue(issues, missing_base & ~rate_unavailable, "missing_base_amount")
+    rejected_mask |= rate_unavailable | missing_base
+
+    # The confirmation callback sees each row with its issues so far.
+    df["issues"] = issues
+
+    over_threshold = _decimal_mask(base_amounts, lambda value: value >= confirm_threshold)
+    over_positions = np.flatnonzero(over_threshold)
+    confirm_flags = np.zeros(size, dtype=bool)
+    if confirm_callback is None:
+        confirm_flags[over_positions] = True
+        _flag_issue(issues, over_threshold, "requires_confirmation")
+    else:
+        for pos in over_positions:
+            if not confirm_callback(df.iloc[pos]):
+                confirm_flags[pos] = True
+                _add_issues(issues, pos, ("confirmation_declined",))
+
+    # Rounding enforcement.
+    for col, digits in rules.round.items():
+        if col not in df.columns:
+            continue
+        values = df[col].to_numpy(dtype=object)
+        is_decimal = np.fromiter(
+            (isinstance(value, Decimal) for value in values), dtype=bool, count=size
+        )
+        if not is_decimal.any():
+            continue
+        quant_local = Decimal("1").scaleb(-digits)
+        values = values.copy()
+        values[is_decimal] = [
+            value.quantize(quant_local, rounding=ROUND_HALF_UP) for value in values[is_decimal]
+        ]
+        df[col] = values
+
+    # Amounts above the threshold are re-rounded from their original value.
+    if over_positions.size:
+        quant = Decimal("1").scaleb(-round_digits)
+        values = df["base_amount"].to_numpy(dtype=object).copy()
+        values[over_positions] = [
+            Decimal(base_amounts[pos]).quantize(quant, rounding=ROUND_HALF_UP)
+            for pos in over_positions
+        ]
+        df["base_amount"] = values
+
+    df["issues"] = issues
+    df["status"] = pd.Categorical.from_codes(rejected_mask.astype(np.int8), categories=STATUS_CATEGORIES)
     df["need_confirm"] = confirm_flags
 
-    accepted = df[df["status"] == "ok"].copy()
-    rejected = df[df["status"] != "ok"].copy()
+    accepted = df[~rejected_mask].copy()
+    rejected = df[rejected_mask].copy()
     need_confirm_df = accepted[accepted["need_confirm"]].copy()
 
     return ValidationOutcome(accepted=accepted, rejected=rejected, need_confirm=need_confirm_df)
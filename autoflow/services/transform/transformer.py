@@ -1,13 +1,24 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+from io import BytesIO
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 import datetime as dt
+import functools
+import shutil
 
 import pandas as pd
 import yaml
 from openpyxl import Workbook, load_workbook
 
+try:  # Rust-backed Excel reader; pandas falls back to openpyxl without it.
+    import python_calamine  # type: ignore  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependency
+    EXCEL_ENGINE: str | None = None
+else:
+    EXCEL_ENGINE = "calamine"
+
 
 def _ensure_template(template_path: Path) -> None:
     if template_path.exists():
@@ -28,6 +39,13 @@ def _ensure_template(template_path: Path) -> None:
     wb.save(template_path)
 
 
+@functools.lru_cache(maxsize=8)
+def _template_bytes(template_path: str, mtime_ns: int) -> bytes:
+    """Read a template once per modification time; each run parses its own copy."""
+
+    return Path(template_path).read_bytes()
+
+
 def _load_mapping(mapping_path: Path) -> dict[str, Any]:
     if not mapping_path.exists():
         raise FileNotFoundError(f"映射文件不存在: {mapping_path}")
@@ -35,7 +53,43 @@ def _load_mapping(mapping_path: Path) -> dict[str, Any]:
         return yaml.safe_load(f) or {}
 
 
-def _eval_value(expr: Any, df: pd.DataFrame, profile: Any) -> Any:
+@dataclass(frozen=True, slots=True)
+class _EvalContext:
+    """Per-run values shared by every compiled cell resolver."""
+
+    profile: Any
+    today: str
+    sums: dict[str, Any]
+    firsts: dict[str, Any]
+
+
+CellResolver = Callable[[_EvalContext], Any]
+
+
+def _column_sum(df: pd.DataFrame, col: str) -> Any:
+    if col not in df:
+        return 0
+    ser = df[col]
+    if not pd.api.types.is_numeric_dtype(ser):
+        ser = pd.to_numeric(ser, errors="coerce")
+    return float(ser.sum(skipna=True))
+
+
+def _column_first(df: pd.DataFrame, col: str) -> Any:
+    if col in df:
+        ser = df[col].dropna()
+        return None if ser.empty else ser.iloc[0]
+    return None
+
+
+def _eval_value(
+    expr: Any,
+    df: pd.DataFrame,
+    profile: Any,
+    sums: dict[str, Any] | None = None,
+    firsts: dict[str, Any] | None = None,
+    today: str | None = None,
+) -> Any:
     """Evaluate a simple mapping expression.
 
     Supported:
@@ -44,6 +98,10 @@ def _eval_value(expr: Any, df: pd.DataFrame, profile: Any) -> Any:
     - "sum:Column" -> sum of df[Column]
     - "first:Column" -> first non-null value
     - "$profile.xxx" -> attribute or key from profile
+
+    ``sums``/``firsts``/``today`` are optional precomputed values; they are
+    derived from *df* when omitted. :func:`transform` uses the compiled
+    resolvers from :func:`_compile_cells` instead.
     """
     if expr is None:
         return None
@@ -53,35 +111,96 @@ def _eval_value(expr: Any, df: pd.DataFrame, profile: Any) -> Any:
         return str(expr)
     s = expr.strip()
     if s.lower() == "today":
-        return dt.date.today().isoformat()
+        return today if today is not None else dt.date.today().isoformat()
     if s.startswith("sum:"):
         col = s[4:]
-        if col in df:
-            return float(pd.to_numeric(df[col], errors="coerce").fillna(0).sum())
-        return 0
+        if sums is not None and col in sums:
+            return sums[col]
+        return _column_sum(df, col)
     if s.startswith("first:"):
         col = s[6:]
-        if col in df:
-            ser = df[col].dropna()
-            return None if ser.empty else ser.iloc[0]
-        return None
+        if firsts is not None and col in firsts:
+            return firsts[col]
+        return _column_first(df, col)
     if s.startswith("$profile."):
-        key = s[len("$profile.") :]
-        # dotted access
-        parts = key.split(".")
-        cur: Any = profile
-        for p in parts:
-            if hasattr(cur, p):
-                cur = getattr(cur, p)
-            elif isinstance(cur, dict) and p in cur:
-                cur = cur[p]
-            else:
-                cur = None
-                break
-        return cur
+        return _walk_profile(profile, tuple(s[len("$profile.") :].split(".")))
     return s
 
 
+def _walk_profile(profile: Any, parts: tuple[str, ...]) -> Any:
+    # dotted access
+    cur: Any = profile
+    for p in parts:
+        if hasattr(cur, p):
+            cur = getattr(cur, p)
+        elif isinstance(cur, dict) and p in cur:
+            cur = cur[p]
+        else:
+            return None
+    return cur
+
+
+@dataclass(frozen=True, slots=True)
+class _CompiledCells:
+    """Mapping cells parsed once into resolvers plus the columns they aggregate."""
+
+    resolvers: tuple[tuple[str, CellResolver], ...]
+    sum_columns: frozenset[str]
+    first_columns: frozenset[str]
+
+
+def _compile_expr(expr: Any) -> tuple[CellResolver, str | None, str | None]:
+    """Return the resolver for *expr* and the ``sum``/``first`` column it reads."""
+
+    if expr is None or isinstance(expr, (int, float)):
+        return (lambda _ctx, value=expr: value), None, None
+    if not isinstance(expr, str):
+        return (lambda _ctx, value=str(expr): value), None, None
+    s = expr.strip()
+    if s.lower() == "today":
+        return (lambda ctx: ctx.today), None, None
+    if s.startswith("sum:"):
+        col = s[4:]
+        return (lambda ctx: ctx.sums[col]), col, None
+    if s.startswith("first:"):
+        col = s[6:]
+        return (lambda ctx: ctx.firsts[col]), None, col
+    if s.startswith("$profile."):
+        parts = tuple(s[len("$profile.") :].split("."))
+        return (lambda ctx: _walk_profile(ctx.profile, parts)), None, None
+    return (lambda _ctx, value=s: value), None, None
+
+
+def _compile_cells(cells: dict[str, Any]) -> _CompiledCells:
+    resolvers: list[tuple[str, CellResolver]] = []
+    sum_columns: set[str] = set()
+    first_columns: set[str] = set()
+    for cell, expr in cells.items():
+        resolver, sum_col, first_col = _compile_expr(expr)
+        resolvers.append((cell, resolver))
+        if sum_col is not None:
+            sum_columns.add(sum_col)
+        if first_col is not None:
+            first_columns.add(first_col)
+    return _CompiledCells(tuple(resolvers), frozenset(sum_columns), frozenset(first_columns))
+
+
+@functools.lru_cache(maxsize=16)
+def _load_compiled_mapping(
+    mapping_path: str, mtime_ns: int
+) -> tuple[dict[str, Any], _CompiledCells]:
+    """Load and compile a mapping file; the mtime key invalidates edited files."""
+
+    mapping = _load_mapping(Path(mapping_path))
+    return mapping, _compile_cells(mapping.get("cells", {}) or {})
+
+
+def _mapping_for(mapping_path: Path) -> tuple[dict[str, Any], _CompiledCells]:
+    if not mapping_path.exists():
+        raise FileNotFoundError(f"映射文件不存在: {mapping_path}")
+    return _load_compiled_mapping(str(mapping_path), mapping_path.stat().st_mtime_ns)
+
+
 def transform(
     input_path: Path,
     mapping_path: Path,
@@ -98,9 +217,9 @@ def transform(
     tmp_dir.mkdir(parents=True, exist_ok=True)
 
     _ensure_template(template_path)
-    mapping = _load_mapping(mapping_path)
+    mapping, compiled = _mapping_for(mapping_path)
 
-    df = pd.read_excel(input_path)
+    df = pd.read_excel(input_path, engine=EXCEL_ENGINE)
 
     # Optional simple cleaning per mapping
     ops = mapping.get("clean", {})
@@ -109,20 +228,25 @@ def transform(
     if ops.get("fillna"):
         df = df.fillna(ops["fillna"])  # type: ignore[arg-type]
 
-    wb = load_workbook(template_path)
+    wb = load_workbook(BytesIO(_template_bytes(str(template_path), template_path.stat().st_mtime_ns)))
     ws = wb.active
 
-    cells: dict[str, Any] = mapping.get("cells", {})
-    for cell, expr in cells.items():
-        val = _eval_value(expr, df, profile)
-        ws[cell] = val
-
-    # Save intermediate for debugging
-    tmp_output = tmp_dir / f"{profile.name}_intermediate.xlsx"
-    wb.save(tmp_output)
+    ctx = _EvalContext(
+        profile=profile,
+        today=dt.date.today().isoformat(),
+        sums={col: _column_sum(df, col) for col in compiled.sum_columns},
+        firsts={col: _column_first(df, col) for col in compiled.first_columns},
+    )
+    for cell, resolve in compiled.resolvers:
+        ws[cell] = resolve(ctx)
 
     # Final output
     output = out_dir / f"{profile.name}_output.xlsx"
     wb.save(output)
+
+    # Keep the intermediate for debugging; it has the same content, so copy it
+    # instead of serialising the workbook a second time.
+    tmp_output = tmp_dir / f"{profile.name}_intermediate.xlsx"
+    shutil.copyfile(output, tmp_output)
     return output
 
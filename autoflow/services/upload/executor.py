@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import platform
+import re
+import threading
 import time
 import uuid
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Literal, Sequence
+from typing import Callable, Literal, Sequence
 
 try:  # pragma: no cover - optional Playwright availability
     from playwright.sync_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
@@ -30,6 +33,8 @@ RETRYABLE_EXCEPTIONS = (
     ConnectionError,
 )
 
+_RETRY_REASON_RE = re.compile(r"timeout|超时|temporarily|网络|connection", re.IGNORECASE)
+
 
 @dataclass(slots=True)
 class UploadWorkItem:
@@ -37,6 +42,20 @@ class UploadWorkItem:
 
     file_path: Path
     name: str | None = None
+    sanitized: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.sanitized = DriveUploadExecutor._mask_filename(self.file_path)
+
+
+@dataclass(slots=True)
+class _ItemOutcome:
+    """Result of one work item, merged into the batch report in input order."""
+
+    requested_name: str
+    result: UploadResult | None = None
+    failure: dict[str, object] | None = None
+    failure_artifacts: dict[str, object] | None = None
 
 
 class DriveUploadExecutor:
@@ -51,6 +70,8 @@ class DriveUploadExecutor:
         max_retries: int = 2,
         base_backoff: float = 1.0,
         logger=None,
+        max_concurrency: int = 1,
+        uploader_factory: Callable[[], PlaywrightUploader] | None = None,
     ) -> None:
         self.flow = flow
         self.selectors = selectors
@@ -58,6 +79,11 @@ class DriveUploadExecutor:
         self.max_retries = max(0, max_retries)
         self.base_backoff = max(0.1, base_backoff)
         self.uploader = uploader or PlaywrightUploader(flow, selectors, logger=self.logger)
+        # Files are uploaded concurrently only with a factory, since one
+        # uploader drives one browser page and cannot be shared across threads.
+        # Uploaders built by the factory are closed once their batch is done.
+        self.max_concurrency = max(1, max_concurrency)
+        self.uploader_factory = uploader_factory
 
     # ------------------------------------------------------------------
     def run_batch(
@@ -79,55 +105,29 @@ class DriveUploadExecutor:
         failures: list[dict[str, object]] = []
         skipped: list[str] = []
         renamed: list[dict[str, str]] = []
+        upload_kwargs = {
+            "path": dest_path,
+            "conflict_strategy": conflict_strategy,
+            "create_missing": create_missing,
+            "export_results": export_results,
+        }
 
-        for item in files:
-            file_path = item.file_path
-            requested_name = item.name or file_path.name
-            sanitized_path = self._redact_path(file_path)
-            attempts = 0
-            while True:
-                attempts += 1
-                try:
-                    result = self.uploader.upload(
-                        path=dest_path,
-                        file_path=file_path,
-                        conflict_strategy=conflict_strategy,
-                        create_missing=create_missing,
-                        export_results=export_results,
-                    )
-                    if result.status == "uploaded":
-                        successes.append({"name": result.final_name or requested_name, "requested": requested_name})
-                        artifacts["success"][requested_name] = self._artifact_payload(result)
-                        if result.final_name and result.final_name != requested_name:
-                            renamed.append({"old": requested_name, "new": result.final_name})
-                    elif result.status == "skipped":
-                        skipped.append(requested_name)
-                        artifacts["success"][requested_name] = self._artifact_payload(result)
-                    break
-                except UploadFlowError as exc:  # noqa: BLE001
-                    reason = self._sanitize_reason(str(exc), file_path)
-                    if attempts <= self.max_retries and self._is_retryable(exc):
-                        delay = self.base_backoff * (2 ** (attempts - 1))
-                        self.logger.warning(
-                            "drive.executor transient_failure attempt=%s/%s file=%s reason=%s",
-                            attempts,
-                            self.max_retries + 1,
-                            sanitized_path,
-                            reason,
-                        )
-                        time.sleep(delay)
-                        continue
-
-                    failure_record: dict[str, object] = {
-                        "name": requested_name,
-                        "reason": reason,
-                    }
-                    result_obj = exc.result
-                    if result_obj is not None:
-                        failure_record["artifacts"] = self._artifact_payload(result_obj)
-                        artifacts["failures"][requested_name] = self._artifact_payload(result_obj)
-                    failures.append(failure_record)
-                    break
+        for outcome in self._run_items(files, upload_kwargs):
+            requested_name = outcome.requested_name
+            if outcome.failure is not None:
+                if outcome.failure_artifacts is not None:
+                    artifacts["failures"][requested_name] = outcome.failure_artifacts
+                failures.append(outcome.failure)
+                continue
+            result = outcome.result
+            if result.status == "uploaded":
+                successes.append({"name": result.final_name or requested_name, "requested": requested_name})
+                artifacts["success"][requested_name] = self._artifact_payload(result)
+                if result.final_name and result.final_name != requested_name:
+                    renamed.append({"old": requested_name, "new": result.final_name})
+            elif result.status == "skipped":
+                skipped.append(requested_name)
+                artifacts["success"][requested_name] = self._artifact_payload(result)
 
         duration = time.monotonic() - start
         report: dict[str, object] = {
@@ -148,15 +148,94 @@ class DriveUploadExecutor:
         return report
 
     # ------------------------------------------------------------------
+    def _run_items(
+        self, files: Sequence[UploadWorkItem], upload_kwargs: dict[str, object]
+    ) -> list[_ItemOutcome]:
+        """Upload every item and return outcomes in input order."""
+
+        workers = min(self.max_concurrency, len(files))
+        if workers <= 1 or self.uploader_factory is None:
+            return [self._upload_item(self.uploader, item, upload_kwargs) for item in files]
+
+        # Playwright sync objects are bound to the thread that created them,
+        # so each worker thread builds and keeps its own uploader.
+        local = threading.local()
+        factory = self.uploader_factory
+
+        def _worker(item: UploadWorkItem) -> _ItemOutcome:
+            uploader = getattr(local, "uploader", None)
+            if uploader is None:
+                uploader = local.uploader = factory()
+            return self._upload_item(uploader, item, upload_kwargs)
+
+        def _close_worker(barrier: threading.Barrier) -> None:
+            # Holding every task at the barrier makes each pool thread take exactly one.
+            barrier.wait()
+            uploader = getattr(local, "uploader", None)
+            if uploader is None:
+                return
+            local.uploader = None
+            try:
+                uploader.close()
+            except Exception:  # noqa: BLE001
+                self.logger.warning("drive.executor failed to close uploader", exc_info=True)
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="drive-upload") as pool:
+            try:
+                return list(pool.map(_worker, files))
+            finally:
+                # Close each uploader on the thread that created it, before the pool shuts down.
+                barrier = threading.Barrier(workers)
+                list(pool.map(_close_worker, [barrier] * workers))
+
+    def _upload_item(
+        self, uploader: PlaywrightUploader, item: UploadWorkItem, upload_kwargs: dict[str, object]
+    ) -> _ItemOutcome:
+        """Upload one file, retrying transient failures with exponential backoff."""
+
+        file_path = item.file_path
+        requested_name = item.name or file_path.name
+        sanitized_path = self._redact_path(item)
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                result = uploader.upload(file_path=file_path, **upload_kwargs)
+                return _ItemOutcome(requested_name=requested_name, result=result)
+            except UploadFlowError as exc:  # noqa: BLE001
+                reason = self._sanitize_reason(str(exc), file_path, sanitized_path)
+                if attempts <= self.max_retries and self._is_retryable(exc):
+                    delay = self.base_backoff * (2 ** (attempts - 1))
+                    self.logger.warning(
+                        "drive.executor transient_failure attempt=%s/%s file=%s reason=%s",
+                        attempts,
+                        self.max_retries + 1,
+                        sanitized_path,
+                        reason,
+                    )
+                    time.sleep(delay)
+                    continue
+
+                failure_record: dict[str, object] = {
+                    "name": requested_name,
+                    "reason": reason,
+                }
+                failure_artifacts = None
+                result_obj = exc.result
+                if result_obj is not None:
+                    failure_record["artifacts"] = self._artifact_payload(result_obj)
+                    failure_artifacts = self._artifact_payload(result_obj)
+                return _ItemOutcome(
+                    requested_name=requested_name,
+                    failure=failure_record,
+                    failure_artifacts=failure_artifacts,
+                )
+
     def _is_retryable(self, exc: UploadFlowError) -> bool:
         cause = exc.__cause__ or exc.__context__ or exc
         if isinstance(cause, RETRYABLE_EXCEPTIONS):
             return True
-        reason = (str(exc) or "").lower()
-        for keyword in ("timeout", "超时", "temporarily", "网络", "connection"):
-            if keyword in reason:
-                return True
-        return False
+        return _RETRY_REASON_RE.search(str(exc)) is not None
 
     @staticmethod
     def _artifact_payload(result: UploadResult | None) -> dict[str, object]:
@@ -185,12 +264,13 @@ class DriveUploadExecutor:
         return info
 
     @staticmethod
-    def _redact_path(path: Path) -> str:
-        return DriveUploadExecutor._mask_filename(path)
+    def _redact_path(item: UploadWorkItem) -> str:
+        return item.sanitized
 
-    def _sanitize_reason(self, message: str, file_path: Path) -> str:
-        masked_name = self._mask_filename(file_path)
-        sanitized = message.replace(str(file_path), masked_name)
+    @staticmethod
+    def _sanitize_reason(message: str, file_path: Path, masked_name: str) -> str:
+        full_path = str(file_path)
+        sanitized = message.replace(full_path, masked_name)
         sanitized = sanitized.replace(file_path.name, masked_name)
         return sanitized.replace("\n", " ").strip()
 
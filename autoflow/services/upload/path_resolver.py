@@ -4,24 +4,84 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import Any, Iterable, Mapping
-
-try:  # pragma: no cover - typing aid when Playwright is available
-    from playwright.sync_api import FrameLocator, Locator, Page, TimeoutError as PlaywrightTimeoutError
-except Exception:  # pragma: no cover - fallback for tests without Playwright
-    FrameLocator = Any  # type: ignore[misc,assignment]
-    Locator = Any  # type: ignore[misc,assignment]
-    Page = Any  # type: ignore[misc,assignment]
-
-    class PlaywrightTimeoutError(Exception):  # type: ignore[override]
-        """Placeholder timeout error when Playwright is absent."""
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Mapping
 
 from autoflow.config import DriveUploadSelectors, RowSelectorSet, SelectorSet, SpaceDefinition
 from autoflow.core.errors import BrowserError
 from autoflow.core.logger import get_logger
 
+if TYPE_CHECKING:  # pragma: no cover - type hints only
+    from playwright.sync_api import FrameLocator, Locator, Page
+
+
+class _TimeoutPlaceholder(Exception):
+    """Placeholder timeout error when Playwright is absent."""
 
-_ILLEGAL_CHARS = re.compile(r'[<>:"|?*]')
+
+_PLAYWRIGHT_TIMEOUT_ERROR: type[BaseException] | None = None
+
+
+def _get_timeout_error() -> type[BaseException]:
+    """Return Playwright's timeout error, importing Playwright on first use."""
+
+    global _PLAYWRIGHT_TIMEOUT_ERROR
+    if _PLAYWRIGHT_TIMEOUT_ERROR is None:
+        try:
+            from playwright.sync_api import TimeoutError as timeout_error
+        except Exception:  # pragma: no cover - fallback for tests without Playwright
+            timeout_error = _TimeoutPlaceholder
+        _PLAYWRIGHT_TIMEOUT_ERROR = timeout_error
+    return _PLAYWRIGHT_TIMEOUT_ERROR
+
+
+# Deletes the characters DingTalk rejects in folder names; a segment is legal
+# when translating it leaves it unchanged.
+_ILLEGAL_TABLE = str.maketrans("", "", '<>:"|?*')
+_NAME_TEMPLATE_KEYS = frozenset({"name_template", "name_regex_template", "test_id_template"})
+
+
+@lru_cache(maxsize=256)
+def _compiled(pattern: str) -> re.Pattern[str]:
+    """Return a compiled selector regex, shared across locator builds."""
+
+    return re.compile(pattern)
+
+
+# Non-role locator builders in priority order; ``selector`` wins over ``css``.
+_LOCATOR_BUILDERS: dict[str, Callable[[Any, Any], Any]] = {
+    "test_id": lambda container, value: container.get_by_test_id(value),
+    "text": lambda container, value: container.get_by_text(value, exact=True),
+    "text_regex": lambda container, value: container.get_by_text(_compiled(value)),
+    "label": lambda container, value: container.get_by_label(value),
+    "label_regex": lambda container, value: container.get_by_label(_compiled(value)),
+    "placeholder": lambda container, value: container.get_by_placeholder(value),
+    "placeholder_regex": lambda container, value: container.get_by_placeholder(_compiled(value)),
+    "selector": lambda container, value: container.locator(value),
+    "css": lambda container, value: container.locator(value),
+}
+_LOCATOR_PRIORITY = {key: rank for rank, key in enumerate(_LOCATOR_BUILDERS)}
+
+
+def _index_candidates(selectors: DriveUploadSelectors) -> dict[int, tuple[Mapping[str, Any], ...]]:
+    """Map each configured selector set, by id, to its primary + fallback specs.
+
+    Callers keep ``selectors`` alive alongside the index, so the ids stay valid.
+    """
+
+    return {
+        id(selector_set): (selector_set.primary, *selector_set.fallbacks)
+        for group in (
+            selectors.frames,
+            selectors.actions,
+            selectors.inputs,
+            selectors.listing,
+            selectors.conflicts,
+            selectors.exports,
+            selectors.metadata,
+        )
+        for selector_set in group.values()
+    }
 
 
 class PathResolverError(BrowserError):
@@ -44,6 +104,29 @@ class PathPlan:
     folders: tuple[str, ...]
 
 
+@lru_cache(maxsize=256)
+def _parse_path_cached(path: str) -> PathPlan:
+    """Validate and split a non-empty drive path; plans are frozen and shared."""
+
+    if path.endswith("/"):
+        raise PathValidationError("路径尾部存在空段")
+    cleaned_segments = [segment.strip() for segment in path.split("/")]
+    if "" in cleaned_segments:
+        raise PathValidationError("路径包含空段")
+
+    joined = "".join(cleaned_segments)
+    if joined.translate(_ILLEGAL_TABLE) != joined:
+        bad = next(seg for seg in cleaned_segments if seg.translate(_ILLEGAL_TABLE) != seg)
+        raise PathValidationError(f"路径段包含非法字符: {bad}")
+
+    space_label, *folder_list = cleaned_segments
+    folders = tuple(folder_list)
+    if len(folders) != len(set(folders)):
+        duplicate = next(seg for idx, seg in enumerate(folders) if seg in folders[:idx])
+        raise PathValidationError(f"路径存在重复段: {duplicate}")
+    return PathPlan(space_label=space_label, folders=folders)
+
+
 class PathResolver:
     """Validate and traverse DingTalk drive folder paths via Playwright."""
 
@@ -53,12 +136,27 @@ class PathResolver:
         selectors: DriveUploadSelectors,
         *,
         timeout_ms: int = 10_000,
+        probe_timeout_ms: int = 500,
         logger=None,
     ) -> None:
         self.page = page
         self.selectors = selectors
+        # ``timeout_ms`` bounds real actions; best-effort probes use the short budget
+        # so a missing fallback candidate does not stall the whole descent.
         self.timeout_ms = timeout_ms
+        self.probe_timeout_ms = min(probe_timeout_ms, timeout_ms)
         self.logger = logger or get_logger()
+        # Workspace iframe located for ``_frame_url``; reused until the page navigates.
+        self._frame_cache: FrameLocator | None = None
+        self._frame_url: str | None = None
+        self._last_good_row_spec_idx: int | None = None
+        self._candidate_index = _index_candidates(selectors)
+        self._url_tokens_by_space: dict[str, tuple[str, ...]] = {}
+        self._label_index: dict[str, SpaceDefinition] = {}
+        for space in selectors.spaces.values():
+            for label in space.labels:
+                # First configured space wins, as with the original linear scan.
+                self._label_index.setdefault(label, space)
 
     # ------------------------------------------------------------------
     def resolve(self, path: str, *, create_missing: bool = False) -> None:
@@ -84,80 +182,81 @@ class PathResolver:
 
         return self._ensure_workspace_frame()
 
+    def invalidate_frame(self) -> None:
+        """Forget the cached workspace frame, e.g. after navigating the page."""
+
+        self._frame_cache = None
+        self._frame_url = None
+
     # ------------------------------------------------------------------
     def _parse_path(self, path: str) -> PathPlan:
         if not path or not isinstance(path, str):
             raise PathValidationError("路径不能为空")
-        if path.endswith("/"):
-            raise PathValidationError("路径尾部存在空段")
-        raw_segments = path.split("/")
-        if any(segment.strip() == "" for segment in raw_segments):
-            raise PathValidationError("路径包含空段")
-
-        segments: list[str] = []
-        seen_folders: set[str] = set()
-        for idx, segment in enumerate(raw_segments):
-            cleaned = segment.strip()
-            if _ILLEGAL_CHARS.search(cleaned):
-                raise PathValidationError(f"路径段包含非法字符: {cleaned}")
-            if idx > 0:
-                if cleaned in seen_folders:
-                    raise PathValidationError(f"路径存在重复段: {cleaned}")
-                seen_folders.add(cleaned)
-            segments.append(cleaned)
-
-        if len(segments) < 1:
-            raise PathValidationError("路径必须包含盘别")
-        space_label = segments[0]
-        folders = tuple(segments[1:])
-        return PathPlan(space_label=space_label, folders=folders)
+        return _parse_path_cached(path)
 
     def _match_space(self, label: str) -> SpaceDefinition:
-        for space in self.selectors.spaces.values():
-            if label in space.labels:
-                return space
-        raise PathValidationError(f"路径首段应为已配置的盘别，未识别: {label}")
+        space = self._label_index.get(label)
+        if space is None:
+            raise PathValidationError(f"路径首段应为已配置的盘别，未识别: {label}")
+        return space
 
     def _select_space(self, label: str, space: SpaceDefinition) -> None:
         page = self.page
-        current_url = getattr(page, "url", "")
+        current_url = getattr(page, "url", "") or ""
+        if any(token in current_url for token in self._space_url_tokens(space)):
+            self.logger.debug("drive.path_resolver already_in_space label=%s", label)
+            return
         for anchor in space.anchors:
-            url_contains = anchor.get("url_contains")
-            if url_contains and url_contains in current_url:
-                self.logger.debug("drive.path_resolver already_in_space label=%s", label)
-                return
             locator = self._build_locator(page, anchor)
             if locator is None:
                 continue
-            if self._click_locator(locator):
+            if self._click_locator(locator, scroll_first=bool(anchor.get("scroll_first"))):
                 return
         raise PathNotFoundError(f"无法定位盘别入口: {label}")
 
+    def _space_url_tokens(self, space: SpaceDefinition) -> tuple[str, ...]:
+        tokens = self._url_tokens_by_space.get(space.key)
+        if tokens is None:
+            tokens = tuple(anchor["url_contains"] for anchor in space.anchors if anchor.get("url_contains"))
+            self._url_tokens_by_space[space.key] = tokens
+        return tokens
+
     def _ensure_workspace_frame(self) -> FrameLocator:
+        current_url = getattr(self.page, "url", None)
+        if self._frame_cache is not None and current_url == self._frame_url:
+            return self._frame_cache
         frame_set = self.selectors.frames.get("drive_workspace")
         if frame_set is None:
             raise PathResolverError("未配置 drive_workspace frame 选择器")
-        for candidate in self._iter_selector_candidates(frame_set):
+        for candidate in self._candidates(frame_set):
             selector = candidate.get("selector")
             if not selector:
                 continue
             try:
                 frame_locator = self.page.frame_locator(selector)
                 frame_locator.locator("body").wait_for(state="attached", timeout=self.timeout_ms)
-                return frame_locator
             except Exception:  # noqa: BLE001
                 continue
+            self._frame_cache = frame_locator
+            self._frame_url = current_url
+            return frame_locator
         raise PathNotFoundError("无法定位网盘工作区 iframe")
 
     def _enter_existing_folder(self, frame: FrameLocator, name: str) -> bool:
         listing = self.selectors.listing.get("row_by_name")
         if listing is None:
             raise PathResolverError("未配置 row_by_name 选择器")
-        for spec in self._iter_row_candidates(listing, name):
+        candidates = list(enumerate(self._iter_row_candidates(listing, name)))
+        last_good = self._last_good_row_spec_idx
+        if last_good is not None and last_good < len(candidates):
+            # The row layout rarely changes within a drive, so try the last winner first.
+            candidates.insert(0, candidates.pop(last_good))
+        for idx, spec in candidates:
             locator = self._build_locator(frame, spec)
-            if locator is None:
+            if locator is None or not self._locator_present(locator):
                 continue
-            if self._click_locator(locator):
+            if self._click_locator(locator, scroll_first=bool(spec.get("scroll_first"))):
+                self._last_good_row_spec_idx = idx
                 return True
         return False
 
@@ -179,18 +278,18 @@ class PathResolver:
 
     # ------------------------------------------------------------------
     def _click_using_selector_set(self, container: Any, selector_set: SelectorSet) -> bool:
-        for candidate in self._iter_selector_candidates(selector_set):
+        for candidate in self._candidates(selector_set):
             locator = self._build_locator(container, candidate)
-            if locator is None:
+            if locator is None or not self._locator_present(locator):
                 continue
-            if self._click_locator(locator):
+            if self._click_locator(locator, scroll_first=bool(candidate.get("scroll_first"))):
                 return True
         return False
 
     def _fill_input(self, container: Any, selector_set: SelectorSet, value: str) -> bool:
-        for candidate in self._iter_selector_candidates(selector_set):
+        for candidate in self._candidates(selector_set):
             locator = self._build_locator(container, candidate)
-            if locator is None:
+            if locator is None or not self._locator_present(locator):
                 continue
             try:
                 locator.click()
@@ -203,16 +302,27 @@ class PathResolver:
                 continue
         return False
 
-    def _click_locator(self, locator: Locator) -> bool:
-        try:
-            locator.wait_for(state="visible", timeout=self.timeout_ms)
-        except (PlaywrightTimeoutError, AttributeError):
-            pass
+    def _locator_present(self, locator: Locator) -> bool:
+        """Cheaply tell whether a candidate matches anything before acting on it."""
+
         try:
-            locator.scroll_into_view_if_needed(timeout=self.timeout_ms)
+            if locator.count() > 0:
+                return True
+            # Give freshly rendered rows a short grace period instead of the full timeout.
+            locator.first.wait_for(state="attached", timeout=self.probe_timeout_ms)
+            return True
+        except _get_timeout_error():
+            return False
         except Exception:  # noqa: BLE001
-            pass
+            # Unknown state: let the real action decide with its own timeout.
+            return True
+
+    def _click_locator(self, locator: Locator, *, scroll_first: bool = False) -> bool:
+        # click() already waits for the element to be visible, stable and in view;
+        # specs flagged ``scroll_first`` (virtualised lists) get an explicit nudge.
         try:
+            if scroll_first:
+                locator.scroll_into_view_if_needed(timeout=self.probe_timeout_ms)
             locator.click(timeout=self.timeout_ms)
             return True
         except Exception:  # noqa: BLE001
@@ -226,47 +336,40 @@ class PathResolver:
             if name is not None:
                 return container.get_by_role(role, name=name)
             if name_regex is not None:
-                return container.get_by_role(role, name=re.compile(name_regex))
-        if spec.get("test_id"):
-            return container.get_by_test_id(spec["test_id"])
-        if spec.get("text"):
-            return container.get_by_text(spec["text"], exact=True)
-        if spec.get("text_regex"):
-            return container.get_by_text(re.compile(spec["text_regex"]))
-        if spec.get("label"):
-            return container.get_by_label(spec["label"])
-        if spec.get("label_regex"):
-            return container.get_by_label(re.compile(spec["label_regex"]))
-        if spec.get("placeholder"):
-            return container.get_by_placeholder(spec["placeholder"])
-        if spec.get("placeholder_regex"):
-            return container.get_by_placeholder(re.compile(spec["placeholder_regex"]))
-        selector = spec.get("selector") or spec.get("css")
-        if selector:
-            return container.locator(selector)
+                return container.get_by_role(role, name=_compiled(name_regex))
+        # Pick the highest-priority locator key the spec actually sets; specs hold
+        # one or two keys, so this beats probing every supported key in turn.
+        keys = [key for key, value in spec.items() if value and key in _LOCATOR_BUILDERS]
+        if keys:
+            key = min(keys, key=_LOCATOR_PRIORITY.__getitem__)
+            return _LOCATOR_BUILDERS[key](container, spec[key])
         return None
 
     # ------------------------------------------------------------------
-    @staticmethod
-    def _iter_selector_candidates(selector_set: SelectorSet) -> Iterable[Mapping[str, Any]]:
-        yield selector_set.primary
-        yield from selector_set.fallbacks
+    def _candidates(self, selector_set: SelectorSet | RowSelectorSet) -> tuple[Mapping[str, Any], ...]:
+        candidates = self._candidate_index.get(id(selector_set))
+        if candidates is None:
+            return (selector_set.primary, *selector_set.fallbacks)
+        return candidates
 
-    @staticmethod
-    def _iter_row_candidates(selector_set: RowSelectorSet, name: str) -> Iterable[Mapping[str, Any]]:
-        for spec in PathResolver._iter_selector_candidates(selector_set):
-            yield PathResolver._apply_name_template(spec, name)
+    def _iter_row_candidates(self, selector_set: RowSelectorSet, name: str) -> Iterable[Mapping[str, Any]]:
+        escaped = re.escape(name)
+        for spec in self._candidates(selector_set):
+            yield self._apply_name_template(spec, name, escaped)
 
     @staticmethod
-    def _apply_name_template(spec: Mapping[str, Any], name: str) -> Mapping[str, Any]:
-        data = dict(spec)
-        template = data.pop("name_template", None)
+    def _apply_name_template(spec: Mapping[str, Any], name: str, escaped: str) -> Mapping[str, Any]:
+        if _NAME_TEMPLATE_KEYS.isdisjoint(spec):
+            # Plain specs are only read by _build_locator, so they need no copy.
+            return spec
+        data = {key: value for key, value in spec.items() if key not in _NAME_TEMPLATE_KEYS}
+        template = spec.get("name_template")
         if template:
             data["name"] = template.format(name=name)
-        regex_template = data.pop("name_regex_template", None)
+        regex_template = spec.get("name_regex_template")
         if regex_template:
-            data["name_regex"] = regex_template.format(name=re.escape(name))
-        test_id_template = data.pop("test_id_template", None)
+            data["name_regex"] = regex_template.format(name=escaped)
+        test_id_template = spec.get("test_id_template")
         if test_id_template:
             data["test_id"] = test_id_template.format(name=name)
         return data
@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import re
+import threading
 import time
-from dataclasses import dataclass
-from pathlib import Path
-from typing import TYPE_CHECKING, Iterable, Literal, Mapping
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path, PurePosixPath
+from queue import SimpleQueue
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Iterable, Literal, Mapping, Sequence
 
 try:  # pragma: no cover - simplify type checking when Playwright is absent
     from playwright.sync_api import (
@@ -32,12 +36,40 @@ except Exception:  # pragma: no cover - provide fallbacks for tests without Play
 from autoflow.config import DriveUploadSelectors, RowSelectorSet, SelectorSet
 from autoflow.core.errors import BrowserError
 from autoflow.core.logger import get_logger
-from .path_resolver import PathResolver
+from .path_resolver import PathResolver, _compiled, _index_candidates
 
 if TYPE_CHECKING:  # pragma: no cover - type hints only
     from browser.playwright_flow import PlaywrightFlow
 
 
+RELOAD_CHECK_TIMEOUT_MS = 2_000
+
+CONSOLE_DRAIN_TIMEOUT_S = 1.0
+_CONSOLE_DONE = object()
+
+# Runs of three or more digits (ids, phone numbers) are masked in captured console logs.
+# A precompiled sub() measured ~3x faster than a per-character Python scan.
+_DIGIT_RUN_RE = re.compile(r"\d{3,}")
+
+
+SPEC_CACHE_SIZE = 1024
+# (id(spec), name) -> (spec, read-only resolved spec). The entry keeps the spec alive,
+# so its id cannot be reused while cached; the dict is simply reset when full.
+_SPEC_CACHE: dict[tuple[int, str], tuple[Mapping[str, object], Mapping[str, object]]] = {}
+
+
+@lru_cache(maxsize=1024)
+def _escape_name(name: str) -> str:
+    return re.escape(name)
+
+
+@lru_cache(maxsize=1024)
+def _format_template(template: str, name: str) -> str:
+    """Fill a row selector template; polls rebuild the same rows many times."""
+
+    return template.format(name=name)
+
+
 @dataclass(slots=True)
 class ConflictResolution:
     """Conflict-dialog handling outcome."""
@@ -57,11 +89,14 @@ class TraceSession:
 
 @dataclass(slots=True)
 class ConsoleCaptureState:
-    """In-memory buffer for capturing browser console output."""
+    """Browser console capture buffered until the upload finishes."""
 
     enabled: bool
-    entries: list[str]
     handler: object | None
+    # Raw (timestamp, type, text) events, formatted into ``lines`` by ``worker``.
+    events: SimpleQueue | None = None
+    worker: threading.Thread | None = None
+    lines: list[str] = field(default_factory=list)
 
 
 @dataclass(slots=True)
@@ -98,15 +133,40 @@ class PlaywrightUploader:
         *,
         timeout_ms: int = 12_000,
         toast_timeout_ms: int | None = None,
+        network_idle_timeout_ms: int | None = None,
+        verify_after_reload: bool = False,
+        capture_console_on_success: bool = False,
         logger=None,
     ) -> None:
         self.flow = flow
         self.selectors = selectors
+        self._candidate_index = _index_candidates(selectors)
         self.timeout_ms = timeout_ms
         self.toast_timeout_ms = toast_timeout_ms or max(timeout_ms, 12_000)
+        self.network_idle_timeout_ms = network_idle_timeout_ms or timeout_ms
+        # The success toast and listing were already confirmed before the reload, so by
+        # default the reloaded listing gets a short presence check, not a full wait.
+        self.verify_after_reload = verify_after_reload
         self.logger = logger or get_logger()
+        self.capture_console_on_success = capture_console_on_success
+        # (workspace frame, file names known to exist in it); skip checks consult it first.
+        self._listing_cache: tuple[object, set[str]] | None = None
+        # Timestamp shared by the evidence files of the upload in progress.
+        self._upload_stamp: str | None = None
+        # (id(page), drive path) -> (resolver, workspace frame, page URL after resolving).
+        # The resolver keeps the page alive, so its id cannot be reused while cached.
+        self._resolver_cache: dict[tuple[int, str], tuple[PathResolver, FrameLocator, object]] = {}
+        self._success_patterns = tuple(re.compile(pattern) for pattern in selectors.toasts.get("success", ()))
+        self._failure_patterns = tuple(re.compile(pattern) for pattern in selectors.toasts.get("failure", ()))
 
     # ------------------------------------------------------------------
+    def close(self) -> None:
+        """Drop cached page state and close the browser behind ``flow``."""
+
+        self._resolver_cache.clear()
+        self._listing_cache = None
+        self.flow.close()
+
     def upload(
         self,
         *,
@@ -121,6 +181,7 @@ class PlaywrightUploader:
 
         requested_name = file_path.name
         page = self.flow.ensure_ready()
+        self._upload_stamp = time.strftime("%Y%m%d-%H%M%S")
         trace_session = self._start_trace(page)
         downloads: list[Path] = []
         console_state = self._start_console_capture(page)
@@ -143,9 +204,7 @@ class PlaywrightUploader:
         applied_strategy = conflict_strategy
 
         try:
-            resolver = PathResolver(page, self.selectors, timeout_ms=self.timeout_ms, logger=self.logger)
-            resolver.resolve(path, create_missing=create_missing)
-            frame = resolver.workspace_frame()
+            frame = self._resolve_workspace(page, path, create_missing=create_missing)
 
             if conflict_strategy == "skip" and self._file_exists(frame, requested_name):
                 self.logger.info(
@@ -156,7 +215,7 @@ class PlaywrightUploader:
                 result.final_name = requested_name
                 return result
 
-            if not self._perform_upload(frame, file_path):
+            if not self._perform_upload(page, frame, file_path):
                 raise UploadFlowError("未能定位上传入口或设置文件")
 
             conflict_resolution = self._handle_conflict_dialog(page, conflict_strategy, requested_name)
@@ -169,6 +228,10 @@ class PlaywrightUploader:
                 self._wait_for_toasts(page)
                 final_name = self._await_listing(page, frame, final_name, requested_name)
                 frame, final_name = self._reload_and_verify(page, path, final_name)
+                known = self._known_files(frame)
+                known.add(final_name)
+                if applied_strategy != "rename":
+                    known.add(requested_name)
                 if export_results:
                     exported = self._download_results(page, frame)
                     if exported:
@@ -177,49 +240,272 @@ class PlaywrightUploader:
                 result.final_name = final_name
         except Exception as exc:  # noqa: BLE001
             error = exc
+            # The page may be anywhere after a failure; resolve from scratch next time.
+            self._resolver_cache.clear()
+            self._listing_cache = None
             result.status = "failed"
             result.message = str(exc)
             self.logger.error("drive.uploader upload failed", exc_info=True)
         finally:
-            screenshot_label = "success" if result.status != "failed" else "failed"
-            result.screenshot = self._capture_screenshot(page, screenshot_label)
-            if trace_session.active:
-                trace_path = self._stop_trace(page, trace_session, error is not None)
-                if trace_path is not None:
-                    result.trace = trace_path
-            console_log_path = self._finalize_console_capture(page, console_state)
-            if console_log_path is not None:
-                result.console_log = console_log_path
+            result.screenshot, result.trace, result.console_log = self._collect_evidence(
+                page, trace_session, console_state, failed=result.status == "failed", error=error
+            )
             result.downloads = tuple(downloads)
             result.conflict_strategy = applied_strategy
+            self._upload_stamp = None
 
         if error:
-            suffix = []
-            if result.screenshot:
-                suffix.append(f"截图: {result.screenshot}")
-            if result.trace:
-                suffix.append(f"trace: {result.trace}")
-            if result.console_log:
-                suffix.append(f"console: {result.console_log}")
-            message = result.message or "上传失败"
-            if suffix:
-                message = f"{message} ({'; '.join(suffix)})"
-            raise UploadFlowError(message, result=result) from error
+            raise UploadFlowError(self._failure_message(result), result=result) from error
 
         return result
 
+    def upload_many(
+        self,
+        *,
+        path: str,
+        file_paths: Sequence[Path],
+        conflict_strategy: Literal["skip", "overwrite", "rename"] = "skip",
+        create_missing: bool = False,
+        export_results: bool = False,
+    ) -> list[UploadResult]:
+        """Upload several files into one folder with a single file selection.
+
+        The folder is resolved once and all files are handed to a ``multiple``
+        file input in one ``set_input_files`` call, sharing one trace, console
+        capture and screenshot. Falls back to one :meth:`upload` per file when
+        the input only takes single files or the rename strategy is requested,
+        since rename dialogs cannot be attributed to a file in a batch. A skip
+        dialog that names no single pending file sends the rest of the batch
+        through :meth:`upload` as well.
+        """
+
+        if conflict_strategy not in {"skip", "overwrite", "rename"}:
+            raise ValueError(f"未知的冲突策略: {conflict_strategy}")
+        files = list(file_paths)
+
+        def _one_by_one(batch: Sequence[Path]) -> list[UploadResult]:
+            return [
+                self.upload(
+                    path=path,
+                    file_path=file_path,
+                    conflict_strategy=conflict_strategy,
+                    create_missing=create_missing,
+                    export_results=export_results,
+                )
+                for file_path in batch
+            ]
+
+        if len(files) <= 1 or conflict_strategy == "rename":
+            return _one_by_one(files)
+
+        page = self.flow.ensure_ready()
+        self._upload_stamp = time.strftime("%Y%m%d-%H%M%S")
+        trace_session = self._start_trace(page)
+        console_state = self._start_console_capture(page)
+        downloads: list[Path] = []
+        results = [
+            UploadResult(
+                status="failed",
+                requested_path=path,
+                requested_name=file_path.name,
+                final_name=None,
+                conflict_strategy=conflict_strategy,
+                screenshot=None,
+                trace=None,
+                downloads=(),
+            )
+            for file_path in files
+        ]
+        # Files handed back to upload() one at a time once the batch cannot account for them.
+        retry: list[Path] = []
+        error: Exception | None = None
+        try:
+            frame = self._resolve_workspace(page, path, create_missing=create_missing)
+            multi_input = self._multi_file_input(frame)
+            pending: list[tuple[Path, UploadResult]] = []
+            if multi_input is None:
+                retry = files
+            else:
+                for file_path, result in zip(files, results):
+                    if conflict_strategy == "skip" and self._file_exists(frame, result.requested_name):
+                        result.status = "skipped"
+                        result.final_name = result.requested_name
+                    else:
+                        pending.append((file_path, result))
+            if pending:
+                multi_input.set_input_files([str(file_path) for file_path, _ in pending])
+                self.logger.info("drive.uploader %s files selected via multiple input", len(pending))
+                pending, unattributed = self._answer_batch_conflicts(page, conflict_strategy, pending)
+                if unattributed:
+                    self.logger.warning("drive.uploader skipped conflict not tied to a file, uploading one by one")
+                    self._listing_cache = None
+                    retry = [file_path for file_path, _ in pending]
+                    pending = []
+            if pending:
+                pending_results = [result for _, result in pending]
+                self._wait_for_toasts(page)
+                for result in pending_results:
+                    result.final_name = self._await_listing(page, frame, result.requested_name, result.requested_name)
+                first = pending_results[0]
+                frame, first.final_name = self._reload_and_verify(page, path, first.requested_name)
+                for result in pending_results[1:]:
+                    result.final_name = self._await_listing(page, frame, result.requested_name, result.requested_name)
+                if export_results:
+                    exported = self._download_results(page, frame)
+                    if exported:
+                        downloads.append(exported)
+                known = self._known_files(frame)
+                for result in pending_results:
+                    result.status = "uploaded"
+                    known.update({result.requested_name, result.final_name})
+        except Exception as exc:  # noqa: BLE001
+            error = exc
+            retry = []
+            self._resolver_cache.clear()
+            self._listing_cache = None
+            self.logger.error("drive.uploader batch upload failed", exc_info=True)
+        finally:
+            if retry:
+                # Every retried file records its own evidence in upload().
+                self._finalize_console_capture(page, console_state, persist=False)
+                self._stop_trace(page, trace_session, False)
+            else:
+                screenshot, trace_path, console_log_path = self._collect_evidence(
+                    page,
+                    trace_session,
+                    console_state,
+                    failed=any(result.status == "failed" for result in results),
+                    error=error,
+                )
+                for result in results:
+                    result.screenshot = screenshot
+                    result.trace = trace_path
+                    result.console_log = console_log_path
+                    if result.status == "uploaded":
+                        result.downloads = tuple(downloads)
+                    elif result.status == "failed":
+                        result.message = str(error) if error else "上传失败"
+            self._upload_stamp = None
+
+        if error:
+            first_failed = next((result for result in results if result.status == "failed"), results[0])
+            raise UploadFlowError(self._failure_message(first_failed), result=first_failed) from error
+        if retry:
+            retried = dict(zip(retry, _one_by_one(retry)))
+            results = [retried.get(file_path, result) for file_path, result in zip(files, results)]
+        return results
+
+    def _answer_batch_conflicts(
+        self,
+        page: Page,
+        strategy: str,
+        pending: list[tuple[Path, UploadResult]],
+    ) -> tuple[list[tuple[Path, UploadResult]], bool]:
+        """Answer the conflict dialogs raised by a batch selection.
+
+        A dialog answered with skip is tied to the pending file named in its text,
+        which is then marked skipped. Returns the files still being uploaded and
+        whether a skipped dialog could not be tied to exactly one file.
+        """
+
+        dialog_set = self.selectors.conflicts.get("dialog")
+        if not dialog_set:
+            return pending, False
+        remaining = list(pending)
+        unattributed = False
+        for _ in pending:
+            dialog = self._wait_for_locator(page, dialog_set, timeout_ms=3000)
+            if dialog is None:
+                break
+            subject = self._dialog_subject(dialog, [result.requested_name for _, result in remaining])
+            fallback_name = remaining[0][1].requested_name if remaining else ""
+            resolution = self._handle_conflict_dialog(page, strategy, subject or fallback_name)
+            if resolution.status != "skipped":
+                continue
+            if subject is None:
+                unattributed = True
+                continue
+            for entry in remaining:
+                if entry[1].requested_name == subject:
+                    entry[1].status = "skipped"
+                    entry[1].final_name = subject
+                    remaining.remove(entry)
+                    break
+        return remaining, unattributed
+
+    @staticmethod
+    def _dialog_subject(dialog: Locator, names: Sequence[str]) -> str | None:
+        """Return the single file name mentioned in a conflict dialog, if any."""
+
+        try:
+            text = dialog.first.inner_text(timeout=1_000)
+        except Exception:  # noqa: BLE001
+            return None
+        matches = [name for name in names if name in text]
+        # "a.xlsx" also occurs inside "data.xlsx"; keep only names not contained in another match.
+        matches = [name for name in matches if not any(name != other and name in other for other in matches)]
+        return matches[0] if len(set(matches)) == 1 else None
+
+    def _collect_evidence(
+        self,
+        page: Page,
+        trace_session: TraceSession,
+        console_state: ConsoleCaptureState,
+        *,
+        failed: bool,
+        error: Exception | None,
+    ) -> tuple[Path | None, Path | None, Path | None]:
+        """Return (screenshot, trace, console log) for the finished upload."""
+
+        console_log_path = self._finalize_console_capture(
+            page, console_state, persist=error is not None or self.capture_console_on_success
+        )
+        screenshot = self._capture_screenshot(page, "failed" if failed else "success")
+        trace_path = self._stop_trace(page, trace_session, error is not None) if trace_session.active else None
+        return screenshot, trace_path, console_log_path
+
+    def _session_stamp(self) -> str:
+        return self._upload_stamp or time.strftime("%Y%m%d-%H%M%S")
+
+    @staticmethod
+    def _failure_message(result: UploadResult) -> str:
+        suffix = []
+        if result.screenshot:
+            suffix.append(f"截图: {result.screenshot}")
+        if result.trace:
+            suffix.append(f"trace: {result.trace}")
+        if result.console_log:
+            suffix.append(f"console: {result.console_log}")
+        message = result.message or "上传失败"
+        if suffix:
+            message = f"{message} ({'; '.join(suffix)})"
+        return message
+
     # ------------------------------------------------------------------
-    def _perform_upload(self, frame: FrameLocator, file_path: Path) -> bool:
-        file_input = self.selectors.inputs.get("file_input")
-        upload_action = self.selectors.actions.get("upload_button")
+    def _multi_file_input(self, frame: FrameLocator) -> Locator | None:
+        """Return the first configured file input that accepts multiple files."""
 
-        used_direct = False
-        requires_file_chooser = False
+        file_input = self.selectors.inputs.get("file_input")
+        if not file_input:
+            return None
+        for candidate in self._candidates(file_input):
+            if candidate.get("use_file_chooser"):
+                continue
+            locator = self._build_locator(frame, candidate)
+            if locator is None:
+                continue
+            try:
+                if locator.first.get_attribute("multiple", timeout=self.timeout_ms) is not None:
+                    return locator.first
+            except Exception:  # noqa: BLE001
+                continue
+        return None
 
+    def _perform_upload(self, page: Page, frame: FrameLocator, file_path: Path) -> bool:
+        file_input = self.selectors.inputs.get("file_input")
         if file_input:
-            for candidate in self._iter_selector_candidates(file_input):
+            for candidate in self._candidates(file_input):
                 if candidate.get("use_file_chooser"):
-                    requires_file_chooser = True
                     continue
                 locator = self._build_locator(frame, candidate)
                 if locator is None:
@@ -227,32 +513,24 @@ class PlaywrightUploader:
                 try:
                     locator.set_input_files(str(file_path))
                     self.logger.info("drive.uploader file selected via hidden input")
-                    used_direct = True
-                    break
+                    return True
                 except Exception:  # noqa: BLE001
                     continue
 
-        if used_direct:
-            return True
-
+        # No usable hidden input: fall back to clicking the upload button and
+        # answering the native file chooser, whether or not a spec asked for it.
+        upload_action = self.selectors.actions.get("upload_button")
         if not upload_action:
             return False
-
-        if not requires_file_chooser:
-            requires_file_chooser = True  # fallback safeguard
-
-        if not requires_file_chooser:
-            return False
-
-        return self._upload_with_file_chooser(frame, upload_action, file_path)
+        return self._upload_with_file_chooser(page, frame, upload_action, file_path)
 
     def _upload_with_file_chooser(
         self,
+        page: Page,
         frame: FrameLocator,
         upload_action: SelectorSet,
         file_path: Path,
     ) -> bool:
-        page = self.flow.ensure_ready()
         try:
             with page.expect_file_chooser(timeout=self.timeout_ms) as chooser_info:
                 clicked = self._click_selector_set(frame, upload_action) or self._click_selector_set(page, upload_action)
@@ -316,53 +594,95 @@ class PlaywrightUploader:
 
     # ------------------------------------------------------------------
     def _wait_for_toasts(self, page: Page) -> None:
-        success_patterns = [re.compile(pattern) for pattern in self.selectors.toasts.get("success", ())]
-        failure_patterns = [re.compile(pattern) for pattern in self.selectors.toasts.get("failure", ())]
-        deadline = time.time() + (self.toast_timeout_ms / 1000.0)
-
-        while time.time() < deadline:
-            for failure in failure_patterns:
-                locator = page.get_by_text(failure)
-                if self._locator_visible(locator, timeout_ms=500):
-                    raise UploadFlowError(f"检测到上传失败提示: {failure.pattern}")
-            for success in success_patterns:
-                locator = page.get_by_text(success)
-                if self._locator_visible(locator, timeout_ms=500):
-                    self.logger.info("drive.uploader success toast pattern=%s", success.pattern)
-                    return
-            page.wait_for_timeout(200)
-        raise UploadFlowError("未检测到上传成功提示")
+        if not self._failure_patterns and not self._success_patterns:
+            raise UploadFlowError("未检测到上传成功提示")
+        failure = (
+            self._union_locator([page.get_by_text(pattern) for pattern in self._failure_patterns])
+            if self._failure_patterns
+            else None
+        )
+        success = (
+            self._union_locator([page.get_by_text(pattern) for pattern in self._success_patterns])
+            if self._success_patterns
+            else None
+        )
+        # One in-browser wait on every toast text; it returns as soon as any appears.
+        if failure is None:
+            toast = success
+        elif success is None:
+            toast = failure
+        else:
+            toast = failure.or_(success)
+        if not self._locator_visible(toast.first, timeout_ms=self.toast_timeout_ms):
+            raise UploadFlowError("未检测到上传成功提示")
+        if failure is not None and self._locator_shown(failure):
+            # Failure path only: name the pattern that matched for the error message.
+            matched = next(
+                (pattern for pattern in self._failure_patterns if self._locator_shown(page.get_by_text(pattern))),
+                None,
+            )
+            if matched is None:
+                raise UploadFlowError("检测到上传失败提示")
+            raise UploadFlowError(f"检测到上传失败提示: {matched.pattern}")
+        self.logger.info("drive.uploader success toast detected")
 
     def _await_listing(self, page: Page, frame: FrameLocator, expected_name: str, base_name: str) -> str:
         listing = self.selectors.listing.get("row_by_name")
         if not listing:
             return expected_name
-        deadline = time.time() + (self.timeout_ms / 1000.0)
-        while time.time() < deadline:
-            locator = self._build_row_locator(frame, listing, expected_name)
-            if locator and self._locator_visible(locator, timeout_ms=500):
-                return self._extract_name(locator, expected_name)
-            if base_name != expected_name:
-                locator = self._build_row_locator(frame, listing, base_name)
-                if locator and self._locator_visible(locator, timeout_ms=500):
-                    return self._extract_name(locator, base_name)
-            page.wait_for_timeout(200)
-        raise UploadFlowError("上传文件未出现在当前目录")
+        expected = self._build_row_locator(frame, listing, expected_name)
+        base = self._build_row_locator(frame, listing, base_name) if base_name != expected_name else None
+        candidates = [locator for locator in (expected, base) if locator is not None]
+        if not candidates:
+            raise UploadFlowError("上传文件未出现在当前目录")
+        row = self._union_locator(candidates)
+        if not self._locator_visible(row.first, timeout_ms=self.timeout_ms):
+            raise UploadFlowError("上传文件未出现在当前目录")
+        if base is not None and (expected is None or not self._locator_shown(expected)):
+            return self._extract_name(base, base_name)
+        return self._extract_name(expected, expected_name)
 
     def _reload_and_verify(self, page: Page, path: str, expected_name: str) -> tuple[FrameLocator, str]:
         page.reload(wait_until="domcontentloaded")
+        try:
+            # Let the listing requests settle so the re-check below sees the fresh rows.
+            page.wait_for_load_state("networkidle", timeout=self.network_idle_timeout_ms)
+        except PlaywrightTimeoutError:
+            self.logger.debug("drive.uploader network not idle after reload, continuing")
+        self._resolver_cache.pop((id(page), path), None)
+        frame = self._resolve_workspace(page, path, create_missing=False)
+        if self.verify_after_reload:
+            return frame, self._await_listing(page, frame, expected_name, expected_name)
+        listing = self.selectors.listing.get("row_by_name")
+        locator = self._build_row_locator(frame, listing, expected_name) if listing else None
+        if locator is None:
+            return frame, expected_name
+        if not self._locator_visible(locator.first, timeout_ms=RELOAD_CHECK_TIMEOUT_MS):
+            raise UploadFlowError("上传文件未出现在当前目录")
+        return frame, self._extract_name(locator, expected_name)
+
+    def _resolve_workspace(self, page: Page, path: str, *, create_missing: bool) -> FrameLocator:
+        """Navigate to ``path`` unless the last upload already resolved it on this page."""
+
+        key = (id(page), path)
+        cached = self._resolver_cache.get(key)
+        if cached is not None and cached[2] == getattr(page, "url", None):
+            return cached[1]
         resolver = PathResolver(page, self.selectors, timeout_ms=self.timeout_ms, logger=self.logger)
-        resolver.resolve(path, create_missing=False)
+        resolver.resolve(path, create_missing=create_missing)
         frame = resolver.workspace_frame()
-        confirmed_name = self._await_listing(page, frame, expected_name, expected_name)
-        return frame, confirmed_name
+        # Folder navigation happens inside the workspace iframe, so the page URL does not
+        # tell destinations apart; only the most recently resolved path is still current.
+        self._resolver_cache.clear()
+        self._resolver_cache[key] = (resolver, frame, getattr(page, "url", None))
+        return frame
 
     def _download_results(self, page: Page, frame: FrameLocator) -> Path | None:
         export_set = self.selectors.exports.get("result_sheet")
         if not export_set:
             return None
         containers = (frame, page)
-        timestamp = time.strftime("%Y%m%d-%H%M%S")
+        timestamp = self._session_stamp()
         for container in containers:
             try:
                 with page.expect_download(timeout=self.timeout_ms) as download_info:
@@ -384,6 +704,9 @@ class PlaywrightUploader:
 
     # ------------------------------------------------------------------
     def _file_exists(self, frame: FrameLocator, name: str) -> bool:
+        known = self._known_files(frame)
+        if name in known:
+            return True
         listing = self.selectors.listing.get("row_by_name")
         if not listing:
             return False
@@ -391,18 +714,30 @@ class PlaywrightUploader:
         if locator is None:
             return False
         try:
-            return locator.count() > 0
+            exists = locator.count() > 0
         except Exception:  # noqa: BLE001
             return False
+        if exists:
+            known.add(name)
+        return exists
+
+    def _known_files(self, frame: FrameLocator) -> set[str]:
+        """Names confirmed present in ``frame``'s folder; reset whenever the frame changes."""
+
+        if self._listing_cache is None or self._listing_cache[0] is not frame:
+            self._listing_cache = (frame, set())
+        return self._listing_cache[1]
 
     # ------------------------------------------------------------------
     def _start_trace(self, page: Page) -> TraceSession:
-        context = getattr(page, "context", None)
+        # The flow traces its context for as long as it lives; each upload records one
+        # chunk on it, which is only written to disk when the upload fails.
+        context = self.flow.ensure_tracing()
         if context is None:
             return TraceSession(False, None)
-        trace_path = self.flow.trace_dir / f"drive-upload_{time.strftime('%Y%m%d-%H%M%S')}.zip"
+        trace_path = self.flow.trace_dir / f"drive-upload_{self._session_stamp()}.zip"
         try:
-            context.tracing.start(screenshots=True, snapshots=True, sources=True)
+            context.tracing.start_chunk()
             return TraceSession(True, trace_path)
         except PlaywrightError:
             self.logger.warning("drive.uploader failed to start tracing", exc_info=True)
@@ -416,45 +751,82 @@ class PlaywrightUploader:
             return None
         try:
             if export and session.path is not None:
-                context.tracing.stop(path=str(session.path))
+                context.tracing.stop_chunk(path=str(session.path))
                 self.logger.info("drive.uploader trace exported path=%s", session.path)
                 return session.path
-            context.tracing.stop()
+            # Without a path the chunk is discarded and no archive is written.
+            context.tracing.stop_chunk()
         except PlaywrightError:
             self.logger.warning("drive.uploader failed to stop tracing", exc_info=True)
         return None
 
     def _start_console_capture(self, page: Page) -> ConsoleCaptureState:
-        entries: list[str] = []
         if not hasattr(page, "on") or not callable(getattr(page, "on")):
-            return ConsoleCaptureState(False, entries, None)
+            return ConsoleCaptureState(False, None)
+
+        events: SimpleQueue = SimpleQueue()
 
         def _listener(message: object) -> None:
-            timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-            msg_type = self._extract_console_field(message, "type", default="log")
-            text = self._extract_console_field(message, "text", default="")
-            sanitized = self._sanitize_console_text(text)
-            entries.append(f"[{timestamp}] {msg_type}: {sanitized}")
+            # Runs on Playwright's event thread: only read the fields and hand them off.
+            events.put_nowait(
+                (
+                    time.time(),
+                    self._extract_console_field(message, "type", default="log"),
+                    self._extract_console_field(message, "text", default=""),
+                )
+            )
 
         try:
             page.on("console", _listener)  # type: ignore[attr-defined]
-            return ConsoleCaptureState(True, entries, _listener)
         except Exception:  # noqa: BLE001
-            return ConsoleCaptureState(False, entries, None)
+            return ConsoleCaptureState(False, None)
+        state = ConsoleCaptureState(True, _listener, events)
+        state.worker = threading.Thread(target=self._drain_console, args=(state,), name="drive-console", daemon=True)
+        state.worker.start()
+        return state
+
+    def _drain_console(self, state: ConsoleCaptureState) -> None:
+        second, timestamp = -1, ""
+        while (event := state.events.get()) is not _CONSOLE_DONE:
+            logged_at, msg_type, text = event
+            if int(logged_at) != second:
+                # Chatty pages log many messages per second; format each second once.
+                second = int(logged_at)
+                timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+            state.lines.append(f"[{timestamp}] {msg_type}: {self._sanitize_console_text(text)}\n")
+
+    def _finalize_console_capture(
+        self, page: Page, state: ConsoleCaptureState, *, persist: bool = True
+    ) -> Path | None:
+        # Lines stay in memory until here, so uploads that keep no log never touch disk.
+        self._detach_console_capture(page, state)
+        if not persist or not state.lines:
+            return None
+        target = self.flow.console_dir / f"drive-console_{self._session_stamp()}.log"
+        try:
+            with target.open("a", encoding="utf-8") as stream:
+                stream.writelines(state.lines)
+        except OSError:
+            self.logger.warning("drive.uploader failed to persist console log", exc_info=True)
+            return None
+        self.logger.info("drive.uploader console log captured path=%s", target)
+        return target
+
+    def _detach_console_capture(self, page: Page, state: ConsoleCaptureState) -> None:
+        """Stop listening and wait for queued console messages to be formatted."""
 
-    def _finalize_console_capture(self, page: Page, state: ConsoleCaptureState) -> Path | None:
         if state.enabled and hasattr(page, "off") and callable(getattr(page, "off")):
             try:
                 page.off("console", state.handler)  # type: ignore[attr-defined]
             except Exception:  # noqa: BLE001
                 pass
-        if not state.entries:
-            return None
-        return self._write_console_log(state.entries)
+        if state.events is not None and state.worker is not None and state.worker.is_alive():
+            state.events.put_nowait(_CONSOLE_DONE)
+            state.worker.join(timeout=CONSOLE_DRAIN_TIMEOUT_S)
 
     def _capture_screenshot(self, page: Page, label: str) -> Path | None:
         try:
-            filename = f"drive-upload-{label}_{time.strftime('%Y%m%d-%H%M%S')}.png"
+            filename = f"drive-upload-{label}_{self._session_stamp()}.png"
             target = self.flow.screenshots_dir / filename
             page.screenshot(path=str(target), full_page=True)
             return target
@@ -470,7 +842,7 @@ class PlaywrightUploader:
         *,
         timeout_ms: int | None = None,
     ) -> Locator | None:
-        for candidate in self._iter_selector_candidates(selector_set):
+        for candidate in self._candidates(selector_set):
             locator = self._build_locator(container, candidate)
             if locator is None:
                 continue
@@ -484,7 +856,7 @@ class PlaywrightUploader:
         return None
 
     def _click_selector_set(self, container: Page | FrameLocator, selector_set: SelectorSet) -> bool:
-        for candidate in self._iter_selector_candidates(selector_set):
+        for candidate in self._candidates(selector_set):
             locator = self._build_locator(container, candidate)
             if locator is None:
                 continue
@@ -496,7 +868,7 @@ class PlaywrightUploader:
         return False
 
     def _fill_input(self, container: Page | FrameLocator, selector_set: SelectorSet, value: str) -> bool:
-        for candidate in self._iter_selector_candidates(selector_set):
+        for candidate in self._candidates(selector_set):
             locator = self._build_locator(container, candidate)
             if locator is None:
                 continue
@@ -536,28 +908,56 @@ class PlaywrightUploader:
             return False
 
     @staticmethod
-    def _iter_selector_candidates(selector_set: SelectorSet) -> Iterable[Mapping[str, object]]:
-        yield selector_set.primary
-        yield from selector_set.fallbacks
+    def _locator_shown(locator: Locator) -> bool:
+        """Return whether the locator is visible right now, without waiting."""
+
+        try:
+            return bool(locator.first.is_visible())
+        except Exception:  # noqa: BLE001
+            return False
 
     @staticmethod
-    def _iter_row_candidates(selector_set: RowSelectorSet, name: str) -> Iterable[Mapping[str, object]]:
-        for spec in PlaywrightUploader._iter_selector_candidates(selector_set):
-            yield PlaywrightUploader._apply_name_template(spec, name)
+    def _union_locator(locators: Sequence[Locator]) -> Locator:
+        combined = locators[0]
+        for locator in locators[1:]:
+            combined = combined.or_(locator)
+        return combined
+
+    @staticmethod
+    def _iter_selector_candidates(selector_set: SelectorSet | RowSelectorSet) -> tuple[Mapping[str, object], ...]:
+        return (selector_set.primary, *selector_set.fallbacks)
+
+    def _candidates(self, selector_set: SelectorSet | RowSelectorSet) -> tuple[Mapping[str, object], ...]:
+        candidates = self._candidate_index.get(id(selector_set))
+        if candidates is None:
+            return self._iter_selector_candidates(selector_set)
+        return candidates
+
+    def _iter_row_candidates(self, selector_set: RowSelectorSet, name: str) -> Iterable[Mapping[str, object]]:
+        for spec in self._candidates(selector_set):
+            yield self._apply_name_template(spec, name)
 
     @staticmethod
     def _apply_name_template(spec: Mapping[str, object], name: str) -> Mapping[str, object]:
+        key = (id(spec), name)
+        cached = _SPEC_CACHE.get(key)
+        if cached is not None and cached[0] is spec:
+            return cached[1]
+        if len(_SPEC_CACHE) >= SPEC_CACHE_SIZE:
+            _SPEC_CACHE.clear()
         data = dict(spec)
         template = data.pop("name_template", None)
         if isinstance(template, str):
-            data["name"] = template.format(name=name)
+            data["name"] = _format_template(template, name)
         regex_template = data.pop("name_regex_template", None)
         if isinstance(regex_template, str):
-            data["name_regex"] = regex_template.format(name=re.escape(name))
+            data["name_regex"] = _format_template(regex_template, _escape_name(name))
         test_id_template = data.pop("test_id_template", None)
         if isinstance(test_id_template, str):
-            data["test_id"] = test_id_template.format(name=name)
-        return data
+            data["test_id"] = _format_template(test_id_template, name)
+        resolved = MappingProxyType(data)
+        _SPEC_CACHE[key] = (spec, resolved)
+        return resolved
 
     @staticmethod
     def _extract_console_field(message: object, attr: str, default: str) -> str:
@@ -571,19 +971,7 @@ class PlaywrightUploader:
 
     @staticmethod
     def _sanitize_console_text(text: str) -> str:
-        sanitized = re.sub(r"\d{3,}", "***", text or "")
-        return sanitized.replace("\n", " ").strip()
-
-    def _write_console_log(self, entries: list[str]) -> Path | None:
-        try:
-            filename = f"drive-console_{time.strftime('%Y%m%d-%H%M%S')}.log"
-            target = self.flow.console_dir / filename
-            target.write_text("\n".join(entries), encoding="utf-8")
-            self.logger.info("drive.uploader console log captured path=%s", target)
-            return target
-        except Exception:  # noqa: BLE001
-            self.logger.warning("drive.uploader failed to persist console log", exc_info=True)
-            return None
+        return _DIGIT_RUN_RE.sub("***", text or "").replace("\n", " ").strip()
 
     @staticmethod
     def _build_locator(container: Page | FrameLocator, spec: Mapping[str, object]) -> Locator | None:
@@ -594,25 +982,25 @@ class PlaywrightUploader:
                 return container.get_by_role(role, name=name)  # type: ignore[return-value]
             name_regex = spec.get("name_regex")
             if isinstance(name_regex, str):
-                return container.get_by_role(role, name=re.compile(name_regex))  # type: ignore[return-value]
+                return container.get_by_role(role, name=_compiled(name_regex))  # type: ignore[return-value]
         text = spec.get("text")
         if isinstance(text, str) and text:
             return container.get_by_text(text, exact=True)  # type: ignore[return-value]
         text_regex = spec.get("text_regex")
         if isinstance(text_regex, str) and text_regex:
-            return container.get_by_text(re.compile(text_regex))  # type: ignore[return-value]
+            return container.get_by_text(_compiled(text_regex))  # type: ignore[return-value]
         label = spec.get("label")
         if isinstance(label, str) and label:
             return container.get_by_label(label)  # type: ignore[return-value]
         label_regex = spec.get("label_regex")
         if isinstance(label_regex, str) and label_regex:
-            return container.get_by_label(re.compile(label_regex))  # type: ignore[return-value]
+            return container.get_by_label(_compiled(label_regex))  # type: ignore[return-value]
         placeholder = spec.get("placeholder")
         if isinstance(placeholder, str) and placeholder:
             return container.get_by_placeholder(placeholder)  # type: ignore[return-value]
         placeholder_regex = spec.get("placeholder_regex")
         if isinstance(placeholder_regex, str) and placeholder_regex:
-            return container.get_by_placeholder(re.compile(placeholder_regex))  # type: ignore[return-value]
+            return container.get_by_placeholder(_compiled(placeholder_regex))  # type: ignore[return-value]
         test_id = spec.get("test_id")
         if isinstance(test_id, str) and test_id:
             return container.get_by_test_id(test_id)  # type: ignore[return-value]
@@ -628,10 +1016,9 @@ class PlaywrightUploader:
 
     @staticmethod
     def _split_name(name: str) -> tuple[str, str]:
-        if "." not in name:
-            return name, ""
-        idx = name.rfind(".")
-        return name[:idx], name[idx:]
+        # PurePosixPath keeps dot-files whole (".env" has no suffix), unlike rfind(".").
+        path = PurePosixPath(name)
+        return path.stem, path.suffix
 
 
 __all__ = ["PlaywrightUploader", "UploadResult", "UploadFlowError"]
@@ -3,6 +3,7 @@
 # Module responsibilities:
 # - Apply mapping strategies to populate Excel templates without destroying styles.
 # - Handle pagination when the template sheet reaches its configured capacity.
+# - Stream rows into a fresh write-only workbook when no template styling is needed.
 
 from __future__ import annotations
 
@@ -10,7 +11,8 @@ from pathlib import Path
 from typing import Iterable, List, Optional
 
 import pandas as pd
-from openpyxl import load_workbook
+from openpyxl import Workbook, load_workbook
+from openpyxl.utils import column_index_from_string
 from openpyxl.worksheet.worksheet import Worksheet
 
 from .mapping import FixedMappingStrategy
@@ -40,15 +42,52 @@ def _write_rows(
     column_map: dict[str, str],
     start_row: int,
 ) -> int:
+    # itertuples yields plain tuples with each column's own scalar type (Timestamps stay
+    # Timestamps), without building a Series per row the way iterrows does.
+    # Resolve column letters once; ws.cell() then skips the "A10" coordinate parsing.
+    targets = tuple(column_index_from_string(col) for col in column_map.values())
     row_idx = start_row
-    for _, row in data.iterrows():
-        for source_col, target_col in column_map.items():
-            cell_ref = f"{target_col}{row_idx}"
-            ws[cell_ref].value = row[source_col]
+    for values in data[list(column_map)].itertuples(index=False, name=None):
+        for target_col, value in zip(targets, values):
+            # Assign .value rather than ws.cell(value=...), which ignores None and would
+            # leave template content behind in empty source cells.
+            ws.cell(row=row_idx, column=target_col).value = value
         row_idx += 1
     return row_idx
 
 
+def _write_streaming(
+    data: pd.DataFrame,
+    column_map: dict[str, str],
+    mapping: FixedMappingStrategy,
+    out_path: Path,
+) -> None:
+    positions = tuple(column_index_from_string(col) - 1 for col in column_map.values())
+    width = max(positions) + 1
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(mapping.sheet)
+    # Write-only sheets only append, so pad with empty rows up to the header/data rows.
+    next_row = 1
+    header_row = mapping.header_row
+    if header_row is not None and header_row < mapping.start_row:
+        for _ in range(next_row, header_row):
+            ws.append([])
+        header: list[object] = [None] * width
+        for position, source_col in zip(positions, column_map):
+            header[position] = source_col
+        ws.append(header)
+        next_row = header_row + 1
+    for _ in range(next_row, mapping.start_row):
+        ws.append([])
+    for values in data[list(column_map)].itertuples(index=False, name=None):
+        row: list[object] = [None] * width
+        for position, value in zip(positions, values):
+            row[position] = value
+        ws.append(row)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    wb.save(out_path)
+
+
 def write_fixed(
     df: pd.DataFrame,
     template_path: Path,
@@ -66,15 +105,19 @@ def write_fixed(
         out_path: Output workbook path (first chunk); part files get ``_partN`` suffixes.
         dry_run: When True, skip actual file emission and only log the plan.
 
+    When the mapping sets ``write_only``, the template is not loaded: each chunk is
+    streamed into a new workbook holding only the sheet, an optional header row
+    (source column names) and the data, which keeps memory flat for large inputs.
+
     Returns:
         List of generated output paths.
 
     Raises:
-        FileNotFoundError: When the template workbook is absent.
+        FileNotFoundError: When the template workbook is absent (template mode only).
         KeyError: When the target worksheet is missing.
     """
 
-    if not template_path.exists():
+    if not mapping.write_only and not template_path.exists():
         raise FileNotFoundError(f"Template workbook not found: {template_path}")
 
     target_schema = TargetSchema(
@@ -89,6 +132,7 @@ def write_fixed(
             "rows": len(df),
             "columns": list(column_map.keys()),
             "max_rows_per_sheet": mapping.max_rows_per_sheet,
+            "write_only": mapping.write_only,
         },
     )
 
@@ -104,6 +148,14 @@ def write_fixed(
             )
             continue
 
+        if mapping.write_only:
+            _write_streaming(chunk, column_map, mapping, planned_out)
+            logger.info(
+                "Chunk streamed",
+                extra={"rows": len(chunk), "output": str(planned_out)},
+            )
+            continue
+
         wb = load_workbook(template_path)
         if mapping.sheet not in wb.sheetnames:
             raise KeyError(f"Sheet '{mapping.sheet}' not found in template")
@@ -9,8 +9,9 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 import pandas as pd
 import yaml
@@ -24,6 +25,14 @@ class MappingError(RuntimeError):
     """Raised when mapping configuration is invalid or cannot be applied."""
 
 
+@lru_cache(maxsize=128)
+def _load_yaml_cached(path: str, mtime_ns: int) -> Any:
+    # Keyed on mtime so an edited file is re-read. The payload is shared between
+    # callers and must be treated as read-only.
+    with open(path, "r", encoding="utf-8") as fh:
+        return yaml.safe_load(fh)
+
+
 class BaseMappingStrategy(ABC):
     """Abstract base class for mapping strategies."""
 
@@ -76,6 +85,10 @@ class FixedMappingStrategy(BaseMappingStrategy):
     def output_name(self) -> Optional[str]:
         return self.config.get("output_name")
 
+    @property
+    def write_only(self) -> bool:
+        return self.config.get("write_only", False)
+
 
 class HeaderAutoMappingStrategy(BaseMappingStrategy):
     """Placeholder for future header-based auto mapping strategy."""
@@ -96,8 +109,8 @@ class FixedMapping(FixedMappingStrategy):
     def from_yaml(cls, path: Path) -> "FixedMapping":
         """Load mapping configuration from YAML file."""
 
-        with path.open("r", encoding="utf-8") as fh:
-            payload = yaml.safe_load(fh)
+        resolved = path.resolve()
+        payload = _load_yaml_cached(str(resolved), resolved.stat().st_mtime_ns)
         if not isinstance(payload, dict):
             raise MappingError("Invalid mapping YAML structure (expected mapping)")
         required = {"sheet", "start_row", "columns"}
@@ -116,6 +129,12 @@ class FixedMapping(FixedMappingStrategy):
             config["header_row"] = int(payload["header_row"])
         if "output_name" in payload and payload["output_name"]:
             config["output_name"] = str(payload["output_name"])
+        if "write_only" in payload and payload["write_only"] is not None:
+            if not isinstance(payload["write_only"], bool):
+                raise MappingError(
+                    f"Mapping YAML write_only must be true or false, got {payload['write_only']!r}"
+                )
+            config["write_only"] = payload["write_only"]
         return cls(config=config)
 
     def build_context(self, source_path: Path, template_path: Path) -> MappingContext:
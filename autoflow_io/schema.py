@@ -20,6 +20,7 @@ class FixedMappingConfig(TypedDict):
     max_rows_per_sheet: NotRequired[int]
     header_row: NotRequired[int]
     output_name: NotRequired[str]
+    write_only: NotRequired[bool]
 
 
 @dataclass(frozen=True)
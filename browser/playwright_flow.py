@@ -207,6 +207,27 @@ class PlaywrightFlow:
         locator.wait_for(state="visible", timeout=timeout_ms or self.default_timeout_ms)
         return locator
 
+    def ensure_tracing(self) -> BrowserContext | None:
+        """Start tracing the context once so callers can record chunks on it.
+
+        The trace lives as long as the context and ends in :meth:`close`.
+
+        Returns:
+            The traced context, or ``None`` when there is no context or tracing
+            could not be started.
+        """
+        context = self._context
+        if context is None:
+            return None
+        if not self._tracing_active:
+            try:
+                context.tracing.start(screenshots=True, snapshots=True, sources=True)
+            except PlaywrightError:
+                self.logger.warning("启动 trace 失败", exc_info=True)
+                return None
+            self._tracing_active = True
+        return context
+
     def run_with_trace(self, label: str) -> ContextManager[None]:
         """Context manager that records a trace only if an error bubbles up."""
 
@@ -216,25 +237,38 @@ class PlaywrightFlow:
             if context is None:
                 raise BrowserError("Playwright context 未初始化")
 
+            # With context-wide tracing already running (see ensure_tracing), record a
+            # chunk on it instead of starting a second trace.
+            chunked = self._tracing_active
+            recording = True
             try:
-                context.tracing.start(name=label, screenshots=True, snapshots=True, sources=True)
-                self._tracing_active = True
+                if chunked:
+                    context.tracing.start_chunk(name=label)
+                else:
+                    context.tracing.start(name=label, screenshots=True, snapshots=True, sources=True)
+                    self._tracing_active = True
             except PlaywrightError:
                 # Logging is deferred to keep normal path clean; trace export
                 # still happens via _record_failure_artifacts when possible.
-                self._tracing_active = False
+                recording = False
+                if not chunked:
+                    self._tracing_active = False
             try:
                 yield
             except Exception:
                 self._record_failure_artifacts(label)
                 raise
             else:
-                if self._tracing_active:
+                if recording:
                     try:
-                        context.tracing.stop()
+                        if chunked:
+                            context.tracing.stop_chunk()
+                        else:
+                            context.tracing.stop()
                     except PlaywrightError:
                         self.logger.warning("停止 trace 失败", exc_info=True)
-                self._tracing_active = False
+                if not chunked:
+                    self._tracing_active = False
 
         return _runner()
 
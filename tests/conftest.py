@@ -18,7 +18,7 @@ if str(ROOT) not in sys.path:
 faulthandler.enable()  # Ensure crashes emit tracebacks.
 socket.setdefaulttimeout(10)
 
-from autoflow.services.fees_fetcher import pbc_client
+from autoflow.services.fees_fetcher import pbc_client, safe_provider, tls_diag
 
 
 def _snapshot_thread_stacks() -> Dict[int, str]:
@@ -29,6 +29,20 @@ def _snapshot_thread_stacks() -> Dict[int, str]:
     return stacks
 
 
+@pytest.fixture(autouse=True)
+def _reset_safe_provider_state() -> None:
+    """Keep cached pages, DNS results and snapshot writes from leaking between tests."""
+
+    safe_provider.clear_portal_cache()
+    pbc_client.clear_page_caches()
+    tls_diag.clear_dns_cache()
+    yield
+    safe_provider.flush_snapshots()
+    safe_provider.clear_portal_cache()
+    pbc_client.clear_page_caches()
+    tls_diag.clear_dns_cache()
+
+
 @pytest.fixture(autouse=True, scope="session")
 def _thread_diagnostics() -> None:
     """Dump live non-daemon threads at the end of the test session."""
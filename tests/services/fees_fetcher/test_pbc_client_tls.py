@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import json
+import socket
+import threading
 from types import SimpleNamespace
 
 import pytest
-from requests.exceptions import SSLError
+from requests.exceptions import ReadTimeout, SSLError
 
-from autoflow.services.fees_fetcher import pbc_client
+from autoflow.services.fees_fetcher import _http, pbc_client
 
 
 @pytest.fixture(autouse=True)
@@ -23,6 +25,41 @@ def test_session_trust_env_disabled() -> None:
     assert pbc_client._SESSION.trust_env is False
 
 
+def test_request_retries_read_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen()
+    server.settimeout(5)
+    accepted: list[socket.socket] = []
+
+    def accept_silently() -> None:
+        for _ in range(2):
+            try:
+                conn, _ = server.accept()
+            except OSError:
+                return
+            accepted.append(conn)
+
+    worker = threading.Thread(target=accept_silently, daemon=True)
+    worker.start()
+    monkeypatch.setattr(pbc_client, "_SESSION", _http.build_session())
+    monkeypatch.setattr(pbc_client.tls_diag, "resolve_ips_count_first", lambda host, family: ("127.0.0.1", None, 1, 0))
+    url = f"http://127.0.0.1:{server.getsockname()[1]}/"
+
+    try:
+        with pytest.raises(pbc_client.PBOCClientError) as excinfo:
+            pbc_client._request(url, read_timeout=0.2, attempts=2, backoff_base=0.01, jitter=0)  # noqa: SLF001
+        worker.join(timeout=5)
+    finally:
+        for conn in accepted:
+            conn.close()
+        server.close()
+
+    assert isinstance(excinfo.value.__cause__, ReadTimeout)
+    assert len(accepted) == 2
+    assert pbc_client.get_metrics().request_attempts == 2
+
+
 def test_request_raises_cert_hostname_mismatch(monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture) -> None:
     host = "www.pbc.gov.cn"
     url = f"https://{host}/path"
@@ -32,6 +69,11 @@ def test_request_raises_cert_hostname_mismatch(monkeypatch: pytest.MonkeyPatch,
 
     monkeypatch.setattr(pbc_client, "_SESSION", SimpleNamespace(get=fake_get))
     monkeypatch.setattr(pbc_client.tls_diag, "resolve_ips", lambda host, family: (["1.1.1.1"], ["2001:db8::1"]))
+    monkeypatch.setattr(
+        pbc_client.tls_diag,
+        "resolve_ips_count_first",
+        lambda host, family: ("1.1.1.1", "2001:db8::1", 1, 1),
+    )
     monkeypatch.setattr(
         pbc_client.tls_diag,
         "probe_cert",
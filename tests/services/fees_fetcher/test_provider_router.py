@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from decimal import Decimal
+from types import SimpleNamespace
 
 import pytest
 
@@ -121,3 +122,36 @@ def test_router_meta_fields(monkeypatch: pytest.MonkeyPatch) -> None:
     assert source_date == "2025-08-03"
     assert rate_source == "safe_portal"
     assert fallback_used == "forward"
+
+
+def test_router_reuses_pages_across_dates(monkeypatch: pytest.MonkeyPatch) -> None:
+    listing_url = pbc_client._page_urls(0)[0]  # noqa: SLF001
+    listing = (
+        '<a href="a0103.html">人民币汇率中间价公告</a><span>2025-01-03</span>'
+        '<a href="a0102.html">人民币汇率中间价公告</a><span>2025-01-02</span>'
+    )
+    articles = {
+        "a0103.html": "2025年1月3日银行间外汇市场人民币汇率中间价为1美元对人民币7.1880元",
+        "a0102.html": "2025年1月2日银行间外汇市场人民币汇率中间价为1美元对人民币7.1879元",
+    }
+    fetched: list[str] = []
+
+    def fake_request(url: str):  # noqa: ANN202
+        fetched.append(url)
+        if url == listing_url:
+            return SimpleNamespace(text=listing)
+        name = url.rsplit("/", 1)[-1]
+        if name in articles:
+            return SimpleNamespace(text=f"<html><body>{articles[name]}</body></html>")
+        raise pbc_client.PBOCClientError(url)
+
+    monkeypatch.setattr(pbc_client, "_request", fake_request)
+    monkeypatch.setattr(pbc_client, "PAGE_DELAY_SECONDS", 0)
+
+    first = provider_router.fetch_with_fallback("2025-01-02", prefer_source="pbc")
+    second = provider_router.fetch_with_fallback("2025-01-03", prefer_source="pbc")
+
+    assert first[:3] == (Decimal("7.1879"), "2025-01-02", "pbc_notice")
+    assert second[:3] == (Decimal("7.1880"), "2025-01-03", "pbc_notice")
+    assert fetched.count(listing_url) == 1
+    assert sum(url.endswith("a0103.html") for url in fetched) == 1
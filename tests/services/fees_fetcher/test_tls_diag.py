@@ -28,10 +28,54 @@ def test_resolve_ips_filters_family(monkeypatch: pytest.MonkeyPatch) -> None:
 
     entries_no_v4 = [(socket.AF_INET6, None, None, None, ("2001:db8::1", 0, 0, 0))]
     monkeypatch.setattr(tls_diag.socket, "getaddrinfo", lambda *args, **kwargs: entries_no_v4)
+    tls_diag.clear_dns_cache()
     with pytest.raises(ValueError):
         tls_diag.resolve_ips("example.com", "4")
 
 
+def test_resolve_ips_count_first_reports_first_and_counts(monkeypatch: pytest.MonkeyPatch) -> None:
+    entries = [
+        (socket.AF_INET, None, None, None, ("1.2.3.4", 0)),
+        (socket.AF_INET, None, None, None, ("1.2.3.4", 0)),
+        (socket.AF_INET, None, None, None, ("5.6.7.8", 0)),
+        (socket.AF_INET6, None, None, None, ("2001:db8::1", 0, 0, 0)),
+    ]
+    monkeypatch.setattr(tls_diag.socket, "getaddrinfo", lambda *args, **kwargs: entries)
+
+    assert tls_diag.resolve_ips_count_first("example.com", "auto") == ("1.2.3.4", "2001:db8::1", 2, 1)
+
+    monkeypatch.setattr(tls_diag.socket, "getaddrinfo", lambda *args, **kwargs: entries[3:])
+    tls_diag.clear_dns_cache()
+    with pytest.raises(ValueError):
+        tls_diag.resolve_ips_count_first("example.com", "4")
+
+
+def test_resolve_ips_reuses_cached_lookup(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+    entries = [(socket.AF_INET, None, None, None, ("1.2.3.4", 0))]
+
+    def fake_getaddrinfo(host, *_args, **_kwargs):
+        calls.append(host)
+        return entries
+
+    monkeypatch.setattr(tls_diag.socket, "getaddrinfo", fake_getaddrinfo)
+
+    # Given a host resolved once
+    assert tls_diag.resolve_ips("example.com", "auto") == (["1.2.3.4"], [])
+
+    # When it is resolved again within the TTL, by either helper
+    tls_diag.resolve_ips("example.com", "4")
+    tls_diag.resolve_ips_count_first("example.com", "auto")
+
+    # Then the resolver is only hit once
+    assert calls == ["example.com"]
+
+    # And an expired entry triggers a fresh lookup
+    monkeypatch.setattr(tls_diag, "DNS_CACHE_TTL_SECONDS", 0.0)
+    tls_diag.resolve_ips("example.com", "auto")
+    assert calls == ["example.com", "example.com"]
+
+
 def test_probe_cert_extracts_summary(monkeypatch: pytest.MonkeyPatch) -> None:
     fake_cert = {
         "subject": ((("commonName", "default.example"),),),
@@ -69,7 +113,7 @@ def test_probe_cert_extracts_summary(monkeypatch: pytest.MonkeyPatch) -> None:
         def close(self):
             return None
 
-    monkeypatch.setattr(tls_diag.ssl, "create_default_context", lambda: FakeContext())
+    monkeypatch.setattr(tls_diag, "_SSL_CTX", FakeContext())
     monkeypatch.setattr(tls_diag.socket, "socket", FakeSocket)
 
     info = tls_diag.probe_cert("www.example.com", "1.2.3.4", timeout=1.0)
@@ -89,3 +89,122 @@ def test_process_forms_interactive_confirmation(tmp_path, sample_inputs, rate_pr
     confirm_df = pd.read_csv(result.confirm_csv_path)
     assert len(confirm_df) == 1
     assert "confirmation_declined" in " ".join(confirm_df.get("issues", pd.Series(dtype=str)).astype(str).tolist())
+
+
+def test_compute_base_amounts_queries_each_rate_once() -> None:
+    from autoflow.services.form_processor.compute import compute_base_amounts
+
+    calls: list[tuple[str, str, str]] = []
+
+    class CountingProvider:
+        def get_rate(self, date: str, from_ccy: str, to_ccy: str) -> Decimal:
+            calls.append((date, from_ccy, to_ccy))
+            return Decimal("7.20")
+
+    frame = pd.DataFrame(
+        {
+            "amount": [Decimal("1"), Decimal("2"), Decimal("3"), None],
+            "currency": ["USD", "USD", "USD", "USD"],
+            "date": ["2024-05-10", "2024-05-10", "2024-05-11", "2024-05-10"],
+            "issues": [[], [], [], []],
+        }
+    )
+
+    computed = compute_base_amounts(frame, "CNY", 2, CountingProvider())
+
+    # Given repeated (date, currency) pairs, Then the provider is hit once per pair.
+    assert calls == [("2024-05-10", "USD", "CNY"), ("2024-05-11", "USD", "CNY")]
+    assert computed["base_amount"].tolist() == [Decimal("7.20"), Decimal("14.40"), Decimal("21.60"), None]
+
+
+def test_apply_validations_orders_issues_and_confirms_only_large_rows() -> None:
+    from autoflow.services.form_processor.mapping import ValidationRules
+    from autoflow.services.form_processor.validate import apply_validations
+
+    frame = pd.DataFrame(
+        {
+            "project": ["A", None, "C", "D"],
+            "amount": [Decimal("1.005"), Decimal("-2"), Decimal("3"), Decimal("30000")],
+            "base_amount": [Decimal("7.236"), Decimal("-14.4"), None, Decimal("216000.004")],
+            "issues": [[], [], [], []],
+        }
+    )
+    rules = ValidationRules(required=["project"], non_negative=["amount"], round={"amount": 2})
+    seen: list[str] = []
+
+    def callback(row: pd.Series) -> bool:
+        seen.append(row["project"])
+        return False
+
+    outcome = apply_validations(frame, rules, 2, Decimal("20000"), callback)
+
+    # Given one row per rule, Then issues follow rule order and only the large row is confirmed.
+    assert seen == ["D"]
+    assert outcome.rejected["issues"].tolist() == [
+        ["missing_project", "negative_amount"],
+        ["missing_base_amount"],
+    ]
+    assert outcome.accepted["amount"].tolist() == [Decimal("1.01"), Decimal("30000.00")]
+    assert outcome.accepted["base_amount"].tolist() == [Decimal("7.236"), Decimal("216000.00")]
+    assert outcome.need_confirm["issues"].tolist() == [["confirmation_declined"]]
+    assert frame["amount"].tolist()[0] == Decimal("1.005")
+    assert frame["issues"].tolist() == [[], [], [], []]
+
+
+def test_load_mapping_config_reuses_parse_until_file_changes(tmp_path) -> None:
+    import os
+
+    from autoflow.services.form_processor.mapping import load_mapping_config
+
+    mapping_path = tmp_path / "mapping.yaml"
+    mapping_path.write_text("input_columns:\n  amount: [金额]\n", encoding="utf-8")
+
+    # Given the same unchanged file, Then the parsed config is shared.
+    first = load_mapping_config(mapping_path)
+    assert load_mapping_config(str(mapping_path)) is first
+
+    # When the file is rewritten, Then the new content is loaded.
+    mapping_path.write_text("input_columns:\n  amount: [Amount]\n", encoding="utf-8")
+    stat = mapping_path.stat()
+    os.utime(mapping_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_mapping_config(mapping_path).input_columns == {"amount": ["Amount"]}
+
+
+def test_clean_dataframe_normalizes_mixed_timezone_dates() -> None:
+    from autoflow.services.form_processor.cleaning import clean_dataframe
+
+    frame = pd.DataFrame({"date": ["2024-01-01T00:00:00+08:00", "2024-01-02T00:00:00+00:00"]})
+
+    cleaned = clean_dataframe(frame)
+
+    assert cleaned["date"].tolist() == ["2024-01-01", "2024-01-02"]
+    assert cleaned["issues"].tolist() == [[], []]
+
+
+def test_mock_provider_snapshots_rates() -> None:
+    from autoflow.services.form_processor.providers import RateFallbackUsed
+
+    # Given a provider built from a dict that the caller edits afterwards
+    pair_rates = {"2024-05-01": Decimal("7.10"), "2024-5-2": Decimal("9.99")}
+    provider = MockRateProvider(rates={("USD", "CNY"): pair_rates})
+    del pair_rates["2024-05-01"]
+    pair_rates["2024-05-02"] = Decimal("7.20")
+
+    # When a date without a rate is looked up
+    with pytest.raises(RateFallbackUsed) as excinfo:
+        provider.get_rate("2024-05-03", "USD", "CNY")
+
+    # Then the fallback comes from the rates seen at construction, skipping non-ISO keys
+    assert excinfo.value.used_date == "2024-05-01"
+    assert excinfo.value.rate == Decimal("7.10")
+
+
+def test_clean_dataframe_issues_are_lists() -> None:
+    from autoflow.services.form_processor.cleaning import clean_dataframe
+
+    frame = pd.DataFrame({"amount": ["1.5", "abc"], "currency": ["usd", "USD"]})
+
+    cleaned = clean_dataframe(frame)
+
+    assert cleaned["issues"].tolist() == [[], ["invalid_amount"]]
+    assert all(type(issues) is list for issues in cleaned["issues"])
@@ -61,6 +61,87 @@ def test_parse_article_returns_rate_none_when_missing(monkeypatch: pytest.Monkey
     assert rate is None
 
 
+def test_parse_article_cached_across_cycles(monkeypatch: pytest.MonkeyPatch, sample_article_html: str) -> None:
+    calls: list[str] = []
+
+    def fake_request(url: str) -> SimpleNamespace:
+        calls.append(url)
+        return SimpleNamespace(
+            text=sample_article_html,
+            apparent_encoding="utf-8",
+            raise_for_status=lambda: None,
+        )
+
+    monkeypatch.setattr(pbc_client, "_request", fake_request)
+
+    for _ in range(2):
+        pbc_client.begin_request_cycle(None)
+        try:
+            result = pbc_client.parse_article("http://example.com/cached.html")
+        finally:
+            pbc_client.end_request_cycle()
+        assert result == ("2025-01-02", Decimal("7.1879"))
+    assert len(calls) == 1
+
+    pbc_client.clear_page_caches()
+    pbc_client.parse_article("http://example.com/cached.html")
+
+    assert len(calls) == 2
+
+
+def test_iter_article_urls_bounds_scan_by_listing_dates(monkeypatch: pytest.MonkeyPatch) -> None:
+    anchor = '<a href="{href}">人民币汇率中间价公告</a><span>{date}</span>'
+    pages = {
+        "index.html": anchor.format(href="a0.html", date="2025-01-10"),
+        "index2.html": anchor.format(href="a1.html", date="2025-01-02"),
+        "index3.html": anchor.format(href="a2.html", date="2024-12-31"),
+    }
+    fetched: list[str] = []
+
+    def fake_request(url: str) -> SimpleNamespace:
+        name = url.rsplit("/", 1)[-1]
+        fetched.append(name)
+        if name not in pages:
+            raise pbc_client.PBOCClientError(url)
+        return SimpleNamespace(text=pages[name])
+
+    monkeypatch.setattr(pbc_client, "_request", fake_request)
+    monkeypatch.setattr(pbc_client, "PAGE_DELAY_SECONDS", 0)
+
+    urls = list(pbc_client.iter_article_urls(10, target_date="2025-01-02"))
+
+    # Given newest-first listings, Then newer pages are skipped and older ones end the scan.
+    assert [url.rsplit("/", 1)[-1] for url in urls] == ["a1.html"]
+    assert fetched == ["index.html", "index2.html", "index3.html"]
+
+
+def test_http2_prefetch_only_reads_ahead_of_the_walk(monkeypatch: pytest.MonkeyPatch) -> None:
+    anchor = '<a href="{href}">人民币汇率中间价公告</a><span>{date}</span>'
+    pages = {
+        "index.html": anchor.format(href="a0.html", date="2025-01-10"),
+        "index2.html": anchor.format(href="a1.html", date="2025-01-02"),
+        "index3.html": anchor.format(href="a2.html", date="2024-12-31"),
+    }
+    requested: list[list[str]] = []
+
+    async def fake_fetch(urls: list[str]) -> dict[str, str]:
+        requested.append([url.rsplit("/", 1)[-1] for url in urls])
+        return {url: pages[url.rsplit("/", 1)[-1]] for url in urls if url.rsplit("/", 1)[-1] in pages}
+
+    def fail_request(url: str) -> SimpleNamespace:
+        raise AssertionError(f"unexpected sequential fetch of {url}")
+
+    monkeypatch.setenv(pbc_client.HTTP2_PREFETCH_ENV_VAR, "1")
+    monkeypatch.setattr(pbc_client, "httpx", object())
+    monkeypatch.setattr(pbc_client, "_fetch_pages_http2", fake_fetch)
+    monkeypatch.setattr(pbc_client, "_request", fail_request)
+
+    urls = list(pbc_client.iter_article_urls(10, target_date="2025-01-02"))
+
+    assert [url.rsplit("/", 1)[-1] for url in urls] == ["a1.html"]
+    assert requested == [["index.html", "index2.html", "index3.html"]]
+
+
 def test_probe_keychart_extracts_rate(monkeypatch: pytest.MonkeyPatch, sample_keychart_html: str) -> None:
     def fake_request(url: str) -> SimpleNamespace:
         return SimpleNamespace(
@@ -79,7 +160,7 @@ def test_probe_keychart_extracts_rate(monkeypatch: pytest.MonkeyPatch, sample_ke
 def test_provider_prefers_articles(monkeypatch: pytest.MonkeyPatch) -> None:
     provider = PBOCRateProvider()
 
-    monkeypatch.setattr(pbc_client, "iter_article_urls", lambda max_pages=15: iter(["a", "b"]))
+    monkeypatch.setattr(pbc_client, "iter_article_urls", lambda max_pages=15, target_date=None: iter(["a", "b"]))
 
     def fake_parse(url: str) -> tuple[str, Decimal | None]:
         if url == "a":
@@ -96,7 +177,7 @@ def test_provider_prefers_articles(monkeypatch: pytest.MonkeyPatch) -> None:
 def test_provider_falls_back_to_keychart(monkeypatch: pytest.MonkeyPatch) -> None:
     provider = PBOCRateProvider()
 
-    monkeypatch.setattr(pbc_client, "iter_article_urls", lambda max_pages=15: iter(["a", "b"]))
+    monkeypatch.setattr(pbc_client, "iter_article_urls", lambda max_pages=15, target_date=None: iter(["a", "b"]))
     monkeypatch.setattr(pbc_client, "parse_article", lambda url: ("2025-01-01", None))
     monkeypatch.setattr(pbc_client, "probe_keychart", lambda date: Decimal("7.1879"))
 
@@ -95,3 +95,71 @@ def test_safe_get_fallback(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
     assert calls[0]["method"] == "POST"
     assert calls[1]["method"] == "GET"
     assert calls[1]["params"] == {"startDate": "2025-01-01", "endDate": "2025-01-11"}
+
+
+def test_safe_reuses_portal_response_within_month(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    html = """
+    <html>
+      <body>
+        <table id='InfoTable'>
+          <tr><th>日期</th><th>美元</th></tr>
+          <tr><td>2025-02-04</td><td>710.12</td></tr>
+        </table>
+      </body>
+    </html>
+    """
+
+    calls: list[str] = []
+
+    def fake_request(url: str, **_kwargs) -> SimpleNamespace:
+        calls.append(url)
+        return SimpleNamespace(text=html)
+
+    monkeypatch.setattr(pbc_client, "_request", fake_request)
+    monkeypatch.setenv("SAFE_SNAPSHOT_DIR", str(tmp_path))
+
+    first = safe_provider.get_usd_cny_midpoint_from_portal(None, "2025-02-03")
+    second = safe_provider.get_usd_cny_midpoint_from_portal(None, "2025-02-10")
+
+    # Given both dates share the February window, Then the portal is queried once.
+    assert first == second == (Decimal("7.1012"), "2025-02-04", "safe_portal")
+    assert len(calls) == 1
+
+
+def test_safe_skips_reparse_of_identical_portal_html(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    html = """
+    <html>
+      <body>
+        <table id='InfoTable'>
+          <tr><th>日期</th><th>美元</th></tr>
+          <tr><td>2025-02-04</td><td>710.12</td></tr>
+        </table>
+      </body>
+    </html>
+    """
+
+    calls: list[str] = []
+    parses: list[str] = []
+    real_parse = safe_provider._parse_window_rates
+
+    def fake_request(url: str, **_kwargs) -> SimpleNamespace:
+        calls.append(url)
+        return SimpleNamespace(text=html)
+
+    def counting_parse(body: str):
+        parses.append(body)
+        return real_parse(body)
+
+    monkeypatch.setattr(pbc_client, "_request", fake_request)
+    monkeypatch.setattr(safe_provider, "_parse_window_rates", counting_parse)
+    monkeypatch.setattr(safe_provider, "PORTAL_CACHE_TTL_SECONDS", 0)
+    monkeypatch.setenv("SAFE_SNAPSHOT_DIR", str(tmp_path))
+
+    # Given the window cache has expired, When the portal returns the same page again
+    first = safe_provider.get_usd_cny_midpoint_from_portal(None, "2025-02-03")
+    second = safe_provider.get_usd_cny_midpoint_from_portal(None, "2025-02-10")
+
+    # Then it is fetched twice but parsed once
+    assert first == second
+    assert len(calls) == 2
+    assert len(parses) == 1
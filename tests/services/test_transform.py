@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import datetime as dt
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook, load_workbook
+
+from autoflow.services.transform import transformer
+
+CELLS = {
+    "B2": "$profile.name",
+    "B3": "today",
+    "B4": "sum:金额",
+    "B5": "first:名称",
+    "B6": " sum:金额",
+    "B7": "sum:缺失",
+    "B8": "first:缺失",
+    "B9": 12,
+    "B10": "$profile.meta.k",
+    "B11": "$profile.meta.z",
+    "B12": " 文本 ",
+}
+
+
+@pytest.fixture()
+def source(tmp_path: Path) -> pd.DataFrame:
+    frame = pd.DataFrame({"金额": [1, "x", 3.5, None], "名称": [None, "甲", "乙", None]})
+    frame.to_excel(tmp_path / "in.xlsx", index=False)
+    return pd.read_excel(tmp_path / "in.xlsx")
+
+
+@pytest.fixture()
+def profile() -> SimpleNamespace:
+    return SimpleNamespace(name="acme", meta={"k": "v"})
+
+
+def _write_mapping(path: Path, cells: dict[str, object]) -> None:
+    lines = ["cells:"]
+    for cell, expr in cells.items():
+        lines.append(f"  {cell}: {expr!r}" if isinstance(expr, str) else f"  {cell}: {expr}")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def _bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def _run(tmp_path: Path, profile: SimpleNamespace) -> dict[str, object]:
+    output = transformer.transform(
+        tmp_path / "in.xlsx",
+        tmp_path / "map.yaml",
+        tmp_path / "template.xlsx",
+        tmp_path / "out",
+        tmp_path / "tmp",
+        profile,
+    )
+    ws = load_workbook(output).active
+    return {cell.coordinate: cell.value for row in ws.iter_rows() for cell in row}
+
+
+def test_transform_resolves_mapping_expressions(tmp_path, source, profile) -> None:
+    _write_mapping(tmp_path / "map.yaml", CELLS)
+
+    values = _run(tmp_path, profile)
+
+    assert values["B2"] == "acme"
+    assert values["B3"] == dt.date.today().isoformat()
+    assert values["B4"] == pytest.approx(4.5)
+    assert values["B5"] == "甲"
+    assert values["B6"] == pytest.approx(4.5)
+    assert values["B7"] == 0
+    assert values["B8"] is None
+    assert values["B9"] == 12
+    assert values["B10"] == "v"
+    assert values["B11"] is None
+    assert values["B12"] == "文本"
+    assert (tmp_path / "tmp" / "acme_intermediate.xlsx").exists()
+
+
+def _reference_value(expr: object, df: pd.DataFrame, profile: object) -> object:
+    """Cell evaluation as written before the resolvers were compiled."""
+
+    if expr is None or isinstance(expr, (int, float)):
+        return expr
+    if not isinstance(expr, str):
+        return str(expr)
+    s = expr.strip()
+    if s.lower() == "today":
+        return dt.date.today().isoformat()
+    if s.startswith("sum:"):
+        col = s[4:]
+        return float(pd.to_numeric(df[col], errors="coerce").fillna(0).sum()) if col in df else 0
+    if s.startswith("first:"):
+        col = s[6:]
+        if col not in df:
+            return None
+        ser = df[col].dropna()
+        return None if ser.empty else ser.iloc[0]
+    if s.startswith("$profile."):
+        cur = profile
+        for part in s[len("$profile.") :].split("."):
+            if hasattr(cur, part):
+                cur = getattr(cur, part)
+            elif isinstance(cur, dict) and part in cur:
+                cur = cur[part]
+            else:
+                return None
+        return cur
+    return s
+
+
+def test_transform_matches_pre_compiled_writer(tmp_path, source, profile) -> None:
+    _write_mapping(tmp_path / "map.yaml", CELLS)
+
+    values = _run(tmp_path, profile)
+
+    expected = {cell: _reference_value(expr, source, profile) for cell, expr in CELLS.items()}
+    assert {cell: values[cell] for cell in CELLS} == expected
+
+
+def test_transform_picks_up_edited_mapping_and_template(tmp_path, source, profile) -> None:
+    _write_mapping(tmp_path / "map.yaml", {"B2": "$profile.name"})
+    assert _run(tmp_path, profile)["B2"] == "acme"
+
+    _write_mapping(tmp_path / "map.yaml", {"B2": "first:名称"})
+    _bump_mtime(tmp_path / "map.yaml")
+    wb = Workbook()
+    wb.active["A1"] = "新模板"
+    wb.save(tmp_path / "template.xlsx")
+    _bump_mtime(tmp_path / "template.xlsx")
+
+    values = _run(tmp_path, profile)
+
+    assert values["B2"] == "甲"
+    assert values["A1"] == "新模板"
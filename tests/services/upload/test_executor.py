@@ -148,3 +148,49 @@ def test_executor_redacts_paths(tmp_path, drive_selectors):
     reason = report["failed"][0]["reason"]
     assert str(upload_file) not in reason
     assert "***.xlsx" in reason
+
+
+def test_executor_parallel_batch_keeps_input_order(monkeypatch, tmp_path, drive_selectors):
+    import threading
+
+    flow = StubFlow(tmp_path)
+    names = [f"file{idx}.xlsx" for idx in range(6)]
+    files = []
+    for name in names:
+        path = tmp_path / name
+        path.write_text("demo")
+        files.append(UploadWorkItem(path))
+
+    created: list[int] = []
+    closed: list[int] = []
+
+    class ThreadUploader:
+        def __init__(self):
+            created.append(threading.get_ident())
+
+        def close(self):
+            closed.append(threading.get_ident())
+
+        def upload(self, *, file_path, **_kwargs):
+            if file_path.name == "file3.xlsx":
+                raise UploadFlowError("denied", result=None)
+            return _result(status="uploaded", path="企业盘/财务", requested=file_path.name, final=file_path.name)
+
+    executor = DriveUploadExecutor(
+        flow,
+        drive_selectors,
+        uploader=DummyUploader([]),
+        max_retries=0,
+        max_concurrency=3,
+        uploader_factory=ThreadUploader,
+    )
+
+    # Given three workers, When the batch runs, Then each thread owns one uploader
+    report = executor.run_batch(dest_path="企业盘/财务", files=files)
+
+    assert len(created) == len(set(created)) <= 3
+    # And the report lists files in input order regardless of completion order
+    assert [entry["requested"] for entry in report["success"]] == [n for n in names if n != "file3.xlsx"]
+    assert [entry["name"] for entry in report["failed"]] == ["file3.xlsx"]
+    # And every uploader is closed on the thread that created it
+    assert sorted(closed) == sorted(created)
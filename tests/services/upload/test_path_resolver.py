@@ -8,6 +8,7 @@ from autoflow.services.upload.path_resolver import (
     PathResolver,
     PathResolverError,
     PathValidationError,
+    _get_timeout_error,
 )
 
 
@@ -90,3 +91,73 @@ def test_resolve_create_folder_failure(monkeypatch, resolver):
 
     with pytest.raises(PathResolverError):
         resolver.resolve("企业盘/只读", create_missing=True)
+
+
+def test_workspace_frame_cached_until_navigation(resolver):
+    # Given a page whose workspace iframe resolves on the first candidate
+    resolver.page.url = "https://drive.example/space"
+    frame = resolver.page.frame_locator.return_value
+
+    # When the frame is requested twice on the same URL
+    first = resolver.workspace_frame()
+    second = resolver.workspace_frame()
+
+    # Then the attach wait runs once and the cached locator is reused
+    assert first is second is frame
+    assert frame.locator.return_value.wait_for.call_count == 1
+
+    # When the page navigates, the frame is located again
+    resolver.page.url = "https://drive.example/other"
+    resolver.workspace_frame()
+    assert frame.locator.return_value.wait_for.call_count == 2
+
+
+def test_enter_existing_folder_skips_absent_candidates(resolver):
+    # Given a frame where only the last row fallback matches anything
+    missing = MagicMock()
+    missing.count.return_value = 0
+    missing.first.wait_for.side_effect = _get_timeout_error()("absent")
+    present = MagicMock()
+    present.count.return_value = 1
+    frame = MagicMock()
+    frame.get_by_role.side_effect = lambda role, **_: present if role == "link" else missing
+
+    # When the folder is entered
+    entered = resolver._enter_existing_folder(frame, "财务部")
+
+    # Then only the present candidate is clicked
+    assert entered is True
+    missing.click.assert_not_called()
+    present.click.assert_called_once_with(timeout=resolver.timeout_ms)
+
+
+def test_enter_existing_folder_tries_last_matching_spec_first(resolver):
+    # Given a frame where only the "link" row fallback matches
+    missing = MagicMock()
+    missing.count.return_value = 0
+    missing.first.wait_for.side_effect = _get_timeout_error()("absent")
+    present = MagicMock()
+    present.count.return_value = 1
+    frame = MagicMock()
+    frame.get_by_role.side_effect = lambda role, **_: present if role == "link" else missing
+    assert resolver._enter_existing_folder(frame, "财务部") is True
+    frame.get_by_role.reset_mock()
+
+    # When the next folder is entered
+    assert resolver._enter_existing_folder(frame, "报表室") is True
+
+    # Then the previously winning spec is tried before the others
+    assert frame.get_by_role.call_count == 1
+    assert frame.get_by_role.call_args.args[0] == "link"
+
+
+def test_select_space_skips_clicks_when_already_in_space(resolver):
+    # Given the page is already on the enterprise drive URL
+    resolver.page.url = "https://drive.example/client/file/org?id=1"
+    space = resolver._match_space("企业盘")
+
+    # When the space is selected
+    resolver._select_space("企业盘", space)
+
+    # Then no anchor locator is built or clicked
+    resolver.page.get_by_role.assert_not_called()
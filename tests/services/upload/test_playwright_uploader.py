@@ -6,6 +6,7 @@ import zipfile
 import pytest
 
 from autoflow.config import load_drive_upload_selectors
+from autoflow.services.upload.path_resolver import PathNotFoundError
 from autoflow.services.upload.playwright_uploader import (
     ConflictResolution,
     PlaywrightUploader,
@@ -32,6 +33,9 @@ class DummyFlow:
     def ensure_ready(self):
         return self._page
 
+    def ensure_tracing(self):
+        return self._page.context
+
 
 def _stub_page():
     page = MagicMock()
@@ -65,7 +69,7 @@ def test_upload_skip_when_conflict_detected(monkeypatch, tmp_path, drive_selecto
     monkeypatch.setattr(PlaywrightUploader, "_file_exists", lambda self, frame, name: True)
     called = {"perform": False}
 
-    def _fail_perform(self, frame, file_path):
+    def _fail_perform(self, page, frame, file_path):
         called["perform"] = True
         return True
 
@@ -103,7 +107,7 @@ def test_upload_success(monkeypatch, tmp_path, drive_selectors):
 
     monkeypatch.setattr("autoflow.services.upload.playwright_uploader.PathResolver", FakeResolver)
     monkeypatch.setattr(PlaywrightUploader, "_file_exists", lambda self, frame, name: False)
-    monkeypatch.setattr(PlaywrightUploader, "_perform_upload", lambda self, frame, file_path: True)
+    monkeypatch.setattr(PlaywrightUploader, "_perform_upload", lambda self, page, frame, file_path: True)
     monkeypatch.setattr(
         PlaywrightUploader,
         "_handle_conflict_dialog",
@@ -153,7 +157,7 @@ def test_upload_conflict_rename(monkeypatch, tmp_path, drive_selectors):
 
     monkeypatch.setattr("autoflow.services.upload.playwright_uploader.PathResolver", FakeResolver)
     monkeypatch.setattr(PlaywrightUploader, "_file_exists", lambda self, frame, name: False)
-    monkeypatch.setattr(PlaywrightUploader, "_perform_upload", lambda self, frame, file_path: True)
+    monkeypatch.setattr(PlaywrightUploader, "_perform_upload", lambda self, page, frame, file_path: True)
     monkeypatch.setattr(
         PlaywrightUploader,
         "_handle_conflict_dialog",
@@ -198,7 +202,7 @@ def test_upload_failure_raises(monkeypatch, tmp_path, drive_selectors):
 
     monkeypatch.setattr("autoflow.services.upload.playwright_uploader.PathResolver", FakeResolver)
     monkeypatch.setattr(PlaywrightUploader, "_file_exists", lambda self, frame, name: False)
-    monkeypatch.setattr(PlaywrightUploader, "_perform_upload", lambda self, frame, file_path: False)
+    monkeypatch.setattr(PlaywrightUploader, "_perform_upload", lambda self, page, frame, file_path: False)
     screenshot_path = flow.screenshots_dir / "failed.png"
     trace_path = flow.trace_dir / "trace.zip"
     trace_path.parent.mkdir(parents=True, exist_ok=True)
@@ -245,7 +249,7 @@ def test_upload_toast_timeout(monkeypatch, tmp_path, drive_selectors):
 
     monkeypatch.setattr("autoflow.services.upload.playwright_uploader.PathResolver", FakeResolver)
     monkeypatch.setattr(PlaywrightUploader, "_file_exists", lambda self, frame, name: False)
-    monkeypatch.setattr(PlaywrightUploader, "_perform_upload", lambda self, frame, file_path: True)
+    monkeypatch.setattr(PlaywrightUploader, "_perform_upload", lambda self, page, frame, file_path: True)
     monkeypatch.setattr(
         PlaywrightUploader,
         "_handle_conflict_dialog",
@@ -290,7 +294,7 @@ def test_upload_refresh_missing(monkeypatch, tmp_path, drive_selectors):
 
     monkeypatch.setattr("autoflow.services.upload.playwright_uploader.PathResolver", FakeResolver)
     monkeypatch.setattr(PlaywrightUploader, "_file_exists", lambda self, frame, name: False)
-    monkeypatch.setattr(PlaywrightUploader, "_perform_upload", lambda self, frame, file_path: True)
+    monkeypatch.setattr(PlaywrightUploader, "_perform_upload", lambda self, page, frame, file_path: True)
     monkeypatch.setattr(
         PlaywrightUploader,
         "_handle_conflict_dialog",
@@ -337,3 +341,293 @@ def test_download_results_saves_file(monkeypatch, tmp_path, drive_selectors):
     assert target is not None
     download.save_as.assert_called_once()
     assert target.parent == flow.downloads_dir
+
+
+def test_wait_for_toasts_single_wait_detects_failure(tmp_path, drive_selectors):
+    # Given a page where only the "网络异常" failure toast is shown
+    page = _stub_page()
+    uploader = PlaywrightUploader(DummyFlow(page, tmp_path), drive_selectors)
+    toasts = {}
+
+    def _get_by_text(pattern):
+        locator = toasts.setdefault(pattern.pattern, MagicMock(name=pattern.pattern))
+        locator.first.is_visible.return_value = pattern.pattern == "网络异常"
+        return locator
+
+    page.get_by_text.side_effect = _get_by_text
+
+    # When waiting for the upload toast
+    with pytest.raises(UploadFlowError, match="网络异常"):
+        uploader._wait_for_toasts(page)
+
+    # Then the union of all toast locators was waited on exactly once
+    union = toasts["上传失败"].or_.return_value
+    while union.or_.called:
+        union = union.or_.return_value
+    union.first.wait_for.assert_called_once_with(state="visible", timeout=uploader.toast_timeout_ms)
+    page.wait_for_timeout.assert_not_called()
+
+
+def test_upload_reuses_resolved_path_for_same_destination(monkeypatch, tmp_path, drive_selectors):
+    # Given an uploader whose target files already exist (skip strategy)
+    page = _stub_page()
+    page.url = "https://drive.example/client/file/org"
+    flow = DummyFlow(page, tmp_path)
+    uploader = PlaywrightUploader(flow, drive_selectors)
+    created = []
+    resolved = []
+
+    class FakeResolver:
+        def __init__(self, *args, **kwargs):
+            created.append(self)
+
+        def resolve(self, path, create_missing=False):
+            resolved.append(path)
+
+        def workspace_frame(self):
+            return MagicMock()
+
+    monkeypatch.setattr("autoflow.services.upload.playwright_uploader.PathResolver", FakeResolver)
+    monkeypatch.setattr(PlaywrightUploader, "_file_exists", lambda self, frame, name: True)
+    monkeypatch.setattr(PlaywrightUploader, "_capture_screenshot", lambda self, page, label: None)
+    monkeypatch.setattr(PlaywrightUploader, "_start_trace", lambda self, page: TraceSession(False, None))
+
+    # When two files go to the same path and a third after the page navigated
+    for name in ("a.xlsx", "b.xlsx"):
+        file_path = tmp_path / name
+        file_path.write_text("demo")
+        uploader.upload(path="企业盘/财务", file_path=file_path, conflict_strategy="skip")
+    page.url = "https://drive.example/elsewhere"
+    uploader.upload(path="企业盘/财务", file_path=tmp_path / "a.xlsx", conflict_strategy="skip")
+
+    # Then the path is resolved once per page location
+    assert len(created) == 2
+
+    for path in ("企业盘/市场", "企业盘/财务"):
+        uploader.upload(path=path, file_path=tmp_path / "a.xlsx", conflict_strategy="skip")
+
+    assert resolved == ["企业盘/财务", "企业盘/财务", "企业盘/市场", "企业盘/财务"]
+
+
+def test_upload_many_selects_all_files_at_once(monkeypatch, tmp_path, drive_selectors):
+    # Given a workspace whose file input accepts multiple files
+    page = _stub_page()
+    flow = DummyFlow(page, tmp_path)
+    uploader = PlaywrightUploader(flow, drive_selectors)
+    frame = MagicMock()
+    multi_input = frame.locator.return_value.first
+    multi_input.get_attribute.return_value = ""
+
+    class FakeResolver:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def resolve(self, path, create_missing=False):
+            return None
+
+        def workspace_frame(self):
+            return frame
+
+    monkeypatch.setattr("autoflow.services.upload.playwright_uploader.PathResolver", FakeResolver)
+    monkeypatch.setattr(PlaywrightUploader, "_file_exists", lambda self, frame, name: name == "old.xlsx")
+    monkeypatch.setattr(PlaywrightUploader, "_wait_for_locator", lambda self, *args, **kwargs: None)
+    monkeypatch.setattr(PlaywrightUploader, "_wait_for_toasts", lambda self, page: None)
+    monkeypatch.setattr(PlaywrightUploader, "_await_listing", lambda self, page, frame, expected, base: expected)
+    monkeypatch.setattr(PlaywrightUploader, "_reload_and_verify", lambda self, page, path, expected: (frame, expected))
+    monkeypatch.setattr(PlaywrightUploader, "_capture_screenshot", lambda self, page, label: None)
+    monkeypatch.setattr(PlaywrightUploader, "_start_trace", lambda self, page: TraceSession(False, None))
+    files = []
+    for name in ("a.xlsx", "old.xlsx", "b.xlsx"):
+        files.append(tmp_path / name)
+        files[-1].write_text("demo")
+
+    # When the files are uploaded as one batch with the skip strategy
+    results = uploader.upload_many(path="企业盘/财务", file_paths=files, conflict_strategy="skip")
+
+    # Then new files go through one set_input_files call and existing ones are skipped
+    multi_input.set_input_files.assert_called_once_with([str(files[0]), str(files[2])])
+    assert [result.status for result in results] == ["uploaded", "skipped", "uploaded"]
+    assert [result.final_name for result in results] == ["a.xlsx", "old.xlsx", "b.xlsx"]
+
+
+def _batch_uploader(monkeypatch, tmp_path, drive_selectors, dialog_texts):
+    page = _stub_page()
+    uploader = PlaywrightUploader(DummyFlow(page, tmp_path), drive_selectors)
+    frame = MagicMock()
+    multi_input = frame.locator.return_value.first
+    multi_input.get_attribute.return_value = ""
+
+    class FakeResolver:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def resolve(self, path, create_missing=False):
+            return None
+
+        def workspace_frame(self):
+            return frame
+
+    dialogs = []
+    for text in dialog_texts:
+        dialog = MagicMock()
+        dialog.first.inner_text.return_value = text
+        dialogs.append(dialog)
+    dialogs.append(None)
+    monkeypatch.setattr("autoflow.services.upload.playwright_uploader.PathResolver", FakeResolver)
+    monkeypatch.setattr(PlaywrightUploader, "_file_exists", lambda self, frame, name: False)
+    monkeypatch.setattr(PlaywrightUploader, "_wait_for_locator", lambda self, *args, **kwargs: dialogs.pop(0))
+    monkeypatch.setattr(
+        PlaywrightUploader,
+        "_handle_conflict_dialog",
+        lambda self, page, strategy, requested_name: ConflictResolution("skipped", strategy, requested_name),
+    )
+    monkeypatch.setattr(PlaywrightUploader, "_wait_for_toasts", lambda self, page: None)
+    monkeypatch.setattr(PlaywrightUploader, "_await_listing", lambda self, page, frame, expected, base: expected)
+    monkeypatch.setattr(PlaywrightUploader, "_reload_and_verify", lambda self, page, path, expected: (frame, expected))
+    monkeypatch.setattr(PlaywrightUploader, "_capture_screenshot", lambda self, page, label: None)
+    monkeypatch.setattr(PlaywrightUploader, "_start_trace", lambda self, page: TraceSession(False, None))
+    files = []
+    for name in ("a.xlsx", "data.xlsx"):
+        files.append(tmp_path / name)
+        files[-1].write_text("demo")
+    return uploader, files
+
+
+def test_upload_many_marks_file_named_in_skip_dialog_as_skipped(monkeypatch, tmp_path, drive_selectors):
+    uploader, files = _batch_uploader(monkeypatch, tmp_path, drive_selectors, ["data.xlsx 已存在"])
+
+    results = uploader.upload_many(path="企业盘/财务", file_paths=files, conflict_strategy="skip")
+
+    assert [result.status for result in results] == ["uploaded", "skipped"]
+
+
+def test_upload_many_falls_back_when_skip_dialog_names_no_file(monkeypatch, tmp_path, drive_selectors):
+    uploader, files = _batch_uploader(monkeypatch, tmp_path, drive_selectors, ["文件已存在"])
+    retried = []
+
+    def fake_upload(self, *, path, file_path, **kwargs):
+        retried.append(file_path)
+        return SimpleNamespace(status="skipped", requested_name=file_path.name)
+
+    monkeypatch.setattr(PlaywrightUploader, "upload", fake_upload)
+
+    results = uploader.upload_many(path="企业盘/财务", file_paths=files, conflict_strategy="skip")
+
+    assert retried == files
+    assert [result.status for result in results] == ["skipped", "skipped"]
+
+
+def test_upload_many_wraps_path_resolution_failure(monkeypatch, tmp_path, drive_selectors):
+    page = _stub_page()
+    flow = DummyFlow(page, tmp_path)
+    uploader = PlaywrightUploader(flow, drive_selectors)
+    shots = []
+
+    class FailingResolver:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def resolve(self, path, create_missing=False):
+            raise PathNotFoundError(f"missing {path}")
+
+    monkeypatch.setattr("autoflow.services.upload.playwright_uploader.PathResolver", FailingResolver)
+    monkeypatch.setattr(PlaywrightUploader, "_capture_screenshot", lambda self, page, label: shots.append(label))
+    monkeypatch.setattr(PlaywrightUploader, "_start_trace", lambda self, page: TraceSession(False, None))
+
+    with pytest.raises(UploadFlowError) as excinfo:
+        uploader.upload_many(path="企业盘/缺失", file_paths=[tmp_path / "a.xlsx", tmp_path / "b.xlsx"])
+
+    assert isinstance(excinfo.value.__cause__, PathNotFoundError)
+    assert excinfo.value.result.status == "failed"
+    assert shots == ["failed"]
+
+
+def test_console_capture_formats_messages_off_listener(tmp_path, drive_selectors):
+    # Given a page that records its console listener
+    page = _stub_page()
+    flow = DummyFlow(page, tmp_path)
+    flow.console_dir = tmp_path / "console"
+    flow.console_dir.mkdir()
+    uploader = PlaywrightUploader(flow, drive_selectors)
+    state = uploader._start_console_capture(page)
+    listener = page.on.call_args.args[1]
+
+    # When console messages arrive and capture is finalized
+    listener(SimpleNamespace(type="error", text="order 123456 failed\nretry"))
+    listener(SimpleNamespace(type="log", text="ok"))
+    log_path = uploader._finalize_console_capture(page, state)
+
+    # Then the drained entries are sanitized and persisted in order
+    lines = log_path.read_text(encoding="utf-8").splitlines()
+    assert [line.split("] ", 1)[1] for line in lines] == ["error: order *** failed retry", "log: ok"]
+    assert not state.worker.is_alive()
+
+
+def test_console_capture_not_written_when_discarded(tmp_path, drive_selectors):
+    # Given a console capture that received a message
+    page = _stub_page()
+    flow = DummyFlow(page, tmp_path)
+    flow.console_dir = tmp_path / "console"
+    flow.console_dir.mkdir()
+    uploader = PlaywrightUploader(flow, drive_selectors)
+    state = uploader._start_console_capture(page)
+    page.on.call_args.args[1](SimpleNamespace(type="log", text="ok"))
+
+    # When the capture is finalized without persisting
+    log_path = uploader._finalize_console_capture(page, state, persist=False)
+
+    # Then no log file is ever created
+    assert log_path is None
+    assert list(flow.console_dir.iterdir()) == []
+
+
+def test_trace_chunk_per_upload_discarded_on_success(monkeypatch, tmp_path, drive_selectors):
+    # Given successful (skipped) uploads with real trace handling
+    page = _stub_page()
+    flow = DummyFlow(page, tmp_path)
+    uploader = PlaywrightUploader(flow, drive_selectors)
+
+    class FakeResolver:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def resolve(self, path, create_missing=False):
+            return None
+
+        def workspace_frame(self):
+            return MagicMock()
+
+    monkeypatch.setattr("autoflow.services.upload.playwright_uploader.PathResolver", FakeResolver)
+    monkeypatch.setattr(PlaywrightUploader, "_file_exists", lambda self, frame, name: True)
+    monkeypatch.setattr(PlaywrightUploader, "_capture_screenshot", lambda self, page, label: None)
+    file_path = tmp_path / "a.xlsx"
+    file_path.write_text("demo")
+
+    # When two uploads run on the same context
+    for _ in range(2):
+        result = uploader.upload(path="企业盘/财务", file_path=file_path, conflict_strategy="skip")
+
+    # Then each upload records a chunk on the flow's trace and discards it
+    tracing = page.context.tracing
+    tracing.start.assert_not_called()
+    assert tracing.start_chunk.call_count == 2
+    assert tracing.stop_chunk.call_args_list == [((),), ((),)]
+    tracing.stop.assert_not_called()
+    assert result.trace is None
+
+
+def test_file_exists_remembers_found_names_per_frame(tmp_path, drive_selectors):
+    # Given a frame where the row lookup finds the file
+    uploader = PlaywrightUploader(DummyFlow(_stub_page(), tmp_path), drive_selectors)
+    frame = MagicMock()
+    frame.get_by_role.return_value.count.return_value = 1
+
+    # When the same name is checked twice, then on a new frame
+    assert uploader._file_exists(frame, "a.xlsx")
+    assert uploader._file_exists(frame, "a.xlsx")
+    other = MagicMock()
+    other.get_by_role.return_value.count.return_value = 0
+
+    # Then the DOM is queried once for the first frame and the cache resets for the new one
+    assert frame.get_by_role.return_value.count.call_count == 1
+    assert not uploader._file_exists(other, "a.xlsx")
@@ -3,9 +3,12 @@
 # Module responsibilities:
 # - Validate happy path writing with automatic pagination.
 # - Assert defensive behaviour when required columns are missing.
+# - Cover the write-only streaming path that bypasses the template.
+# - Check cached mapping YAML is re-read after the file changes.
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pandas as pd
@@ -91,3 +94,56 @@ def test_mapping_raises_for_missing_columns(tmp_path: Path) -> None:
 
     with pytest.raises(MappingError):
         mapping.map(df, target)
+
+
+def test_write_fixed_write_only_streams_rows(tmp_path: Path) -> None:
+    source = pd.DataFrame(
+        [
+            {"项目名称": "服务费", "数量": 1, "金额(USD)": 1200},
+            {"项目名称": "备件", "数量": 2, "金额(USD)": 800},
+        ]
+    )
+    mapping_path = tmp_path / "mapping.yaml"
+    _write_mapping(mapping_path, max_rows=5)
+    mapping_path.write_text(
+        mapping_path.read_text(encoding="utf-8") + "write_only: true\n", encoding="utf-8"
+    )
+    mapping = FixedMapping.from_yaml(mapping_path)
+
+    outputs = write_fixed(
+        source, tmp_path / "missing_template.xlsx", mapping, tmp_path / "invoice.xlsx"
+    )
+
+    from openpyxl import load_workbook
+
+    ws = load_workbook(outputs[0])["Invoice"]
+    assert [ws.cell(row=9, column=idx).value for idx in (1, 2, 3)] == ["项目名称", "数量", "金额(USD)"]
+    assert ws["A10"].value == "服务费"
+    assert ws["C11"].value == 800
+    assert ws.max_row == 11
+
+
+@pytest.mark.parametrize("value", ['"false"', "'no'", "0"])
+def test_from_yaml_rejects_non_bool_write_only(tmp_path: Path, value: str) -> None:
+    # Given a mapping whose write_only is a string or number rather than a YAML boolean
+    mapping_path = tmp_path / "mapping.yaml"
+    _write_mapping(mapping_path)
+    mapping_path.write_text(
+        mapping_path.read_text(encoding="utf-8") + f"write_only: {value}\n", encoding="utf-8"
+    )
+
+    # When it is loaded, Then it is rejected instead of being read as true
+    with pytest.raises(MappingError, match="write_only"):
+        FixedMapping.from_yaml(mapping_path)
+
+
+def test_from_yaml_rereads_changed_file(tmp_path: Path) -> None:
+    mapping_path = tmp_path / "mapping.yaml"
+    first = _write_mapping(mapping_path, max_rows=2)
+    assert FixedMapping.from_yaml(mapping_path) == first
+
+    _write_mapping(mapping_path, max_rows=7)
+    stat = mapping_path.stat()
+    os.utime(mapping_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert FixedMapping.from_yaml(mapping_path).max_rows_per_sheet == 7